@@ -4,12 +4,18 @@ Logging configuration models.
 Provides configuration classes for logging setup.
 """
 
-from enum import Enum
+from enum import UNIQUE, Enum, verify
 from pydantic import BaseModel
 
 
+@verify(UNIQUE)
 class LogFormat(str, Enum):
-    """Logging format enumeration."""
+    """
+    Logging format enumeration.
+
+    Members are unique singletons, so callers compare with ``is`` rather
+    than going through ``str.__eq__``.
+    """
 
     TEXT = "text"
     JSON = "json"
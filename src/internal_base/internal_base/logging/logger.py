@@ -75,7 +75,7 @@ def configure_logging(logger_settings: Optional[LoggingConfig] = None) -> None:
     handler.setLevel(numeric_level)
 
     # Set formatter based on format
-    if logger_settings.format == LogFormat.JSON:
+    if logger_settings.format is LogFormat.JSON:
         formatter = jsonlogger.JsonFormatter(
             "%(asctime)s %(name)s %(levelname)s %(message)s"
         )
@@ -88,7 +88,7 @@ def configure_logging(logger_settings: Optional[LoggingConfig] = None) -> None:
     root_logger.addHandler(handler)
 
     # Install coloredlogs for text format
-    if logger_settings.format == LogFormat.TEXT:
+    if logger_settings.format is LogFormat.TEXT:
         coloredlogs.install(
             level=numeric_level,
             fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -14,6 +14,13 @@ from .protocol import ServiceState
 
 logger = logging.getLogger(__name__)
 
+# States from which a service may be started or stopped
+_START_FROM = frozenset({ServiceState.IDLE, ServiceState.STOPPED})
+_STOP_FROM = frozenset({ServiceState.RUNNING})
+
+# States in which stop() has nothing to do
+_NOT_RUNNING = frozenset({ServiceState.IDLE, ServiceState.STOPPED})
+
 
 class AsyncService(ABC):
     """
@@ -79,26 +86,33 @@ class AsyncService(ABC):
         Raises:
             RuntimeError: If service is already running
         """
+        # Fast path: skip the lock when already running, re-checked below
+        if self._state is ServiceState.RUNNING:
+            logger.warning("Service '%s' is already running", self._name)
+            return
+
         async with self._start_lock:
-            if self._state == ServiceState.RUNNING:
-                logger.warning(f"Service '{self._name}' is already running")
+            # Read through the property: the state may have changed while
+            # waiting for the lock, which narrowing on _state would hide
+            if self.state is ServiceState.RUNNING:
+                logger.warning("Service '%s' is already running", self._name)
                 return
 
-            if self._state not in (ServiceState.IDLE, ServiceState.STOPPED):
+            if self._state not in _START_FROM:
                 raise RuntimeError(
                     f"Cannot start service '{self._name}' in state {self._state}"
                 )
 
-            logger.info(f"Starting service '{self._name}'...")
+            logger.info("Starting service '%s'...", self._name)
             self._state = ServiceState.STARTING
 
             try:
                 await self._start()
                 self._state = ServiceState.RUNNING
-                logger.info(f"Service '{self._name}' started successfully")
+                logger.info("Service '%s' started successfully", self._name)
             except Exception as e:
                 self._state = ServiceState.FAILED
-                logger.error(f"Failed to start service '{self._name}': {e}")
+                logger.error("Failed to start service '%s': %s", self._name, e)
                 raise
 
     async def stop(self) -> None:
@@ -108,26 +122,31 @@ class AsyncService(ABC):
         Raises:
             RuntimeError: If service is not running
         """
+        # Fast path: skip the lock when not running, re-checked below
+        if self._state in _NOT_RUNNING:
+            logger.warning("Service '%s' is not running", self._name)
+            return
+
         async with self._stop_lock:
-            if self._state in (ServiceState.IDLE, ServiceState.STOPPED):
-                logger.warning(f"Service '{self._name}' is not running")
+            if self._state in _NOT_RUNNING:
+                logger.warning("Service '%s' is not running", self._name)
                 return
 
-            if self._state != ServiceState.RUNNING:
+            if self._state not in _STOP_FROM:
                 raise RuntimeError(
                     f"Cannot stop service '{self._name}' in state {self._state}"
                 )
 
-            logger.info(f"Stopping service '{self._name}'...")
+            logger.info("Stopping service '%s'...", self._name)
             self._state = ServiceState.STOPPING
 
             try:
                 await self._stop()
                 self._state = ServiceState.STOPPED
-                logger.info(f"Service '{self._name}' stopped successfully")
+                logger.info("Service '%s' stopped successfully", self._name)
             except Exception as e:
                 self._state = ServiceState.FAILED
-                logger.error(f"Failed to stop service '{self._name}': {e}")
+                logger.error("Failed to stop service '%s': %s", self._name, e)
                 raise
 
     async def is_healthy(self) -> bool:
@@ -137,13 +156,13 @@ class AsyncService(ABC):
         Returns:
             True if service is healthy and running
         """
-        if self._state != ServiceState.RUNNING:
+        if self._state is not ServiceState.RUNNING:
             return False
 
         try:
             return await self._health_check()
         except Exception as e:
-            logger.error(f"Health check failed for service '{self._name}': {e}")
+            logger.error("Health check failed for service '%s': %s", self._name, e)
             return False
 
     async def __aenter__(self) -> "AsyncService":
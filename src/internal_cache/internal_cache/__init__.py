@@ -1,16 +1,18 @@
 """Redis caching and distributed locking utilities."""
 
-from .client import RedisClient, RedisConfig
-from .decorators import cached, cache_aside
+from .client import JSONBytes, RedisClient, RedisConfig
+from .decorators import cached, cache_aside, cache_aside_batch
 from .locks import DistributedLock, with_lock
 
 __all__ = [
     # Client
     "RedisClient",
     "RedisConfig",
+    "JSONBytes",
     # Decorators
     "cached",
     "cache_aside",
+    "cache_aside_batch",
     # Locks
     "DistributedLock",
     "with_lock",
@@ -4,17 +4,108 @@ Redis client wrapper with async support.
 Provides high-level interface for Redis operations.
 """
 
-import json
+import asyncio
 import logging
-from typing import Any, Optional, Union
+import weakref
+from functools import wraps
+from typing import Any, Callable, Optional, Union
 from dataclasses import dataclass
 
-import redis.asyncio as redis
-from redis.asyncio import Redis
+import orjson
+from redis.asyncio import ConnectionPool, Redis
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None  # type: ignore[assignment]
 
 
 logger = logging.getLogger(__name__)
 
+# Allow dicts with int/float/etc. keys, matching the stdlib json behaviour
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+# Header bytes tagging how a stored value was encoded. Plain strings, bytes
+# and numbers are stored untagged so they stay usable by raw Redis commands
+# (INCRBY, Lua scripts comparing values, other clients).
+_ZSTD_HEADER = b"\x01"  # zstd-compressed payload, itself tagged or untagged
+_JSON_HEADER = b"\x02"  # JSON document
+_BYTES_HEADER = b"\x03"  # Bytes that would otherwise start with a header byte
+_HEADERS = frozenset({_ZSTD_HEADER, _JSON_HEADER, _BYTES_HEADER})
+_STR_HEADERS = tuple(header.decode() for header in _HEADERS)
+
+# First bytes of untagged values that may be JSON (numbers, or documents,
+# null, true and false written before values were tagged). Plain strings
+# starting with one of them fall back to str when they fail to parse.
+_UNTAGGED_JSON_START = frozenset(b"-0123456789{[\"ntf")
+# Strings that would read back as JSON literals if stored untagged
+_JSON_LITERALS = frozenset({"null", "true", "false"})
+
+_compressor = zstandard.ZstdCompressor(level=3) if zstandard else None
+_decompressor = zstandard.ZstdDecompressor() if zstandard else None
+
+
+# Connection pools shared by clients with identical connection settings. Pools
+# are kept per event loop because asyncio connections cannot cross loops, and
+# each entry is [pool, number of users]. Users are connected clients and
+# callers of RedisClient.shared_pool() that have not released it yet.
+_PoolKey = tuple[Any, ...]
+_shared_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[_PoolKey, list[Any]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _logged_keys(args: tuple[Any, ...]) -> Any:
+    """Key(s) an operation was called with, leaving out values and payloads."""
+    if not args:
+        return ()
+    if isinstance(args[0], dict):
+        return list(args[0])
+    return args[0]
+
+
+def _swallow(default: Any) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Log and swallow errors raised by a client operation.
+
+    Cache operations degrade to a miss rather than failing the caller, so
+    every operation shares this single handler instead of its own
+    try/except block. Only the key(s) are logged, never the values.
+
+    Args:
+        default: Value returned on failure, or a callable receiving the
+            operation's arguments and returning it
+
+    Returns:
+        Decorator for async RedisClient methods
+    """
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(fn)
+        async def wrapper(self: "RedisClient", *args: Any, **kwargs: Any) -> Any:
+            try:
+                return await fn(self, *args, **kwargs)
+            except Exception as e:
+                logger.error("Redis %s %r failed: %s", fn.__name__, _logged_keys(args), e)
+                return default(self, *args, **kwargs) if callable(default) else default
+
+        return wrapper
+
+    return decorator
+
+
+class JSONBytes(bytes):
+    """
+    Already-serialized JSON payload.
+
+    Values of this type are stored as JSON documents without being
+    re-encoded, e.g. when passing through a response body that is JSON.
+
+    Example:
+        await client.set("user:123", JSONBytes(b'{"name": "John"}'))
+        await client.get("user:123")  # {"name": "John"}
+    """
+
 
 @dataclass
 class RedisConfig:
@@ -29,8 +120,11 @@ class RedisConfig:
     socket_timeout: float = 5.0
     socket_connect_timeout: float = 5.0
     max_connections: int = 50
-    decode_responses: bool = True
+    decode_responses: bool = False  # Values stay bytes and are parsed directly
     key_prefix: str = ""  # Global prefix for all keys
+    compress_threshold: Optional[int] = None  # Zstd-compress values larger than this (bytes)
+    protocol: int = 3  # RESP3 (Redis 6+), use 2 for older servers
+    health_check_interval: int = 30  # Seconds before an idle connection is re-checked
 
 
 class RedisClient:
@@ -38,9 +132,12 @@ class RedisClient:
     Async Redis client wrapper.
 
     Provides convenient methods for common Redis operations with
-    automatic JSON serialization and key prefixing.
+    automatic JSON serialization and key prefixing. Operations connect
+    lazily on first use, so calling ``connect()`` up front is optional.
     """
 
+    __slots__ = ("config", "_client", "_connect_lock", "_prefix", "_prefix_b", "_pool_key")
+
     def __init__(self, config: Optional[RedisConfig] = None):
         """
         Initialize Redis client.
@@ -61,51 +158,245 @@ class RedisClient:
             await client.set("user:123", {"name": "John"}, ttl=3600)
         """
         self.config = config or RedisConfig()
-        self._client: Optional[Redis] = None
+        self._client: "Optional[Redis[Any]]" = None
+        self._connect_lock = asyncio.Lock()
+        self._pool_key: Optional[_PoolKey] = None
+        self._prefix = self.config.key_prefix
+        self._prefix_b = self._prefix.encode()
+
+        if self.config.compress_threshold is not None:
+            if zstandard is None:
+                raise ImportError(
+                    "zstandard is required for value compression. "
+                    "Install it with: pip install internal-cache[zstd]"
+                )
+            if self.config.decode_responses:
+                raise ValueError("compress_threshold requires decode_responses=False")
+
+    @staticmethod
+    def _pool_key_for(config: RedisConfig) -> _PoolKey:
+        """Connection settings identifying the shared pool of a configuration."""
+        return (
+            config.host,
+            config.port,
+            config.db,
+            config.username,
+            config.password,
+            config.ssl,
+            config.socket_timeout,
+            config.socket_connect_timeout,
+            config.max_connections,
+            config.decode_responses,
+            config.protocol,
+            config.health_check_interval,
+        )
+
+    @classmethod
+    def _acquire_pool(cls, config: RedisConfig) -> tuple[_PoolKey, "ConnectionPool[Any]"]:
+        """Get (or create) the shared pool for a configuration and count one more user."""
+        pool_key = cls._pool_key_for(config)
+        pools = _shared_pools.setdefault(asyncio.get_running_loop(), {})
+        entry = pools.get(pool_key)
+
+        if entry is None:
+            scheme = "rediss" if config.ssl else "redis"
+            pool: "ConnectionPool[Any]" = ConnectionPool.from_url(
+                f"{scheme}://{config.host}:{config.port}/{config.db}",
+                password=config.password,
+                username=config.username,
+                socket_timeout=config.socket_timeout,
+                socket_connect_timeout=config.socket_connect_timeout,
+                max_connections=config.max_connections,
+                decode_responses=config.decode_responses,
+                protocol=config.protocol,
+                health_check_interval=config.health_check_interval,
+            )
+            entry = pools[pool_key] = [pool, 0]
+
+        entry[1] += 1
+        shared: "ConnectionPool[Any]" = entry[0]
+        return pool_key, shared
+
+    @staticmethod
+    async def _release_pool(pool_key: _PoolKey) -> None:
+        """Count one user less, disconnecting the shared pool once it has none."""
+        pools = _shared_pools.get(asyncio.get_running_loop(), {})
+        entry = pools.get(pool_key)
+        if entry is not None:
+            entry[1] -= 1
+            if entry[1] <= 0:
+                del pools[pool_key]
+                await entry[0].disconnect()
+
+    @classmethod
+    def shared_pool(cls, config: RedisConfig) -> "ConnectionPool[Any]":
+        """
+        Get the connection pool shared by clients with this configuration.
+
+        Pools are memoized per event loop and connection settings, and stay
+        open while used. Each call must be paired with
+        ``release_shared_pool()``.
+
+        Args:
+            config: Redis configuration
+
+        Returns:
+            Shared connection pool
+
+        Example:
+            pool = RedisClient.shared_pool(config)
+            try:
+                redis = Redis(connection_pool=pool)
+                ...
+            finally:
+                await RedisClient.release_shared_pool(config)
+        """
+        return cls._acquire_pool(config)[1]
+
+    @classmethod
+    async def release_shared_pool(cls, config: RedisConfig) -> None:
+        """
+        Release a pool obtained from ``shared_pool()``.
+
+        The pool is disconnected once no client or caller uses it.
+
+        Args:
+            config: Redis configuration passed to ``shared_pool()``
+        """
+        await cls._release_pool(cls._pool_key_for(config))
 
     async def connect(self) -> None:
-        """Establish Redis connection."""
+        """
+        Establish Redis connection.
+
+        Clients with identical connection settings on the same event loop
+        share one connection pool.
+        """
         if self._client:
             return
 
-        # Build connection kwargs, only include ssl if True
-        connection_kwargs = {
-            "password": self.config.password,
-            "username": self.config.username,
-            "socket_timeout": self.config.socket_timeout,
-            "socket_connect_timeout": self.config.socket_connect_timeout,
-            "max_connections": self.config.max_connections,
-            "decode_responses": self.config.decode_responses,
-        }
-
-        if self.config.ssl:
-            connection_kwargs["ssl"] = True
-
-        self._client = await redis.from_url(
-            f"redis://{self.config.host}:{self.config.port}/{self.config.db}",
-            **connection_kwargs
-        )
+        self._pool_key, pool = self._acquire_pool(self.config)
+        self._client = Redis(connection_pool=pool)
 
-        logger.info(f"Connected to Redis at {self.config.host}:{self.config.port}")
+        logger.info("Connected to Redis at %s:%s", self.config.host, self.config.port)
 
     async def close(self) -> None:
-        """Close Redis connection."""
+        """Close Redis connection, disconnecting the pool once no client uses it."""
         if self._client:
             await self._client.aclose()
             self._client = None
+
+            if self._pool_key is not None:
+                await self._release_pool(self._pool_key)
+                self._pool_key = None
+
             logger.info("Redis connection closed")
 
     def _get_key(self, key: str) -> str:
         """Add prefix to key."""
-        return f"{self.config.key_prefix}{key}"
+        return self._prefix + key
+
+    def _get_key_b(self, key: Union[str, bytes]) -> bytes:
+        """Add prefix to key, returning the encoded key for batch commands."""
+        return self._prefix_b + (key.encode() if isinstance(key, str) else key)
+
+    async def _ensure(self) -> "Redis[Any]":
+        """Return the connected Redis client, connecting on first use."""
+        client = self._client
+        if client is None:
+            async with self._connect_lock:
+                if self._client is None:
+                    await self.connect()
+            client = self.client
+        return client
 
     @property
-    def client(self) -> Redis:
+    def client(self) -> "Redis[Any]":
         """Get underlying Redis client."""
         if not self._client:
             raise RuntimeError("Redis client not connected. Call connect() first.")
         return self._client
 
+    def _serialize(self, value: Any) -> Union[str, bytes]:
+        """
+        Serialize a value for storage.
+
+        Strings, bytes and numbers are stored as-is, ``JSONBytes`` are
+        tagged without re-encoding. Strings and bytes that start with a
+        header byte are tagged so they read back unchanged. Other values are
+        encoded as JSON behind a header byte, so reads dispatch on a single
+        byte instead of attempting a parse. Payloads larger than
+        ``compress_threshold`` are zstd-compressed behind another header byte.
+        """
+        payload: Union[str, bytes]
+        value_type = type(value)
+        if value_type is JSONBytes:
+            payload = _JSON_HEADER + value
+        elif isinstance(value, str):
+            payload = value
+            if value.startswith(_STR_HEADERS) or value in _JSON_LITERALS:
+                # Tag strings that would otherwise look like a header or a literal
+                payload = _JSON_HEADER + orjson.dumps(value)
+        elif value_type is int or value_type is float:
+            payload = orjson.dumps(value)
+        elif isinstance(value, bytes):
+            payload = value
+            if value[:1] in _HEADERS:
+                # Tag bytes that would otherwise look like a header
+                payload = _BYTES_HEADER + value
+        else:
+            payload = _JSON_HEADER + orjson.dumps(value, option=_JSON_OPTIONS)
+
+        threshold = self.config.compress_threshold
+        if threshold is not None and len(payload) > threshold:
+            if _compressor is None:
+                raise RuntimeError("zstandard is required to write compressed values")
+            if isinstance(payload, str):
+                payload = payload.encode()
+            payload = _ZSTD_HEADER + _compressor.compress(payload)
+
+        return payload
+
+    @staticmethod
+    def _deserialize(value: Any) -> Any:
+        """
+        Deserialize a raw Redis value.
+
+        Dispatches on the header byte: compressed values are decompressed
+        first, JSON documents are parsed straight from the reply bytes and
+        tagged bytes are returned without their header. Untagged values are
+        parsed as JSON when they look like it (numbers, and documents written
+        before values were tagged), otherwise returned as a string, or as
+        bytes if they are not valid UTF-8.
+        """
+        if isinstance(value, str):
+            value = value.encode()
+
+        header = value[:1]
+        if header == _ZSTD_HEADER:
+            if _decompressor is None:
+                raise RuntimeError("zstandard is required to read compressed values")
+            value = _decompressor.decompress(value[1:])
+            header = value[:1]
+
+        if header == _JSON_HEADER:
+            return orjson.loads(value[1:])
+
+        if header == _BYTES_HEADER:
+            return value[1:]
+
+        if value and value[0] in _UNTAGGED_JSON_START:
+            try:
+                return orjson.loads(value)
+            except orjson.JSONDecodeError:
+                pass
+
+        try:
+            return value.decode()
+        except UnicodeDecodeError:
+            return value
+
+    @_swallow(lambda self, key, default=None: default)
     async def get(self, key: str, default: Any = None) -> Any:
         """
         Get value from Redis.
@@ -122,21 +413,15 @@ class RedisClient:
         Example:
             value = await client.get("user:123")
         """
-        try:
-            value = await self.client.get(self._get_key(key))
-            if value is None:
-                return default
-
-            # Try to deserialize JSON
-            try:
-                return json.loads(value)
-            except (json.JSONDecodeError, TypeError):
-                return value
-
-        except Exception as e:
-            logger.error(f"Failed to get key '{key}': {e}")
+        client = await self._ensure()
+        value = await client.get(self._get_key(key))
+        if value is None:
             return default
 
+        # Try to deserialize JSON
+        return self._deserialize(value)
+
+    @_swallow(False)
     async def set(
         self,
         key: str,
@@ -148,7 +433,8 @@ class RedisClient:
         """
         Set value in Redis.
 
-        Automatically serializes to JSON.
+        Automatically serializes to JSON, compressing large payloads when
+        ``compress_threshold`` is configured.
 
         Args:
             key: Cache key
@@ -163,25 +449,106 @@ class RedisClient:
         Example:
             await client.set("user:123", {"name": "John"}, ttl=3600)
         """
-        try:
-            # Serialize to JSON if not a string
-            if not isinstance(value, (str, bytes)):
-                value = json.dumps(value)
-
-            result = await self.client.set(
-                self._get_key(key),
-                value,
-                ex=ttl,
-                nx=nx,
-                xx=xx,
-            )
+        client = await self._ensure()
+        result = await client.set(
+            self._get_key(key),
+            self._serialize(value),
+            ex=ttl,
+            nx=nx,
+            xx=xx,
+        )
 
-            return bool(result)
+        return bool(result)
 
-        except Exception as e:
-            logger.error(f"Failed to set key '{key}': {e}")
-            return False
+    @_swallow(None)
+    async def get_raw(self, key: str) -> Optional[Union[bytes, str]]:
+        """
+        Get the stored payload without deserializing it.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Raw stored value (str with decode_responses), or None if the key
+            does not exist
+
+        Example:
+            payload = await client.get_raw("user:123")
+        """
+        client = await self._ensure()
+        return await client.get(self._get_key(key))
+
+    @_swallow(False)
+    async def set_raw(self, key: str, payload: bytes, ttl: Optional[int] = None) -> bool:
+        """
+        Store a payload as-is, skipping serialization.
+
+        Args:
+            key: Cache key
+            payload: Raw value to store
+            ttl: Time-to-live in seconds
+
+        Returns:
+            True if set successfully
+
+        Example:
+            await client.set_raw("user:123", payload, ttl=3600)
+        """
+        client = await self._ensure()
+        return bool(await client.set(self._get_key(key), payload, ex=ttl))
+
+    @_swallow(lambda self, keys: [None] * len(keys))
+    async def mget(self, keys: list[str]) -> list[Any]:
+        """
+        Get multiple values in a single round-trip.
+
+        Automatically deserializes JSON.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Values in the same order as keys (None for missing keys)
+
+        Example:
+            users = await client.mget(["user:123", "user:124"])
+        """
+        if not keys:
+            return []
 
+        client = await self._ensure()
+        values = await client.mget([self._get_key_b(key) for key in keys])
+        return [None if value is None else self._deserialize(value) for value in values]
+
+    @_swallow(False)
+    async def mset(self, mapping: dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """
+        Set multiple values in a single pipelined round-trip.
+
+        Automatically serializes to JSON.
+
+        Args:
+            mapping: Mapping of cache keys to values
+            ttl: Time-to-live in seconds applied to every key
+
+        Returns:
+            True if all values were set
+
+        Example:
+            await client.mset({"user:123": {"name": "John"}}, ttl=3600)
+        """
+        if not mapping:
+            return True
+
+        client = await self._ensure()
+        pipe = client.pipeline(transaction=False)
+        for key, value in mapping.items():
+            pipe.set(self._get_key_b(key), self._serialize(value), ex=ttl)
+
+        results = await pipe.execute()
+        return all(results)
+
+    @_swallow(0)
     async def delete(self, *keys: str) -> int:
         """
         Delete one or more keys.
@@ -195,13 +562,11 @@ class RedisClient:
         Example:
             count = await client.delete("user:123", "user:124")
         """
-        try:
-            prefixed_keys = [self._get_key(key) for key in keys]
-            return await self.client.delete(*prefixed_keys)
-        except Exception as e:
-            logger.error(f"Failed to delete keys: {e}")
-            return 0
+        client = await self._ensure()
+        prefixed_keys = [self._get_key(key) for key in keys]
+        return await client.delete(*prefixed_keys)
 
+    @_swallow(0)
     async def exists(self, *keys: str) -> int:
         """
         Check if keys exist.
@@ -215,13 +580,11 @@ class RedisClient:
         Example:
             count = await client.exists("user:123")
         """
-        try:
-            prefixed_keys = [self._get_key(key) for key in keys]
-            return await self.client.exists(*prefixed_keys)
-        except Exception as e:
-            logger.error(f"Failed to check existence: {e}")
-            return 0
+        client = await self._ensure()
+        prefixed_keys = [self._get_key(key) for key in keys]
+        return await client.exists(*prefixed_keys)
 
+    @_swallow(False)
     async def expire(self, key: str, ttl: int) -> bool:
         """
         Set TTL on a key.
@@ -236,12 +599,10 @@ class RedisClient:
         Example:
             await client.expire("user:123", 3600)
         """
-        try:
-            return await self.client.expire(self._get_key(key), ttl)
-        except Exception as e:
-            logger.error(f"Failed to set expiry on '{key}': {e}")
-            return False
+        client = await self._ensure()
+        return await client.expire(self._get_key(key), ttl)
 
+    @_swallow(-2)
     async def ttl(self, key: str) -> int:
         """
         Get remaining TTL.
@@ -255,12 +616,10 @@ class RedisClient:
         Example:
             seconds_left = await client.ttl("user:123")
         """
-        try:
-            return await self.client.ttl(self._get_key(key))
-        except Exception as e:
-            logger.error(f"Failed to get TTL for '{key}': {e}")
-            return -2
+        client = await self._ensure()
+        return await client.ttl(self._get_key(key))
 
+    @_swallow(0)
     async def increment(self, key: str, amount: int = 1) -> int:
         """
         Increment a numeric value.
@@ -275,12 +634,10 @@ class RedisClient:
         Example:
             views = await client.increment("page:views:123")
         """
-        try:
-            return await self.client.incrby(self._get_key(key), amount)
-        except Exception as e:
-            logger.error(f"Failed to increment '{key}': {e}")
-            return 0
+        client = await self._ensure()
+        return await client.incrby(self._get_key(key), amount)
 
+    @_swallow(0)
     async def decrement(self, key: str, amount: int = 1) -> int:
         """
         Decrement a numeric value.
@@ -295,12 +652,10 @@ class RedisClient:
         Example:
             stock = await client.decrement("product:stock:123")
         """
-        try:
-            return await self.client.decrby(self._get_key(key), amount)
-        except Exception as e:
-            logger.error(f"Failed to decrement '{key}': {e}")
-            return 0
+        client = await self._ensure()
+        return await client.decrby(self._get_key(key), amount)
 
+    @_swallow(lambda self, *args, **kwargs: [])
     async def scan_keys(self, pattern: str = "*", count: int = 100) -> list[str]:
         """
         Scan for keys matching a pattern.
@@ -315,34 +670,41 @@ class RedisClient:
         Example:
             user_keys = await client.scan_keys("user:*")
         """
-        try:
-            keys = []
-            cursor = 0
-            pattern_with_prefix = self._get_key(pattern)
-
-            while True:
-                cursor, batch = await self.client.scan(
-                    cursor, match=pattern_with_prefix, count=count
-                )
-                keys.extend(batch)
-
-                if cursor == 0:
-                    break
+        client = await self._ensure()
+        keys = []
+        cursor = 0
+        pattern_with_prefix = self._get_key(pattern)
+
+        while True:
+            cursor, batch = await client.scan(
+                cursor, match=pattern_with_prefix, count=count
+            )
+            keys.extend(batch)
 
-            # Remove prefix from results
-            prefix_len = len(self.config.key_prefix)
-            return [key[prefix_len:] for key in keys]
+            if cursor == 0:
+                break
 
-        except Exception as e:
-            logger.error(f"Failed to scan keys: {e}")
-            return []
+        # Remove prefix from results
+        prefix_len = len(self._prefix_b)
+        return [
+            key[prefix_len:].decode() if isinstance(key, bytes) else key[len(self._prefix):]
+            for key in keys
+        ]
 
-    async def flush_pattern(self, pattern: str) -> int:
+    @_swallow(0)
+    async def flush_pattern(self, pattern: str, batch_size: int = 500) -> int:
         """
         Delete all keys matching a pattern.
 
+        Keys are streamed with SCAN and removed with UNLINK in batches, so
+        memory is reclaimed in the background on the server and large
+        matches never have to be held in memory at once. Each batch's
+        UNLINK is pipelined with the next SCAN, so a flush costs one
+        round-trip per scanned page.
+
         Args:
             pattern: Key pattern
+            batch_size: SCAN count hint, i.e. keys unlinked per round-trip
 
         Returns:
             Number of keys deleted
@@ -350,11 +712,29 @@ class RedisClient:
         Example:
             count = await client.flush_pattern("session:*")
         """
-        keys = await self.scan_keys(pattern)
-        if keys:
-            return await self.delete(*keys)
-        return 0
+        deleted = 0
+        client = await self._ensure()
+        match = self._get_key(pattern)
+        pipe = client.pipeline(transaction=False)
+
+        cursor, batch = await client.scan(0, match=match, count=batch_size)
+        while cursor != 0:
+            # Unlink this page and fetch the next one in a single round-trip
+            if batch:
+                pipe.unlink(*batch)
+            pipe.scan(cursor, match=match, count=batch_size)
+            results = await pipe.execute()
 
+            if batch:
+                deleted += results[0]
+            cursor, batch = results[-1]
+
+        if batch:
+            deleted += await client.unlink(*batch)
+
+        return deleted
+
+    @_swallow(False)
     async def ping(self) -> bool:
         """
         Check if Redis is alive.
@@ -366,9 +746,6 @@ class RedisClient:
             if await client.ping():
                 print("Redis is up!")
         """
-        try:
-            result = await self.client.ping()
-            return result
-        except Exception as e:
-            logger.error(f"Redis ping failed: {e}")
-            return False
+        client = await self._ensure()
+        result = await client.ping()
+        return result
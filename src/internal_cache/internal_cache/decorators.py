@@ -4,22 +4,120 @@ Caching decorators for function memoization.
 Provides decorators for automatic caching with Redis.
 """
 
+import asyncio
 import hashlib
-import json
 import logging
-from typing import Callable, Optional, Any
-from functools import wraps
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Coroutine, Iterable, Optional
+from functools import lru_cache, wraps
+
+import orjson
 
 from .client import RedisClient
 
 
 logger = logging.getLogger(__name__)
 
+# Argument types whose hash and serialized form can never drift apart,
+# so keys built from them are safe to memoize. Not float: 0.0 and -0.0 are
+# equal with the same hash but serialize differently.
+_MEMOIZABLE_TYPES = frozenset({str, int, bool, bytes, type(None)})
+
+# Maximum number of memoized cache keys per decorated function
+_KEY_CACHE_SIZE = 4096
+
+# Maximum number of entries in the in-process L1 cache per decorated function
+_LOCAL_CACHE_SIZE = 10_000
+
+# Marker stored for cached None results when negative caching is enabled
+_NEGATIVE_SENTINEL = b"\x00MISS"
+_NEGATIVE_SENTINEL_STR = _NEGATIVE_SENTINEL.decode()
+
+# Result handed to coalesced callers when the executing caller is cancelled,
+# telling them to retry so one of them takes over the execution
+_RETRY = object()
+
+# Strong references to background cache writes so they are not garbage collected
+_pending_writes: set[asyncio.Task[None]] = set()
+
+
+def _serialize_arg(value: Any) -> bytes:
+    """
+    Serialize a single argument deterministically for key hashing.
 
-def _generate_cache_key(func: Callable, args: tuple, kwargs: dict) -> str:
+    The encoding is prefixed with the argument's type, so values that
+    encode alike (a tuple and a list, an object whose str() is "1" and the
+    int 1) get different keys. Only the top-level type is tagged.
+    """
+    cls = type(value)
+    tag = f"{cls.__module__}.{cls.__qualname__}".encode()
+    try:
+        return tag + b"=" + orjson.dumps(
+            value, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
+    except TypeError:
+        return tag + b"!" + str(value).encode()
+
+
+def _memoizable(args: tuple[Any, ...], kwargs: dict[str, Any]) -> bool:
+    """Check whether all arguments are immutable scalars."""
+    return all(type(arg) in _MEMOIZABLE_TYPES for arg in args) and all(
+        type(value) in _MEMOIZABLE_TYPES for value in kwargs.values()
+    )
+
+
+def _store_local(
+    local: "OrderedDict[str, tuple[float, Any]]", key: str, value: Any, expires_at: float
+) -> None:
+    """Store a value in an L1 cache, evicting the least recently used entry when full."""
+    if key in local:
+        local.move_to_end(key)
+    elif len(local) >= _LOCAL_CACHE_SIZE:
+        local.popitem(last=False)
+
+    local[key] = (expires_at, value)
+
+
+def _get_local(local: "OrderedDict[str, tuple[float, Any]]", key: str) -> Any:
+    """Get an unexpired value from an L1 cache, or None."""
+    entry = local.get(key)
+    if entry is None:
+        return None
+    if entry[0] <= time.monotonic():
+        del local[key]
+        return None
+
+    local.move_to_end(key)
+    return entry[1]
+
+
+async def _safe_set(client: RedisClient, key: str, value: Any, ttl: int) -> None:
+    """Store a value in cache, logging instead of raising on failure."""
+    try:
+        await client.set(key, value, ttl=ttl)
+        logger.debug("Cached result: %s (ttl=%ds)", key, ttl)
+    except Exception as e:
+        logger.warning("Cache set failed: %s", e)
+
+
+def _schedule_set(client: RedisClient, key: str, value: Any, ttl: int) -> asyncio.Task[None]:
+    """Store a value in cache from a background task."""
+    task = asyncio.create_task(_safe_set(client, key, value, ttl))
+    _pending_writes.add(task)
+    task.add_done_callback(_pending_writes.discard)
+    return task
+
+
+def _generate_cache_key(
+    func: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> str:
     """
     Generate cache key from function name and arguments.
 
+    Arguments are serialized deterministically and streamed into a single
+    BLAKE2b hasher, so keys have a fixed length regardless of argument size.
+
     Args:
         func: Function being cached
         args: Positional arguments
@@ -28,38 +126,32 @@ def _generate_cache_key(func: Callable, args: tuple, kwargs: dict) -> str:
     Returns:
         Cache key string
     """
-    # Create a deterministic representation of arguments
-    key_parts = [func.__module__, func.__name__]
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(f"{func.__module__}:{func.__qualname__}".encode())
 
     # Add args
     for arg in args:
-        try:
-            key_parts.append(json.dumps(arg, sort_keys=True))
-        except (TypeError, ValueError):
-            key_parts.append(str(arg))
-
-    # Add kwargs
-    for k in sorted(kwargs.keys()):
-        try:
-            key_parts.append(f"{k}={json.dumps(kwargs[k], sort_keys=True)}")
-        except (TypeError, ValueError):
-            key_parts.append(f"{k}={kwargs[k]}")
+        hasher.update(b"\x00")
+        hasher.update(_serialize_arg(arg))
 
-    # Hash the key if it's too long
-    key_string = ":".join(key_parts)
-    if len(key_string) > 200:
-        key_hash = hashlib.md5(key_string.encode()).hexdigest()
-        return f"cache:{func.__name__}:{key_hash}"
+    # Add kwargs - keys are unique, so sorting items never compares values
+    sorted_items = sorted(kwargs.items()) if len(kwargs) > 1 else kwargs.items()
+    for k, v in sorted_items:
+        hasher.update(f"\x00{k}=".encode())
+        hasher.update(_serialize_arg(v))
 
-    return f"cache:{key_string}"
+    return f"cache:{func.__qualname__}:{hasher.hexdigest()}"
 
 
 def cached(
     client: RedisClient,
     ttl: int = 3600,
     key_prefix: Optional[str] = None,
-    key_builder: Optional[Callable] = None,
-):
+    key_builder: Optional[Callable[..., Any]] = None,
+    local_ttl: Optional[float] = None,
+    background_write: bool = False,
+    negative_ttl: Optional[int] = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """
     Decorator for caching function results in Redis.
 
@@ -68,6 +160,32 @@ def cached(
         ttl: Time-to-live in seconds (default: 1 hour)
         key_prefix: Optional key prefix
         key_builder: Optional custom key builder function
+        local_ttl: Enable an in-process L1 cache in front of Redis, holding
+            values for ``min(ttl, local_ttl)`` seconds (default: disabled)
+        background_write: Write results to Redis from a background task
+            instead of awaiting the write before returning
+        negative_ttl: Cache ``None`` results for this many seconds, so
+            lookups of missing entities do not re-run the function
+            (default: disabled, ``None`` results are always re-computed)
+
+    Keys for calls whose arguments are all immutable scalars (str, int,
+    float, bool, bytes, None) are memoized in a bounded per-function LRU,
+    so repeat calls skip serialization and hashing entirely. Use
+    ``wrapper.cache_key_cache_clear()`` to drop the memoized keys.
+
+    With ``local_ttl`` set, repeat hits are served from a per-process dict
+    without a Redis round-trip. Other processes invalidating the key are not
+    seen until the local entry expires, and the same object is returned to
+    every caller, so cached values must not be mutated.
+
+    Concurrent misses for the same key are coalesced: only the first caller
+    executes the function, the others await its result. The result keeps
+    being shared until it is stored in Redis. If the executing caller is
+    cancelled, a waiting caller takes over the execution.
+
+    With ``background_write`` the caller returns without waiting for the
+    Redis write. Reads issued immediately afterwards, including from the
+    same coroutine, may still miss until the write lands.
 
     Example:
         from internal_cache import RedisClient, cached
@@ -87,44 +205,125 @@ def cached(
         user = await get_user(123)
     """
 
-    def decorator(func: Callable):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            # Generate cache key
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        local: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        inflight: dict[str, asyncio.Future[Any]] = {}
+        local_expiry = min(ttl, local_ttl) if local_ttl else 0
+
+        @lru_cache(maxsize=_KEY_CACHE_SIZE, typed=True)
+        def key_for(*args: Any, **kwargs: Any) -> str:
+            return _generate_cache_key(func, args, kwargs)
+
+        def build_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+            cache_key: str
             if key_builder:
                 cache_key = key_builder(func, args, kwargs)
+            elif _memoizable(args, kwargs):
+                cache_key = key_for(*args, **kwargs)
             else:
                 cache_key = _generate_cache_key(func, args, kwargs)
 
             if key_prefix:
                 cache_key = f"{key_prefix}:{cache_key}"
+            return cache_key
+
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            # Generate cache key
+            cache_key: str = build_key(args, kwargs)
+
+            # Try the in-process cache first
+            if local_expiry:
+                local_value = _get_local(local, cache_key)
+                if local_value is not None:
+                    logger.debug("Local cache hit: %s", cache_key)
+                    return local_value
 
             # Try to get from cache
             try:
-                cached_value = await client.get(cache_key)
+                raw = await client.get_raw(cache_key)
+                if negative_ttl and raw in (_NEGATIVE_SENTINEL, _NEGATIVE_SENTINEL_STR):
+                    logger.debug("Negative cache hit: %s", cache_key)
+                    return None
+
+                cached_value = None if raw is None else client._deserialize(raw)
                 if cached_value is not None:
-                    logger.debug(f"Cache hit: {cache_key}")
+                    logger.debug("Cache hit: %s", cache_key)
+                    if local_expiry:
+                        _store_local(
+                            local, cache_key, cached_value, time.monotonic() + local_expiry
+                        )
                     return cached_value
             except Exception as e:
-                logger.warning(f"Cache get failed: {e}")
+                logger.warning("Cache get failed: %s", e)
+
+            # Cache miss - join an in-flight execution for the same key,
+            # retrying if the caller executing it was cancelled
+            pending = inflight.get(cache_key)
+            while pending is not None:
+                logger.debug("Cache miss coalesced: %s", cache_key)
+                result = await asyncio.shield(pending)
+                if result is not _RETRY:
+                    return result
+                pending = inflight.get(cache_key)
 
             # Cache miss - execute function
-            logger.debug(f"Cache miss: {cache_key}")
-            result = await func(*args, **kwargs)
-
-            # Store in cache
+            logger.debug("Cache miss: %s", cache_key)
+            future = asyncio.get_running_loop().create_future()
+            inflight[cache_key] = future
             try:
-                await client.set(cache_key, result, ttl=ttl)
-                logger.debug(f"Cached result: {cache_key} (ttl={ttl}s)")
-            except Exception as e:
-                logger.warning(f"Cache set failed: {e}")
+                result = await func(*args, **kwargs)
+            except asyncio.CancelledError:
+                release(cache_key, future)
+                future.set_result(_RETRY)
+                raise
+            except BaseException as e:
+                release(cache_key, future)
+                future.set_exception(e)
+                # Mark retrieved so an unawaited future does not log the error
+                future.exception()
+                raise
+            future.set_result(result)
+
+            if local_expiry and result is not None:
+                _store_local(local, cache_key, result, time.monotonic() + local_expiry)
+
+            # Store in cache, sharing the result until the write lands
+            value, value_ttl = result, ttl
+            if result is None and negative_ttl:
+                value, value_ttl = _NEGATIVE_SENTINEL, negative_ttl
+
+            if background_write:
+                task = _schedule_set(client, cache_key, value, value_ttl)
+                task.add_done_callback(lambda _: release(cache_key, future))
+            else:
+                try:
+                    await _safe_set(client, cache_key, value, value_ttl)
+                finally:
+                    release(cache_key, future)
 
             return result
 
+        def release(cache_key: str, future: asyncio.Future[Any]) -> None:
+            if inflight.get(cache_key) is future:
+                del inflight[cache_key]
+
+        def local_invalidate(*args: Any, **kwargs: Any) -> bool:
+            cache_key = build_key(args, kwargs)
+            # A stored result still being shared is stale too
+            pending = inflight.get(cache_key)
+            if pending is not None and pending.done():
+                release(cache_key, pending)
+            return local.pop(cache_key, None) is not None
+
+        def cache_invalidate(*args: Any, **kwargs: Any) -> Coroutine[Any, Any, bool]:
+            local_invalidate(*args, **kwargs)
+            return _invalidate_cache(client, func, key_prefix, key_builder, args, kwargs)
+
         # Add cache control methods
-        wrapper.cache_invalidate = lambda *args, **kwargs: _invalidate_cache(
-            client, func, key_prefix, key_builder, args, kwargs
-        )
+        wrapper.cache_invalidate = cache_invalidate  # type: ignore[attr-defined]
+        wrapper.local_invalidate = local_invalidate  # type: ignore[attr-defined]
+        wrapper.cache_key_cache_clear = key_for.cache_clear  # type: ignore[attr-defined]
 
         return wrapper
 
@@ -133,11 +332,11 @@ def cached(
 
 async def _invalidate_cache(
     client: RedisClient,
-    func: Callable,
+    func: Callable[..., Any],
     key_prefix: Optional[str],
-    key_builder: Optional[Callable],
-    args: tuple,
-    kwargs: dict,
+    key_builder: Optional[Callable[..., Any]],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
 ) -> bool:
     """
     Invalidate cache for specific function call.
@@ -161,15 +360,16 @@ async def _invalidate_cache(
     if key_prefix:
         cache_key = f"{key_prefix}:{cache_key}"
 
-    deleted = await client.delete(cache_key)
+    deleted: int = await client.delete(cache_key)
     return deleted > 0
 
 
 def cache_aside(
     client: RedisClient,
     ttl: int = 3600,
-    key_func: Optional[Callable] = None,
-):
+    key_func: Optional[Callable[..., Any]] = None,
+    background_write: bool = False,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """
     Cache-aside pattern decorator.
 
@@ -179,6 +379,8 @@ def cache_aside(
         client: Redis client instance
         ttl: Time-to-live in seconds
         key_func: Function to generate cache key from args/kwargs
+        background_write: Write results to Redis from a background task
+            instead of awaiting the write before returning (see ``cached``)
 
     Example:
         @cache_aside(redis, ttl=600, key_func=lambda user_id: f"user:{user_id}")
@@ -189,10 +391,11 @@ def cache_aside(
         data = await get_user_data(123)
     """
 
-    def decorator(func: Callable):
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         @wraps(func)
-        async def wrapper(*args, **kwargs):
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
             # Generate cache key
+            cache_key: str
             if key_func:
                 cache_key = key_func(*args, **kwargs)
             else:
@@ -201,14 +404,17 @@ def cache_aside(
             # Check cache
             cached_value = await client.get(cache_key)
             if cached_value is not None:
-                logger.debug(f"Cache hit: {cache_key}")
+                logger.debug("Cache hit: %s", cache_key)
                 return cached_value
 
             # Execute and cache
-            logger.debug(f"Cache miss: {cache_key}")
+            logger.debug("Cache miss: %s", cache_key)
             result = await func(*args, **kwargs)
 
-            await client.set(cache_key, result, ttl=ttl)
+            if background_write:
+                _schedule_set(client, cache_key, result, ttl)
+            else:
+                await client.set(cache_key, result, ttl=ttl)
 
             return result
 
@@ -217,6 +423,83 @@ def cache_aside(
     return decorator
 
 
+def cache_aside_batch(
+    client: RedisClient,
+    ttl: int = 3600,
+    key_func: Optional[Callable[..., Any]] = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Batch cache-aside decorator.
+
+    Wraps a function that resolves many ids at once (``ids -> {id: value}``).
+    Cached ids are read with a single MGET, the function is only called with
+    the missing ids, and its results are written back with a single
+    pipelined round-trip.
+
+    Args:
+        client: Redis client instance
+        ttl: Time-to-live in seconds
+        key_func: Function to generate the cache key of a single id
+
+    Extra positional and keyword arguments are passed through to the
+    function but are not part of the cache keys.
+
+    Example:
+        @cache_aside_batch(redis, ttl=600, key_func=lambda user_id: f"user:{user_id}")
+        async def get_users(user_ids: list[int]) -> dict[int, dict]:
+            return await fetch_users_from_db(user_ids)
+
+        # One MGET for all ids, DB only queried for the misses
+        users = await get_users([1, 2, 3])
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        def build_key(item_id: Any) -> str:
+            if key_func:
+                cache_key: str = key_func(item_id)
+                return cache_key
+            return _generate_cache_key(func, (item_id,), {})
+
+        @wraps(func)
+        async def wrapper(ids: Iterable[Any], *args: Any, **kwargs: Any) -> dict[Any, Any]:
+            ids = list(ids)
+            if not ids:
+                return {}
+
+            keys = [build_key(item_id) for item_id in ids]
+            cached_values = await client.mget(keys)
+
+            results = {}
+            missing = []
+            for item_id, value in zip(ids, cached_values, strict=True):
+                if value is None:
+                    missing.append(item_id)
+                else:
+                    results[item_id] = value
+
+            logger.debug("Batch cache hits: %s, misses: %s", len(results), len(missing))
+
+            if missing:
+                fetched = await func(missing, *args, **kwargs)
+                if fetched:
+                    await client.mset(
+                        {
+                            build_key(item_id): value
+                            for item_id, value in fetched.items()
+                            if value is not None
+                        },
+                        ttl=ttl,
+                    )
+                    results.update(fetched)
+
+            # Preserve the order of the requested ids
+            return {item_id: results[item_id] for item_id in ids if item_id in results}
+
+        return wrapper
+
+    return decorator
+
+
 # Example usage with manual cache control:
 #
 # from internal_cache import RedisClient, cached
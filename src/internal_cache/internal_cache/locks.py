@@ -5,17 +5,109 @@ Provides distributed locks for coordinating access across multiple processes/ser
 """
 
 import asyncio
+import hashlib
 import logging
-import uuid
-from typing import Optional, Callable
+import os
+import random
+import weakref
+from typing import Any, Awaitable, Optional, Callable, cast
 from contextlib import asynccontextmanager
 from functools import wraps
 
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+from redis.exceptions import NoScriptError
+
 from .client import RedisClient
 
 
 logger = logging.getLogger(__name__)
 
+# Take the lock, or report how long (ms) the current holder keeps it
+_ACQUIRE_LUA = """
+if redis.call("set", KEYS[1], ARGV[1], "NX", "PX", ARGV[2]) then
+    return nil
+end
+return redis.call("pttl", KEYS[1])
+"""
+
+# Only delete if we own the lock (check value matches).
+# This prevents accidentally releasing someone else's lock.
+_RELEASE_LUA = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    redis.call("publish", KEYS[1] .. ":free", "1")
+    return redis.call("del", KEYS[1])
+else
+    return 0
+end
+"""
+
+# Extend the TTL only while we still own the lock
+_RENEW_LUA = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("expire", KEYS[1], ARGV[2])
+else
+    return 0
+end
+"""
+
+_SCRIPTS = {"acquire": _ACQUIRE_LUA, "release": _RELEASE_LUA, "renew": _RENEW_LUA}
+
+# Scripts run with EVALSHA using SHA1s computed locally, so the source is
+# only sent (SCRIPT LOAD) when Redis answers NOSCRIPT, e.g. after a restart
+_SHAS = {
+    name: hashlib.sha1(script.encode(), usedforsecurity=False).hexdigest()
+    for name, script in _SCRIPTS.items()
+}
+
+# Waiters sleep until the holder releases the lock (published by the release
+# script) or its TTL runs out. This caps the wait when the TTL is unknown.
+_RELEASE_WAIT = 1.0
+
+# Jittered exponential backoff between retries when notifications are
+# unavailable, so waiters don't all retry on the same schedule
+_BACKOFF_BASE = 0.005
+_BACKOFF_CAP = 0.5
+
+# In-process gates, one per lock key and event loop, so blocked waiters
+# within one process queue locally instead of each waiting on Redis. Gates
+# are dropped once nothing waits on them.
+_Gates = weakref.WeakValueDictionary[bytes, asyncio.Lock]
+_local_gates: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _Gates]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _backoff(attempt: int) -> float:
+    """Get the jittered backoff delay in seconds for a retry attempt."""
+    delay = min(_BACKOFF_CAP, _BACKOFF_BASE * (1 << min(attempt, 6)))
+    return delay * (0.5 + random.random())
+
+
+def _new_token() -> str:
+    """Generate a random lock token (128 bits, hex encoded)."""
+    return os.urandom(16).hex()
+
+
+async def _load_script(redis: "Redis[bytes]", name: str) -> None:
+    """Send a lock script with SCRIPT LOAD after Redis answered NOSCRIPT."""
+    # types-redis leaves the scripting commands untyped
+    script_load = cast(Callable[[str], Awaitable[str]], redis.script_load)
+    await script_load(_SCRIPTS[name])
+
+
+def _local_gate(key: bytes) -> asyncio.Lock:
+    """Get the in-process gate for a lock key on the running loop."""
+    loop = asyncio.get_running_loop()
+    gates = _local_gates.get(loop)
+    if gates is None:
+        gates = _local_gates[loop] = weakref.WeakValueDictionary()
+
+    gate = gates.get(key)
+    if gate is None:
+        gate = gates[key] = asyncio.Lock()
+    return gate
+
 
 class DistributedLock:
     """
@@ -57,8 +149,12 @@ class DistributedLock:
         self.lock_name = f"lock:{lock_name}"
         self.timeout = timeout
         self.auto_renewal = auto_renewal
-        self._lock_value = str(uuid.uuid4())  # Unique token for this lock instance
-        self._renewal_task: Optional[asyncio.Task] = None
+        self._lock_value = _new_token()  # Unique token for this lock instance
+        # Encoded once so commands don't re-prefix and re-encode per call
+        self._full_key = client._get_key_b(self.lock_name)
+        self._value_bytes = self._lock_value.encode()
+        self._renewal_task: Optional[asyncio.Task[None]] = None
+        self._owns_locally = False
 
     async def acquire(self, blocking: bool = True, timeout: Optional[float] = None) -> bool:
         """
@@ -87,38 +183,188 @@ class DistributedLock:
                 # Got lock within 5 seconds
                 pass
         """
-        start_time = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout is not None else None
+
+        if not blocking:
+            return await self._acquire(blocking, timeout, deadline)
+
+        # Only one waiter per process at a time waits on Redis for the lock;
+        # the rest queue on the in-process gate without touching Redis.
+        gate = _local_gate(self._full_key)
+        if not gate.locked():
+            await gate.acquire()
+        else:
+            try:
+                await asyncio.wait_for(gate.acquire(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Failed to acquire lock after %ss: %s", timeout, self.lock_name)
+                return False
 
-        while True:
-            # Try to acquire lock
-            acquired = await self.client.set(
-                self.lock_name,
-                self._lock_value,
-                ttl=self.timeout,
-                nx=True,  # Only set if not exists
-            )
+        try:
+            return await self._acquire(blocking, timeout, deadline)
+        finally:
+            gate.release()
 
-            if acquired:
-                logger.debug(f"Acquired lock: {self.lock_name}")
+    async def _acquire(
+        self, blocking: bool, timeout: Optional[float], deadline: Optional[float]
+    ) -> bool:
+        """
+        Acquire the lock in Redis, waiting for it to be freed if blocking.
 
-                # Start auto-renewal if enabled
-                if self.auto_renewal:
-                    self._renewal_task = asyncio.create_task(self._renew_loop())
+        Args:
+            blocking: Wait for lock if not available
+            timeout: Maximum time to wait (None = wait forever)
+            deadline: Loop time after which to give up (None = never)
 
-                return True
+        Returns:
+            True if lock acquired
+        """
+        loop = asyncio.get_running_loop()
+        notifier: Optional[_LockNotifier] = None
+        event: Optional[asyncio.Event] = None
+        attempt = 0
 
-            # Check if we should continue waiting
-            if not blocking:
-                return False
+        try:
+            while True:
+                if event is not None:
+                    event.clear()
 
-            if timeout is not None:
-                elapsed = asyncio.get_event_loop().time() - start_time
-                if elapsed >= timeout:
-                    logger.warning(f"Failed to acquire lock after {timeout}s: {self.lock_name}")
+                # Try to acquire lock; on a miss this returns the holder's TTL
+                try:
+                    redis = await self.client._ensure()
+                    remaining_ms = await self._run_script(
+                        "acquire", self._value_bytes, int(self.timeout * 1000), redis=redis
+                    )
+                    acquired = remaining_ms is None
+                except Exception as e:
+                    logger.error(f"Error acquiring lock {self.lock_name}: {e}")
+                    acquired, remaining_ms = False, -1
+
+                if acquired:
+                    logger.debug(f"Acquired lock: {self.lock_name}")
+                    self._owns_locally = True
+
+                    # Start auto-renewal if enabled
+                    if self.auto_renewal:
+                        self._renewal_task = asyncio.create_task(self._renew_loop())
+
+                    return True
+
+                # Check if we should continue waiting
+                if not blocking:
                     return False
 
-            # Wait a bit before retrying
-            await asyncio.sleep(0.1)
+                # Sleep until the holder's lock expires at the latest
+                wait = remaining_ms / 1000 if remaining_ms >= 0 else _RELEASE_WAIT
+                if deadline is not None:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        logger.warning(f"Failed to acquire lock after {timeout}s: {self.lock_name}")
+                        return False
+                    wait = min(wait, remaining)
+
+                if notifier is None:
+                    # Watch, then retry straight away so a release landing
+                    # between the SET and the subscribe isn't missed
+                    notifier = _lock_notifier(self.client)
+                    event = await notifier.watch(self.client, self._full_key)
+                    if event is not None:
+                        continue
+
+                # Poll with backoff if notifications are (no longer) delivered
+                await self._wait_for_release(
+                    event if notifier.listening else None, wait, _backoff(attempt)
+                )
+                attempt += 1
+
+        finally:
+            if notifier is not None and event is not None:
+                notifier.unwatch(self._full_key, event)
+
+    @classmethod
+    async def acquire_many(
+        cls,
+        client: RedisClient,
+        lock_names: list[str],
+        timeout: int = 10,
+        auto_renewal: bool = False,
+    ) -> Optional[list["DistributedLock"]]:
+        """
+        Acquire several locks at once, all or nothing.
+
+        All locks are requested in a single pipelined round-trip. If any of
+        them is already held, the ones that were taken are released again
+        (also in one round-trip) and None is returned. Since nothing is held
+        while waiting, this can't deadlock against other callers taking the
+        same locks in a different order.
+
+        Args:
+            client: Redis client
+            lock_names: Names of the locks to acquire
+            timeout: Lock timeout in seconds
+            auto_renewal: Automatically renew the locks while held
+
+        Returns:
+            The acquired locks in the order given, or None if any was held
+
+        Example:
+            locks = await DistributedLock.acquire_many(redis, ["order:1", "order:2"])
+            if locks:
+                try:
+                    await merge_orders()
+                finally:
+                    for lock in locks:
+                        await lock.release()
+        """
+        locks = [
+            cls(client, name, timeout=timeout, auto_renewal=auto_renewal)
+            for name in dict.fromkeys(lock_names)
+        ]
+        if not locks:
+            return []
+
+        try:
+            redis = await client._ensure()
+            pipe = redis.pipeline(transaction=False)
+            for lock in locks:
+                pipe.set(
+                    lock._full_key,
+                    lock._value_bytes,
+                    px=int(timeout * 1000),
+                    nx=True,
+                )
+            results = await pipe.execute()
+        except Exception as e:
+            logger.error("Error acquiring locks %s: %s", lock_names, e)
+            return None
+
+        if all(results):
+            logger.debug("Acquired locks: %s", lock_names)
+            for lock in locks:
+                lock._owns_locally = True
+                if auto_renewal:
+                    lock._renewal_task = asyncio.create_task(lock._renew_loop())
+            return locks
+
+        # Roll back the partial acquisition
+        taken = [lock for lock, result in zip(locks, results, strict=True) if result]
+        if taken:
+            try:
+                for lock in taken:
+                    pipe.evalsha(_SHAS["release"], 1, lock._full_key, lock._value_bytes)
+                try:
+                    await pipe.execute()
+                except NoScriptError:
+                    await _load_script(redis, "release")
+                    for lock in taken:
+                        pipe.evalsha(_SHAS["release"], 1, lock._full_key, lock._value_bytes)
+                    await pipe.execute()
+            except Exception as e:
+                # The locks expire on their own after the timeout
+                logger.error("Error rolling back locks %s: %s", lock_names, e)
+
+        return None
 
     async def release(self) -> bool:
         """
@@ -139,23 +385,9 @@ class DistributedLock:
                 pass
             self._renewal_task = None
 
-        # Only delete if we own the lock (check value matches)
-        # This prevents accidentally releasing someone else's lock
-        lua_script = """
-        if redis.call("get", KEYS[1]) == ARGV[1] then
-            return redis.call("del", KEYS[1])
-        else
-            return 0
-        end
-        """
-
+        self._owns_locally = False
         try:
-            result = await self.client.client.eval(
-                lua_script,
-                1,
-                self.client._get_key(self.lock_name),
-                self._lock_value,
-            )
+            result = await self._run_script("release", self._value_bytes)
             released = bool(result)
 
             if released:
@@ -170,57 +402,352 @@ class DistributedLock:
             return False
 
     async def _renew_loop(self) -> None:
-        """Auto-renewal loop (runs in background)."""
-        renewal_interval = self.timeout / 3  # Renew at 1/3 of timeout
+        """
+        Auto-renewal loop (runs in background).
 
-        try:
-            while True:
-                await asyncio.sleep(renewal_interval)
-
-                # Renew lock by extending TTL
-                lua_script = """
-                if redis.call("get", KEYS[1]) == ARGV[1] then
-                    return redis.call("expire", KEYS[1], ARGV[2])
-                else
-                    return 0
-                end
-                """
-
-                result = await self.client.client.eval(
-                    lua_script,
-                    1,
-                    self.client._get_key(self.lock_name),
-                    self._lock_value,
-                    self.timeout,
-                )
+        Registers the lock with the loop's renewal scheduler, which renews
+        all auto-renewed locks together, and waits until ownership is lost.
+        """
+        scheduler = _renewal_scheduler()
+        lost = scheduler.add(self)
 
-                if result:
-                    logger.debug(f"Renewed lock: {self.lock_name}")
-                else:
-                    logger.warning(f"Failed to renew lock (lost ownership): {self.lock_name}")
-                    break
+        try:
+            await lost
+            logger.warning(f"Failed to renew lock (lost ownership): {self.lock_name}")
+            self._owns_locally = False
 
         except asyncio.CancelledError:
             logger.debug(f"Lock renewal cancelled: {self.lock_name}")
             raise
 
-    async def __aenter__(self):
+        finally:
+            scheduler.remove(self)
+
+    async def _run_script(
+        self, name: str, *args: Any, redis: "Optional[Redis[bytes]]" = None
+    ) -> Any:
+        """
+        Run a lock script against this lock's key with EVALSHA.
+
+        Loads the script and retries when Redis reports NOSCRIPT.
+
+        Args:
+            name: Script name ("acquire", "release" or "renew")
+            *args: Script arguments
+            redis: Connection to use (defaults to the client's current one)
+
+        Returns:
+            Script result
+        """
+        if redis is None:
+            redis = self.client.client
+        key = self._full_key
+        evalsha = cast(Callable[..., Awaitable[Any]], redis.evalsha)
+
+        try:
+            return await evalsha(_SHAS[name], 1, key, *args)
+        except NoScriptError:
+            await _load_script(redis, name)
+            return await evalsha(_SHAS[name], 1, key, *args)
+
+    @staticmethod
+    async def _wait_for_release(
+        event: Optional[asyncio.Event], timeout: float, poll_delay: float
+    ) -> None:
+        """
+        Wait until the lock may be free or the timeout elapses.
+
+        Args:
+            event: Event from _LockNotifier.watch, None to poll
+            timeout: Maximum time to wait in seconds
+            poll_delay: Time to wait instead when notifications are unavailable
+        """
+        if event is None:
+            await asyncio.sleep(min(timeout, poll_delay))
+            return
+
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def __aenter__(self) -> bool:
         """Context manager entry."""
         acquired = await self.acquire()
         if not acquired:
             raise RuntimeError(f"Failed to acquire lock: {self.lock_name}")
         return acquired
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> bool:
         """Context manager exit."""
         await self.release()
         return False
 
+    async def is_locked(self) -> bool:
+        """
+        Check if the lock is currently held (by anyone).
+
+        This is a best-effort check, the lock state may change immediately
+        after.
+
+        Returns:
+            True if the lock key exists in Redis
+        """
+        count: int = await self.client.exists(self.lock_name)
+        return count > 0
+
+    @property
+    def owned(self) -> bool:
+        """
+        Whether this instance acquired the lock and hasn't released it.
+
+        Tracked locally without a Redis round-trip, so it doesn't notice the
+        lock expiring or being taken over after ownership was lost.
+        """
+        return self._owns_locally
+
+
+class _RenewalScheduler:
+    """
+    Renews every auto-renewed lock held on an event loop.
+
+    Instead of one renewal round-trip per lock, a single task wakes when the
+    earliest lock is due (at 1/3 of its timeout) and renews all registered
+    locks at once, with one pipelined round-trip per Redis client.
+    """
+
+    def __init__(self) -> None:
+        # Lock -> future resolved when the lock's ownership is lost
+        self._locks: dict[DistributedLock, asyncio.Future[None]] = {}
+        self._due: dict[DistributedLock, float] = {}
+        self._changed = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def add(self, lock: DistributedLock) -> asyncio.Future[None]:
+        """
+        Start renewing a lock.
+
+        Args:
+            lock: Acquired lock to keep renewed
+
+        Returns:
+            Future resolved when the lock can no longer be renewed
+        """
+        loop = asyncio.get_running_loop()
+        lost: asyncio.Future[None] = loop.create_future()
+        self._locks[lock] = lost
+        self._due[lock] = loop.time() + lock.timeout / 3  # Renew at 1/3 of timeout
+        self._changed.set()
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return lost
+
+    def remove(self, lock: DistributedLock) -> None:
+        """Stop renewing a lock."""
+        self._locks.pop(lock, None)
+        self._due.pop(lock, None)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while self._locks:
+            self._changed.clear()
+            delay = min(self._due.values()) - loop.time()
+            if delay > 0:
+                try:
+                    # Wake early if a lock is added, it may be due sooner
+                    await asyncio.wait_for(self._changed.wait(), delay)
+                    continue
+                except asyncio.TimeoutError:
+                    pass
+
+            now = loop.time()
+            by_client: dict[int, list[DistributedLock]] = {}
+            for lock in self._locks:
+                self._due[lock] = now + lock.timeout / 3
+                by_client.setdefault(id(lock.client), []).append(lock)
+
+            await asyncio.gather(*(self._renew(locks) for locks in by_client.values()))
+
+    async def _renew(self, locks: list[DistributedLock]) -> None:
+        """Renew locks sharing a client in one pipelined round-trip."""
+        client = locks[0].client
+        try:
+            redis = client.client
+            try:
+                results = await self._execute(redis, locks)
+            except NoScriptError:
+                await _load_script(redis, "renew")
+                results = await self._execute(redis, locks)
+        except Exception as e:
+            # Keep the locks registered and retry on the next tick
+            logger.error("Error renewing locks: %s", e)
+            return
+
+        for lock, result in zip(locks, results, strict=True):
+            if result:
+                logger.debug("Renewed lock: %s", lock.lock_name)
+                continue
+
+            lost = self._locks.get(lock)
+            if lost is not None and not lost.done():
+                lost.set_result(None)
+            self.remove(lock)
+
+    @staticmethod
+    async def _execute(redis: "Redis[bytes]", locks: list[DistributedLock]) -> list[Any]:
+        pipe = redis.pipeline(transaction=False)
+        for lock in locks:
+            pipe.evalsha(_SHAS["renew"], 1, lock._full_key, lock._value_bytes, lock.timeout)
+        return cast(list[Any], await pipe.execute())
+
+
+_renewal_schedulers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _RenewalScheduler]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _renewal_scheduler() -> _RenewalScheduler:
+    """Get the renewal scheduler for the running loop."""
+    loop = asyncio.get_running_loop()
+    scheduler = _renewal_schedulers.get(loop)
+    if scheduler is None:
+        scheduler = _renewal_schedulers[loop] = _RenewalScheduler()
+    return scheduler
+
+
+class _LockNotifier:
+    """
+    Wakes lock waiters sharing a Redis connection pool.
+
+    Instead of one pubsub connection per waiter, a single pattern
+    subscription covers every lock key under the client's prefix: the
+    channels the release script publishes to, plus keyspace events, which
+    also report expiry when the server has notify-keyspace-events enabled
+    (e.g. "Kgx"). One reader task sets the events of the waiters watching
+    the key named in each message, and the subscription is closed once
+    nothing waits.
+    """
+
+    def __init__(self, db: int, prefix: bytes) -> None:
+        self._keyspace = b"__keyspace@%d__:" % db
+        pattern = _glob_escape(prefix) + b"lock:*"
+        self._patterns = (pattern + b":free", self._keyspace + pattern)
+        # Lock key -> events of the waiters watching it
+        self._waiters: dict[bytes, set[asyncio.Event]] = {}
+        self._reader: Optional[asyncio.Task[None]] = None
+        self._starting = asyncio.Lock()
+
     @property
-    def locked(self) -> bool:
-        """Check if lock is currently held (by anyone)."""
-        # Note: This is a best-effort check, lock state may change immediately after
-        return asyncio.create_task(self.client.exists(self.lock_name)).result() > 0
+    def listening(self) -> bool:
+        """Whether notifications are currently being delivered."""
+        return self._reader is not None and not self._reader.done()
+
+    async def watch(self, client: RedisClient, key: bytes) -> Optional[asyncio.Event]:
+        """
+        Start watching a lock key, subscribing on first use.
+
+        Args:
+            client: Connected client to open the subscription with
+            key: Full (prefixed) lock key
+
+        Returns:
+            Event set whenever the lock may have been freed, or None if
+            subscribing failed
+        """
+        event = asyncio.Event()
+        self._waiters.setdefault(key, set()).add(event)
+
+        async with self._starting:
+            if self.listening:
+                return event
+
+            pubsub = None
+            try:
+                pubsub = client.client.pubsub()
+                await pubsub.psubscribe(*self._patterns)
+            except Exception as e:
+                logger.debug(f"Falling back to polling for lock notifications: {e}")
+                self.unwatch(key, event)
+                if pubsub is not None:
+                    await pubsub.aclose()  # type: ignore[attr-defined]
+                return None
+
+            self._reader = asyncio.create_task(self._read(pubsub))
+        return event
+
+    def unwatch(self, key: bytes, event: asyncio.Event) -> None:
+        """Stop watching a lock key, unsubscribing when nothing waits."""
+        events = self._waiters.get(key)
+        if events is not None:
+            events.discard(event)
+            if not events:
+                del self._waiters[key]
+
+        if not self._waiters and self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
+
+    async def _read(self, pubsub: PubSub) -> None:
+        try:
+            while True:
+                # Wait in bounded slices; None just means nothing arrived yet
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=60.0)
+                if message is None:
+                    continue
+                key = self._freed_key(message["channel"], message["data"])
+                if key is None:
+                    continue
+                for event in self._waiters.get(key, ()):
+                    event.set()
+        except Exception as e:
+            logger.debug(f"Lock notifications stopped: {e}")
+        finally:
+            # Let waiters retry now; they poll from here on
+            for events in self._waiters.values():
+                for event in events:
+                    event.set()
+            await pubsub.aclose()  # type: ignore[attr-defined]
+
+    def _freed_key(self, channel: Any, data: Any) -> Optional[bytes]:
+        """Map a notification to the lock key it frees, if any."""
+        name: bytes = channel.encode() if isinstance(channel, str) else channel
+        if isinstance(data, str):
+            data = data.encode()
+
+        if name.startswith(self._keyspace):
+            # Acquisitions and renewals show up too; only wake on removal
+            if data in (b"del", b"expired", b"evicted"):
+                return name[len(self._keyspace):]
+            return None
+        if name.endswith(b":free"):
+            return name[:-5]
+        return None
+
+
+def _glob_escape(value: bytes) -> bytes:
+    """Escape glob metacharacters for use in a PSUBSCRIBE pattern."""
+    for char in (b"\\", b"*", b"?", b"[", b"]"):
+        value = value.replace(char, b"\\" + char)
+    return value
+
+
+_Notifiers = dict[tuple[Any, ...], _LockNotifier]
+_lock_notifiers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _Notifiers]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _lock_notifier(client: RedisClient) -> _LockNotifier:
+    """Get the notifier shared by clients on the same pool, prefix and loop."""
+    loop = asyncio.get_running_loop()
+    notifiers = _lock_notifiers.setdefault(loop, {})
+    key = (client._pool_key, client._prefix_b)
+    notifier = notifiers.get(key)
+    if notifier is None:
+        notifier = notifiers[key] = _LockNotifier(client.config.db, client._prefix_b)
+    return notifier
 
 
 def with_lock(
@@ -228,7 +755,7 @@ def with_lock(
     lock_name: str,
     timeout: int = 10,
     blocking: bool = True,
-):
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """
     Decorator that acquires a distributed lock before executing function.
 
@@ -253,9 +780,9 @@ def with_lock(
         await generate_daily_report()
     """
 
-    def decorator(func: Callable):
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         @wraps(func)
-        async def wrapper(*args, **kwargs):
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
             lock = DistributedLock(client, lock_name, timeout=timeout)
 
             if not await lock.acquire(blocking=blocking):
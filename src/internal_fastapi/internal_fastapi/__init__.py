@@ -7,6 +7,7 @@ Provides FastAPI utilities for authentication, health checks, logging, and lifec
 from .api import (
     APIService,
     APIConfig,
+    APIConfigCore,
     Environment,
     FastAPISetup,
     LifecycleManager,
@@ -33,6 +34,7 @@ __all__ = [
     # API
     "APIService",
     "APIConfig",
+    "APIConfigCore",
     "Environment",
     "FastAPISetup",
     "LifecycleManager",
@@ -1,13 +1,14 @@
 """API module for internal_fastapi."""
 
 from .api_service import APIService
-from .config import APIConfig, Environment
+from .config import APIConfig, APIConfigCore, Environment
 from .fastapi import FastAPISetup
 from .lifecycle_manager import LifecycleManager
 
 __all__ = [
     "APIService",
     "APIConfig",
+    "APIConfigCore",
     "Environment",
     "FastAPISetup",
     "LifecycleManager",
@@ -4,8 +4,9 @@ API configuration models.
 Provides configuration models for FastAPI applications.
 """
 
+from dataclasses import dataclass
 from enum import Enum
-from typing import List
+from typing import Any, List, Tuple
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -21,6 +22,44 @@ class Environment(str, Enum):
         return self.value
 
 
+@dataclass(frozen=True, slots=True)
+class APIConfigCore:
+    """
+    Immutable, validated API configuration.
+
+    Lightweight counterpart of APIConfig used once configuration has been
+    parsed: plain slotted attributes instead of Pydantic model fields.
+    Defaults live on APIConfig only, so build it with APIConfig.to_core().
+
+    Example:
+        core = APIConfig(title="My API", port=8080).to_core()
+    """
+
+    enabled: bool
+    env: Environment
+    title: str
+    description: str
+    version: str
+    host: str
+    port: int
+    reload: bool
+    workers: int
+    debug: bool
+    cors_origins: Tuple[str, ...]
+
+    def __post_init__(self) -> None:
+        """
+        Validate port and worker count.
+
+        Raises:
+            ValueError: If port is out of range or worker count is invalid
+        """
+        if not 1 <= self.port <= 65535:
+            raise ValueError("Port must be between 1 and 65535")
+        if self.workers < 1:
+            raise ValueError("Workers must be at least 1")
+
+
 class APIConfig(BaseModel):
     """
     API configuration.
@@ -143,6 +182,51 @@ class APIConfig(BaseModel):
             raise ValueError("Workers must be at least 1")
         return v
 
+    @classmethod
+    def trusted(cls, **values: Any) -> "APIConfig":
+        """
+        Build a config from already-validated values, skipping validation.
+
+        Uses Pydantic's model_construct, so field validators (port and
+        worker checks) and enum value conversion don't run. Only use this
+        for values that came from a validated config, e.g. when cloning;
+        never for external input.
+
+        Args:
+            **values: Field values; missing fields get their defaults
+
+        Returns:
+            Unvalidated APIConfig
+
+        Example:
+            clone = APIConfig.trusted(**config.model_dump())
+        """
+        return cls.model_construct(**values)
+
+    def to_core(self) -> APIConfigCore:
+        """
+        Convert to an immutable APIConfigCore.
+
+        Returns:
+            Core configuration with the same values
+
+        Example:
+            core = APIConfig(title="My API").to_core()
+        """
+        return APIConfigCore(
+            enabled=self.enabled,
+            env=Environment(self.env),
+            title=self.title,
+            description=self.description,
+            version=self.version,
+            host=self.host,
+            port=self.port,
+            reload=self.reload,
+            workers=self.workers,
+            debug=self.debug,
+            cors_origins=tuple(self.cors_origins),
+        )
+
     class Config:
         """Pydantic configuration."""
         use_enum_values = True
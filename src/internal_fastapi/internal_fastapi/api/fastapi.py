@@ -4,12 +4,14 @@ FastAPI application setup and configuration.
 Provides utilities for setting up FastAPI applications with standard configuration.
 """
 
-from typing import Callable, Awaitable, List
+import re
+from typing import AbstractSet, Callable, Awaitable, List, Optional, Sequence, Union
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp
 
-from .config import APIConfig
+from .config import APIConfig, APIConfigCore
 from .lifecycle_manager import LifecycleManager
 
 try:
@@ -21,6 +23,59 @@ except ImportError:
     BackgroundServiceProtocol = None
 
 
+class FastCORSMiddleware(CORSMiddleware):
+    """
+    CORS middleware with constant-time origin checks.
+
+    Starlette checks the request origin against the allowed origins list
+    with a linear scan on every request. Here literal origins are kept in a
+    frozenset, and wildcard origins such as "https://*.example.com" are
+    compiled into a single regex (merged with allow_origin_regex if given).
+
+    Example:
+        app.add_middleware(
+            FastCORSMiddleware,
+            allow_origins=["https://app.example.com", "https://*.example.org"],
+        )
+    """
+
+    # A set instead of the base class's sequence, so origin checks are O(1)
+    allow_origins: AbstractSet[str]
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Sequence[str] = (),
+        allow_methods: Sequence[str] = ("GET",),
+        allow_headers: Sequence[str] = (),
+        allow_credentials: bool = False,
+        allow_origin_regex: Optional[str] = None,
+        expose_headers: Sequence[str] = (),
+        max_age: int = 600,
+    ) -> None:
+        literal = [origin for origin in allow_origins if origin == "*" or "*" not in origin]
+        patterns = [
+            re.escape(origin).replace(r"\*", "[A-Za-z0-9.-]+")
+            for origin in allow_origins
+            if origin != "*" and "*" in origin
+        ]
+        if allow_origin_regex is not None:
+            patterns.append(allow_origin_regex)
+        combined = "|".join(f"(?:{pattern})" for pattern in patterns) or None
+
+        super().__init__(
+            app,
+            allow_origins=literal,
+            allow_methods=allow_methods,
+            allow_headers=allow_headers,
+            allow_credentials=allow_credentials,
+            allow_origin_regex=combined,
+            expose_headers=expose_headers,
+            max_age=max_age,
+        )
+        self.allow_origins = frozenset(literal)
+
+
 class FastAPISetup:
     """
     FastAPI application setup and configuration.
@@ -67,17 +122,20 @@ class FastAPISetup:
 
     def __init__(
         self,
-        api_config: APIConfig,
+        api_config: Union[APIConfig, APIConfigCore],
         log_config: "LoggingConfig" = None,
-        setup_handler: Callable[[], Awaitable[List["BackgroundServiceProtocol"]]] = None
+        setup_handler: Callable[[], Awaitable[List["BackgroundServiceProtocol"]]] = None,
+        parallel: bool = False,
     ):
         """
         Initialize FastAPI setup.
 
         Args:
-            api_config: API configuration
+            api_config: API configuration (APIConfig or APIConfigCore)
             log_config: Logging configuration (optional)
             setup_handler: Service setup handler (optional)
+            parallel: Start and stop services concurrently instead of in
+                order. Only use this when services don't depend on each other.
 
         Example:
             api_config = APIConfig(title="My API", version="1.0.0")
@@ -87,10 +145,15 @@ class FastAPISetup:
                 return [MyService()]
 
             setup = FastAPISetup(api_config, log_config, setup)
+
+            # Independent services, start them all at once
+            setup = FastAPISetup(api_config, log_config, setup, parallel=True)
         """
         self.api_config = api_config
+        self._core = api_config.to_core() if isinstance(api_config, APIConfig) else api_config
         self.log_config = log_config
         self.setup_handler = setup_handler
+        self.parallel = parallel
 
         # Configure logging if available
         if configure_logging and log_config:
@@ -121,21 +184,21 @@ class FastAPISetup:
             uvicorn.run(app, host="0.0.0.0", port=8000)
         """
         # Create lifecycle manager
-        lifecycle_manager = LifecycleManager()
+        lifecycle_manager = LifecycleManager(parallel=self.parallel)
 
         # Create FastAPI app with lifespan
         app = FastAPI(
-            title=self.api_config.title,
-            description=self.api_config.description,
-            version=self.api_config.version,
-            debug=self.api_config.debug,
+            title=self._core.title,
+            description=self._core.description,
+            version=self._core.version,
+            debug=self._core.debug,
             lifespan=lifecycle_manager.fastapi_lifespan(self.setup_handler)
         )
 
         # Add CORS middleware
         app.add_middleware(
-            CORSMiddleware,
-            allow_origins=self.api_config.cors_origins,
+            FastCORSMiddleware,
+            allow_origins=self._core.cors_origins,
             allow_credentials=True,
             allow_methods=["*"],
             allow_headers=["*"],
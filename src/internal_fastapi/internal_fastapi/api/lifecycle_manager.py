@@ -7,8 +7,9 @@ Provides lifecycle management with signal handling and service coordination.
 import asyncio
 import signal
 import logging
-from typing import List, Callable, Awaitable, Optional, AsyncIterator
+from typing import List, Callable, Awaitable, Optional, AsyncIterator, Set
 from contextlib import asynccontextmanager
+from functools import partial
 
 from fastapi import FastAPI
 from internal_base import BackgroundServiceProtocol, ServiceState
@@ -57,16 +58,25 @@ class LifecycleManager:
         app = FastAPI(lifespan=manager.fastapi_lifespan(setup_services))
     """
 
-    def __init__(self):
+    def __init__(self, parallel: bool = False):
         """
         Initialize lifecycle manager.
 
+        Args:
+            parallel: Start and stop services concurrently instead of in
+                order. Only use this when services don't depend on each other.
+
         Example:
             manager = LifecycleManager()
+
+            # Independent services, start them all at once
+            manager = LifecycleManager(parallel=True)
         """
+        self._parallel = parallel
         self._services: List[BackgroundServiceProtocol] = []
         self._setup_handler: Optional[Callable[[], Awaitable[List[BackgroundServiceProtocol]]]] = None
         self._state = ServiceState.IDLE
+        self._shutdown_tasks: Set[asyncio.Task[None]] = set()
 
     def add_service(self, service: BackgroundServiceProtocol) -> None:
         """
@@ -118,11 +128,26 @@ class LifecycleManager:
         logger.info(f"Received signal {sig.name}, shutting down...")
         await self.stop()
 
+    def _schedule_shutdown(self, sig: signal.Signals) -> None:
+        """
+        Signal handler that runs _handle_shutdown in a background task.
+
+        The task is kept referenced until done so it can't be garbage
+        collected mid-shutdown, and so the lifespan can wait for it.
+
+        Args:
+            sig: Signal received
+        """
+        task = asyncio.create_task(self._handle_shutdown(sig))
+        self._shutdown_tasks.add(task)
+        task.add_done_callback(self._shutdown_tasks.discard)
+
     async def start(self) -> None:
         """
         Start all managed services.
 
-        Calls setup handler if configured, then starts all services in order.
+        Calls setup handler if configured, then starts all services in order
+        (or concurrently if the manager is parallel).
 
         Example:
             manager = LifecycleManager()
@@ -139,29 +164,50 @@ class LifecycleManager:
 
         try:
             # Call setup handler if configured
+            created: List[BackgroundServiceProtocol] = []
             if self._setup_handler:
                 logger.info("Calling setup handler...")
-                services = await self._setup_handler()
-                self._services.extend(services)
+                created = await self._setup_handler()
+
+            # Freeze the services to start, so services added while they
+            # start aren't picked up halfway through
+            services = tuple(self._services) + tuple(created)
+            self._services = list(services)
 
             # Start all services
-            for service in self._services:
-                logger.info(f"Starting service: {service}")
-                await service.start()
+            if self._parallel:
+                logger.info(f"Starting {len(services)} services concurrently")
+                results = await asyncio.gather(
+                    *(service.start() for service in services),
+                    return_exceptions=True,
+                )
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
+            else:
+                for service in services:
+                    logger.info(f"Starting service: {service}")
+                    await service.start()
 
             self._state = ServiceState.RUNNING
-            logger.info(f"Started {len(self._services)} services")
+            logger.info(f"Started {len(services)} services")
 
         except Exception as e:
             self._state = ServiceState.FAILED
             logger.error(f"Failed to start services: {e}", exc_info=True)
             raise
+        except BaseException:
+            # Cancelled or interrupted: don't stay STARTING, or start() would
+            # refuse to run again
+            self._state = ServiceState.FAILED
+            raise
 
     async def stop(self) -> None:
         """
         Stop all managed services.
 
-        Stops services in reverse order to handle dependencies correctly.
+        Stops services in reverse order to handle dependencies correctly (or
+        concurrently if the manager is parallel).
 
         Example:
             await manager.stop()
@@ -173,13 +219,23 @@ class LifecycleManager:
         self._state = ServiceState.STOPPING
         logger.info("Stopping lifecycle manager...")
 
-        # Stop services in reverse order
-        for service in reversed(self._services):
-            try:
-                logger.info(f"Stopping service: {service}")
-                await service.stop()
-            except Exception as e:
-                logger.error(f"Error stopping service {service}: {e}", exc_info=True)
+        if self._parallel:
+            services = list(reversed(self._services))
+            results = await asyncio.gather(
+                *(service.stop() for service in services),
+                return_exceptions=True,
+            )
+            for service, result in zip(services, results, strict=True):
+                if isinstance(result, BaseException):
+                    logger.error(f"Error stopping service {service}: {result}", exc_info=result)
+        else:
+            # Stop services in reverse order
+            for service in reversed(self._services):
+                try:
+                    logger.info(f"Stopping service: {service}")
+                    await service.stop()
+                except Exception as e:
+                    logger.error(f"Error stopping service {service}: {e}", exc_info=True)
 
         self._state = ServiceState.STOPPED
         logger.info("All services stopped")
@@ -257,10 +313,7 @@ class LifecycleManager:
 
             loop = asyncio.get_event_loop()
             for sig in (signal.SIGTERM, signal.SIGINT):
-                loop.add_signal_handler(
-                    sig,
-                    lambda s=sig: asyncio.create_task(manager._handle_shutdown(s))
-                )
+                loop.add_signal_handler(sig, partial(manager._schedule_shutdown, sig))
         """
         if setup_handler:
             self.set_setup_handler(setup_handler)
@@ -272,10 +325,7 @@ class LifecycleManager:
             registered_signals = []
 
             for sig in (signal.SIGTERM, signal.SIGINT):
-                loop.add_signal_handler(
-                    sig,
-                    lambda s=sig: asyncio.create_task(self._handle_shutdown(s))
-                )
+                loop.add_signal_handler(sig, partial(self._schedule_shutdown, sig))
                 registered_signals.append(sig)
 
             # Start services
@@ -292,6 +342,11 @@ class LifecycleManager:
                         # Signal handler might already be removed or loop closed
                         pass
 
+                # Let a signal-triggered shutdown finish before returning
+                pending = [task for task in self._shutdown_tasks if not task.done()]
+                if pending:
+                    await asyncio.gather(*pending, return_exceptions=True)
+
                 # Stop services
                 await self.stop()
 
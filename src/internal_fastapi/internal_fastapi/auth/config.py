@@ -34,6 +34,10 @@ class AppTokenConfig(BaseModel):
         )
     """
 
+    # Middleware derives lookup tables from these settings once, so they
+    # must not change afterwards
+    model_config = {"frozen": True}
+
     header_name: str = Field(
         default="X-App-Token",
         description="HTTP header name for token"
@@ -4,17 +4,185 @@ Token authentication middleware.
 Provides token-based authentication middleware for FastAPI.
 """
 
-import re
-from typing import Optional, Callable, Awaitable, Any
+import hashlib
+import hmac
+import json
+from functools import partial
+from typing import Optional, Callable, Awaitable, Any, Dict, FrozenSet, Iterable, List, Tuple
 
 from fastapi import FastAPI, Request, Response, Header
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from fastapi.security import APIKeyHeader
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from .config import AppTokenConfig
 
 
+def _glob_match(pattern: str, path: str) -> bool:
+    """
+    Match a path against a glob pattern (* and ?) in linear time.
+
+    Walks both strings once, remembering only the most recent * to retry
+    from on a mismatch, so no pattern can trigger exponential backtracking.
+    See https://research.swtch.com/glob.
+
+    Args:
+        pattern: Glob pattern
+        path: Request path
+
+    Returns:
+        True if the whole path matches the pattern
+    """
+    px = nx = 0
+    star_px = star_nx = -1
+    plen, nlen = len(pattern), len(path)
+
+    while px < plen or nx < nlen:
+        if px < plen:
+            char = pattern[px]
+            if char == "*":
+                # Try matching nothing first; retry one char later on mismatch
+                star_px, star_nx = px, nx + 1
+                px += 1
+                continue
+            if nx < nlen and (char == "?" or char == path[nx]):
+                px += 1
+                nx += 1
+                continue
+        if 0 <= star_px and star_nx <= nlen:
+            px, nx = star_px + 1, star_nx
+            star_nx += 1
+            continue
+        return False
+
+    return True
+
+
+def _compile_glob(pattern: str) -> Callable[[str], bool]:
+    """
+    Build a matcher for one glob exclude pattern.
+
+    Patterns with only * wildcards are split into literal segments and
+    matched with str.startswith/endswith/find; patterns using ? fall back
+    to _glob_match. Both run in linear time.
+
+    Args:
+        pattern: Glob pattern
+
+    Returns:
+        Function returning True if a path matches the pattern
+    """
+    if "?" in pattern:
+        return partial(_glob_match, pattern)
+
+    first, *middle, last = pattern.split("*")
+    min_len = len(first) + len(last)
+
+    def match(path: str) -> bool:
+        if len(path) < min_len or not path.startswith(first) or not path.endswith(last):
+            return False
+        # Leftmost match of each segment leaves the most room for the rest
+        pos, end = len(first), len(path) - len(last)
+        for segment in middle:
+            index = path.find(segment, pos, end)
+            if index < 0:
+                return False
+            pos = index + len(segment)
+        return True
+
+    return match
+
+
+def _compile_exclude_paths(
+    exclude_paths: Iterable[str]
+) -> Tuple[FrozenSet[str], Tuple[str, ...], Tuple[Callable[[str], bool], ...]]:
+    """
+    Split exclude paths into exact paths, prefixes and glob matchers.
+
+    Done once up front so requests only need a set lookup, a single
+    str.startswith call covering every "/prefix/*" pattern, and a
+    linear-time match for any other glob pattern.
+
+    Args:
+        exclude_paths: Paths to exclude, optionally with * and ? wildcards
+
+    Returns:
+        Tuple of (exact paths, path prefixes, glob matchers)
+    """
+    exact = frozenset(p for p in exclude_paths if "*" not in p and "?" not in p)
+    prefixes = []
+    globs = []
+    for pattern in sorted(exclude_paths):
+        if pattern in exact:
+            continue
+        head = pattern[:-1]
+        if pattern.endswith("*") and "*" not in head and "?" not in head:
+            prefixes.append(head)
+        else:
+            globs.append(_compile_glob(pattern))
+    return exact, tuple(prefixes), tuple(globs)
+
+
+def _error_body(message: str) -> Tuple[bytes, List[Tuple[bytes, bytes]]]:
+    """Encode a static JSON error body and its response headers."""
+    body = json.dumps({"error": message}, separators=(",", ":")).encode()
+    headers = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+    ]
+    return body, headers
+
+
+# Rejections are the hot path under scanner/bot traffic, so their bodies
+# are encoded once rather than per response
+_MISSING_TOKEN = _error_body("Missing authentication token")
+_INVALID_TOKEN = _error_body("Invalid authentication token")
+
+
+async def _send_unauthorized(send: Send, error: Tuple[bytes, List[Tuple[bytes, bytes]]]) -> None:
+    """Send a prebuilt 401 JSON response."""
+    body, headers = error
+    start: Message = {
+        "type": "http.response.start",
+        "status": 401,
+        # Copied, as outer middleware may modify the message's headers
+        "headers": list(headers),
+    }
+    await send(start)
+    await send({"type": "http.response.body", "body": body})
+
+
+_TokenIndex = Dict[bytes, Tuple[str, bytes]]
+
+
+def _index_tokens(tokens: Dict[str, str]) -> _TokenIndex:
+    """
+    Invert the app name -> token mapping, keeping the first app per token.
+
+    The index is keyed by the SHA-256 digest of each token rather than the
+    token itself, so the dict lookup's timing reveals nothing about how
+    much of a guessed token matches a real one.
+
+    Args:
+        tokens: Map of app names to tokens
+
+    Returns:
+        Map of token digest to (app name, token bytes)
+    """
+    index: _TokenIndex = {}
+    for app_name, token in tokens.items():
+        encoded = token.encode()
+        index.setdefault(hashlib.sha256(encoded).digest(), (app_name, encoded))
+    return index
+
+
+def _find_app(index: _TokenIndex, token: bytes) -> Optional[str]:
+    """Return the app owning a token, confirmed with a constant-time compare."""
+    entry = index.get(hashlib.sha256(token).digest())
+    if entry is not None and hmac.compare_digest(entry[1], token):
+        return entry[0]
+    return None
+
+
 class AppTokenAuth:
     """
     Token authentication handler.
@@ -40,6 +208,14 @@ class AppTokenAuth:
             return {"app": app_name}
     """
 
+    __slots__ = (
+        "settings",
+        "_exact_excludes",
+        "_prefix_excludes",
+        "_glob_matchers",
+        "_token_index",
+    )
+
     def __init__(self, settings: Optional[AppTokenConfig] = None):
         """
         Initialize token auth handler.
@@ -52,6 +228,14 @@ class AppTokenAuth:
             auth = AppTokenAuth(config)
         """
         self.settings = settings or AppTokenConfig()
+        (
+            self._exact_excludes,
+            self._prefix_excludes,
+            self._glob_matchers,
+        ) = _compile_exclude_paths(
+            self.settings.exclude_paths
+        )
+        self._token_index = _index_tokens(self.settings.tokens)
 
     async def __call__(
         self,
@@ -87,11 +271,7 @@ class AppTokenAuth:
             return None
 
         # Find app name for token
-        for app_name, token in self.settings.tokens.items():
-            if token == api_key:
-                return app_name
-
-        return None
+        return _find_app(self._token_index, api_key.encode())
 
     def _is_path_excluded(self, path: str) -> bool:
         """
@@ -110,45 +290,21 @@ class AppTokenAuth:
             # Glob pattern
             auth._is_path_excluded("/api/public/data")  # True if "/api/public/*" in exclude_paths
         """
-        for pattern in self.settings.exclude_paths:
-            if "*" in pattern or "?" in pattern:
-                # Glob pattern
-                regex = self._convert_pattern_to_regex(pattern)
-                if regex.match(path):
-                    return True
-            else:
-                # Exact match
-                if path == pattern:
-                    return True
-
-        return False
-
-    def _convert_pattern_to_regex(self, pattern: str) -> re.Pattern:
-        """
-        Convert glob pattern to regex.
-
-        Args:
-            pattern: Glob pattern
-
-        Returns:
-            Compiled regex pattern
-
-        Example:
-            regex = auth._convert_pattern_to_regex("/api/*/data")
-            regex.match("/api/users/data")  # Match
-        """
-        # Escape special regex chars except * and ?
-        pattern = re.escape(pattern)
-        # Convert glob wildcards to regex
-        pattern = pattern.replace(r"\*", ".*").replace(r"\?", ".")
-        return re.compile(f"^{pattern}$")
+        return (
+            path in self._exact_excludes
+            or path.startswith(self._prefix_excludes)
+            or any(match(path) for match in self._glob_matchers)
+        )
 
 
-class TokenAuthMiddleware(BaseHTTPMiddleware):
+class TokenAuthMiddleware:
     """
     Token authentication middleware.
 
     Middleware that validates tokens for all requests except excluded paths.
+    Implemented as plain ASGI middleware, so requests that pass through are
+    handed to the app unchanged instead of being wrapped in a
+    BaseHTTPMiddleware task and response stream.
 
     Example:
         from fastapi import FastAPI
@@ -172,9 +328,23 @@ class TokenAuthMiddleware(BaseHTTPMiddleware):
             return {"message": "You are authenticated!"}
     """
 
+    __slots__ = (
+        "app",
+        "settings",
+        "on_missing_token",
+        "on_invalid_token",
+        "_exact_excludes",
+        "_prefix_excludes",
+        "_glob_matchers",
+        "_token_index",
+        "_header_key",
+        "_always_pass",
+        "_has_globs",
+    )
+
     def __init__(
         self,
-        app: Any,
+        app: ASGIApp,
         settings: Optional[AppTokenConfig] = None,
         on_missing_token: Optional[Callable[[Request], Awaitable[Response]]] = None,
         on_invalid_token: Optional[Callable[[Request, str], Awaitable[Response]]] = None,
@@ -203,10 +373,24 @@ class TokenAuthMiddleware(BaseHTTPMiddleware):
                 on_missing_token=handle_missing
             )
         """
-        super().__init__(app)
+        self.app = app
         self.settings = settings or AppTokenConfig()
         self.on_missing_token = on_missing_token
         self.on_invalid_token = on_invalid_token
+        (
+            self._exact_excludes,
+            self._prefix_excludes,
+            self._glob_matchers,
+        ) = _compile_exclude_paths(
+            self.settings.exclude_paths
+        )
+        self._token_index = _index_tokens(self.settings.tokens)
+        self._header_key = self.settings.header_name.lower().encode("latin-1")
+
+        # Cheap checks first: skip everything when disabled, and the glob
+        # matchers when there are none
+        self._always_pass = not self.settings.enabled
+        self._has_globs = bool(self._glob_matchers)
 
         # Setup OpenAPI security scheme if FastAPI app
         if setup_openapi_schema and isinstance(app, FastAPI):
@@ -229,79 +413,76 @@ class TokenAuthMiddleware(BaseHTTPMiddleware):
             self.settings.enabled
         )
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        Dispatch request with token validation.
+        Handle an ASGI request with token validation.
 
         Args:
-            request: Request
-            call_next: Next middleware
-
-        Returns:
-            Response
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
 
         Example:
-            # Called automatically by FastAPI middleware system
-            response = await middleware.dispatch(request, call_next)
+            # Called automatically by the ASGI server for every request
+            await middleware(scope, receive, send)
         """
-        # Skip if disabled
-        if not self.settings.enabled:
-            return await call_next(request)
-
-        # Check if path is excluded
-        if self._is_path_excluded(request.url.path):
-            return await call_next(request)
-
-        # Get token from header
-        token = request.headers.get(self.settings.header_name.lower())
+        # Skip non-HTTP connections, disabled auth and excluded paths, with
+        # exact paths (typically health probes) checked before any globs
+        if self._always_pass or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        if (
+            path in self._exact_excludes
+            or path.startswith(self._prefix_excludes)
+            or (self._has_globs and any(match(path) for match in self._glob_matchers))
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        # Get token from header; ASGI header names are already lowercase
+        token = None
+        for key, value in scope["headers"]:
+            if key == self._header_key:
+                token = value
+                break
 
         # Missing token
         if not token:
             if self.on_missing_token:
-                return await self.on_missing_token(request)
-            return JSONResponse(
-                {"error": "Missing authentication token"},
-                status_code=401
-            )
+                response = await self.on_missing_token(Request(scope, receive))
+                await response(scope, receive, send)
+            else:
+                await _send_unauthorized(send, _MISSING_TOKEN)
+            return
 
         # Validate token
-        app_name = None
-        for name, valid_token in self.settings.tokens.items():
-            if token == valid_token:
-                app_name = name
-                break
+        app_name = _find_app(self._token_index, token)
 
         # Invalid token
         if not app_name:
             if self.on_invalid_token:
-                return await self.on_invalid_token(request, token)
-            return JSONResponse(
-                {"error": "Invalid authentication token"},
-                status_code=401
-            )
+                response = await self.on_invalid_token(
+                    Request(scope, receive), token.decode("latin-1")
+                )
+                await response(scope, receive, send)
+            else:
+                await _send_unauthorized(send, _INVALID_TOKEN)
+            return
 
         # Add app name to request state
-        request.state.app_name = app_name
+        scope.setdefault("state", {})["app_name"] = app_name
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
 
     def _is_path_excluded(self, path: str) -> bool:
         """Check if path is excluded from authentication."""
-        for pattern in self.settings.exclude_paths:
-            if "*" in pattern or "?" in pattern:
-                # Glob pattern
-                regex_pattern = re.escape(pattern).replace(r"\*", ".*").replace(r"\?", ".")
-                if re.match(f"^{regex_pattern}$", path):
-                    return True
-            else:
-                # Exact match
-                if path == pattern:
-                    return True
-        return False
+        return (
+            path in self._exact_excludes
+            or path.startswith(self._prefix_excludes)
+            or any(match(path) for match in self._glob_matchers)
+        )
 
 
 def add_api_key_security_scheme(
@@ -328,16 +509,34 @@ def add_api_key_security_scheme(
     if not enabled:
         return
 
-    # Add security scheme to OpenAPI schema
-    if app.openapi_schema:
-        app.openapi_schema["components"]["securitySchemes"] = {
+    def patch(schema: Dict[str, Any]) -> None:
+        schema.setdefault("components", {})["securitySchemes"] = {
             "APIKeyHeader": {
                 "type": "apiKey",
                 "in": "header",
                 "name": header_name
             }
         }
-        app.openapi_schema["security"] = [{"APIKeyHeader": []}]
+        schema["security"] = [{"APIKeyHeader": []}]
+
+    # Patch a schema that was already generated
+    if app.openapi_schema:
+        patch(app.openapi_schema)
+
+    # FastAPI only generates the schema on the first /openapi.json request,
+    # so also patch it then, once; it is cached in app.openapi_schema
+    generate = app.openapi
+
+    def openapi() -> Dict[str, Any]:
+        if app.openapi_schema:
+            return app.openapi_schema
+        schema = generate()
+        patch(schema)
+        app.openapi_schema = schema
+        return schema
+
+    # Replacing the bound method is FastAPI's documented way to customize the schema
+    app.openapi = openapi  # type: ignore[method-assign]
 
 
 def setup_token_auth(
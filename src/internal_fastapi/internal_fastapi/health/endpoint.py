@@ -6,9 +6,10 @@ Provides health check functionality for FastAPI applications.
 
 import asyncio
 import inspect
+import time
 from typing import Optional, List, Tuple, Dict, Any, Callable, Union, Awaitable
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from pydantic import BaseModel
 
 
@@ -40,6 +41,30 @@ def asyncio_is_coroutine_function(func: Callable) -> bool:
     return asyncio.iscoroutinefunction(func) or inspect.iscoroutinefunction(func)
 
 
+def _check_error(e: Exception) -> Dict[str, Any]:
+    """Build the result reported for a check that raised."""
+    return {
+        "status": "error",
+        "error": str(e)
+    }
+
+
+def _run_sync_check(check_func: HealthCheckFunc) -> Any:
+    """Run a sync check, reporting exceptions as an error result."""
+    try:
+        return check_func()
+    except Exception as e:
+        return _check_error(e)
+
+
+async def _run_async_check(check_func: HealthCheckFunc) -> Any:
+    """Run an async check, reporting exceptions as an error result."""
+    try:
+        return await check_func()
+    except Exception as e:
+        return _check_error(e)
+
+
 class HealthResponse(BaseModel):
     """
     Health check response model.
@@ -89,13 +114,20 @@ class HealthCheck:
         # GET /health -> {"status": "healthy", "details": {"database": {...}, "cache": {...}}}
     """
 
-    def __init__(self, app: Optional[FastAPI] = None, path: str = "/health"):
+    def __init__(
+        self,
+        app: Optional[FastAPI] = None,
+        path: str = "/health",
+        cache_ttl: float = 1.0
+    ):
         """
         Initialize health check manager.
 
         Args:
             app: FastAPI application (optional, can add later)
             path: Health check endpoint path
+            cache_ttl: Seconds to reuse a healthy response before running
+                the checks again (0 disables caching)
 
         Example:
             health = HealthCheck(app, path="/health")
@@ -103,9 +135,16 @@ class HealthCheck:
             # Or create without app
             health = HealthCheck(path="/healthz")
             # Later: health.add_to_app(app)
+
+            # Always run the checks
+            health = HealthCheck(app, cache_ttl=0)
         """
         self.path = path
-        self.checks: List[Tuple[str, HealthCheckFunc]] = []
+        self.cache_ttl = cache_ttl
+        # (monotonic time, encoded body) of the last healthy response
+        self._cached: Optional[Tuple[float, bytes]] = None
+        # (name, check function, whether it is a coroutine function)
+        self.checks: List[Tuple[str, HealthCheckFunc, bool]] = []
 
         if app:
             self.add_to_app(app)
@@ -132,7 +171,9 @@ class HealthCheck:
 
             health.add_check("redis", redis_check)
         """
-        self.checks.append((name, check_func))
+        # Inspect once here rather than on every health request
+        self.checks.append((name, check_func, asyncio_is_coroutine_function(check_func)))
+        self._cached = None
 
     def add_to_app(self, app: FastAPI, include_in_schema: bool = False) -> None:
         """
@@ -148,37 +189,47 @@ class HealthCheck:
             health.add_check("db", check_db)
             health.add_to_app(app, include_in_schema=False)
         """
+        # The body is returned pre-serialized; response_model still documents
+        # it as HealthResponse in the OpenAPI schema
         @app.get(
             self.path,
             response_model=HealthResponse,
             include_in_schema=include_in_schema,
             tags=["health"]
         )
-        async def health_check() -> HealthResponse:
+        async def health_check() -> Response:
             """
             Health check endpoint.
 
+            Healthy responses are encoded once and reused for cache_ttl
+            seconds, so frequent probes don't rerun checks or serialization.
+
             Returns:
                 Health status with check details
             """
-            details = {}
-
-            # Run all checks
-            for name, check_func in self.checks:
-                try:
-                    # Call sync or async check
-                    if asyncio_is_coroutine_function(check_func):
-                        result = await check_func()
-                    else:
-                        result = check_func()
-
-                    details[name] = result
-
-                except Exception as e:
-                    details[name] = {
-                        "status": "error",
-                        "error": str(e)
-                    }
+            cached = self._cached
+            if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+                return Response(content=cached[1], media_type="application/json")
+
+            checks = self.checks
+            results: List[Any] = [None] * len(checks)
+
+            # Run sync checks inline and async checks concurrently
+            pending = []
+            for index, (_, check_func, is_async) in enumerate(checks):
+                if is_async:
+                    pending.append(index)
+                else:
+                    results[index] = _run_sync_check(check_func)
+
+            if pending:
+                gathered = await asyncio.gather(
+                    *(_run_async_check(checks[index][1]) for index in pending)
+                )
+                for index, result in zip(pending, gathered, strict=True):
+                    results[index] = result
+
+            details = {name: result for (name, _, _), result in zip(checks, results, strict=True)}
 
             # Determine overall status
             status = "healthy"
@@ -189,14 +240,21 @@ class HealthCheck:
                         status = "unhealthy"
                         break
 
-            return HealthResponse(status=status, details=details)
+            body = HealthResponse(status=status, details=details).model_dump_json().encode()
+            if status == "healthy" and self.cache_ttl > 0:
+                self._cached = (time.monotonic(), body)
+            else:
+                self._cached = None
+
+            return Response(content=body, media_type="application/json")
 
 
 def create_health_endpoint(
     app: FastAPI,
     path: str = "/health",
     include_in_schema: bool = False,
-    checks: Optional[List[Tuple[str, HealthCheckFunc]]] = None
+    checks: Optional[List[Tuple[str, HealthCheckFunc]]] = None,
+    cache_ttl: float = 1.0
 ) -> HealthCheck:
     """
     Create and register health check endpoint.
@@ -208,6 +266,7 @@ def create_health_endpoint(
         path: Health check endpoint path
         include_in_schema: Include in OpenAPI schema
         checks: Initial list of (name, check_func) tuples
+        cache_ttl: Seconds to reuse a healthy response (0 disables caching)
 
     Returns:
         HealthCheck instance
@@ -242,7 +301,7 @@ def create_health_endpoint(
 
         health.add_check("external_api", check_external_api)
     """
-    health = HealthCheck(path=path)
+    health = HealthCheck(path=path, cache_ttl=cache_ttl)
 
     # Add initial checks
     if checks:
@@ -6,20 +6,28 @@ Provides middleware for logging HTTP requests and responses.
 
 import time
 import logging
-from typing import Callable
+from typing import Iterable, Optional
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
 logger = logging.getLogger(__name__)
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+def _format_duration(elapsed_ns: int) -> str:
+    """Format a perf_counter_ns interval as milliseconds with one decimal."""
+    tenths = elapsed_ns // 100_000
+    return f"{tenths // 10}.{tenths % 10}ms"
+
+
+class LoggingMiddleware:
     """
     Request/response logging middleware.
 
-    Logs HTTP requests and responses with timing information.
+    Logs HTTP requests and responses with timing information. Implemented
+    as plain ASGI middleware, so the response is streamed straight through
+    rather than via a BaseHTTPMiddleware task and memory stream.
 
     Example:
         from fastapi import FastAPI
@@ -35,66 +43,99 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         # Logs:
         # INFO - Request: GET /users from 127.0.0.1
         # INFO - Response: GET /users - 200 OK (15.2ms)
+
+        # Pass probe traffic straight through, unlogged
+        app.add_middleware(LoggingMiddleware, exclude_paths={"/health"})
     """
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint
-    ) -> Response:
+    __slots__ = ("app", "_exclude_paths")
+
+    def __init__(self, app: ASGIApp, exclude_paths: Optional[Iterable[str]] = None):
         """
-        Dispatch request with logging.
+        Initialize logging middleware.
 
         Args:
-            request: FastAPI request
-            call_next: Next middleware
+            app: Next ASGI application
+            exclude_paths: Exact paths (e.g. health probes) handed straight
+                to the app without logging or timing
+
+        Example:
+            app.add_middleware(LoggingMiddleware, exclude_paths={"/health"})
+        """
+        self.app = app
+        self._exclude_paths = frozenset(exclude_paths or ())
 
-        Returns:
-            Response with timing header
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle an ASGI request with logging.
+
+        Logs the request, then the response once its headers are sent, and
+        adds an X-Process-Time header with the time taken until then.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
 
         Example:
-            # Called automatically by FastAPI middleware system
-            # Logs request and response with timing
-            response = await middleware.dispatch(request, call_next)
+            # Called automatically by the ASGI server for every request
+            await middleware(scope, receive, send)
         """
-        # Get client info
-        client_host = request.client.host if request.client else "unknown"
+        if scope["type"] != "http" or scope["path"] in self._exclude_paths:
+            await self.app(scope, receive, send)
+            return
 
-        # Log request
-        logger.info(
-            f"Request: {request.method} {request.url.path} "
-            f"from {client_host}"
-        )
+        method = scope["method"]
+        path = scope["path"]
 
-        # Track timing
-        start_time = time.time()
+        # Checked per request (the logging module caches it) so level
+        # changes take effect, but skips all log formatting when INFO is off
+        log_info = logger.isEnabledFor(logging.INFO)
 
-        try:
-            # Process request
-            response = await call_next(request)
+        if log_info:
+            # Get client info
+            client = scope.get("client")
+            client_host = client[0] if client else "unknown"
 
-            # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
+            # Log request
+            logger.info("Request: %s %s from %s", method, path, client_host)
 
-            # Log response
-            logger.info(
-                f"Response: {request.method} {request.url.path} - "
-                f"{response.status_code} ({duration_ms:.1f}ms)"
-            )
+        # Track timing (monotonic, unaffected by wall-clock adjustments)
+        start_time = time.perf_counter_ns()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Calculate duration
+                duration = _format_duration(time.perf_counter_ns() - start_time)
 
-            # Add timing header
-            response.headers["X-Process-Time"] = f"{duration_ms:.1f}ms"
+                # Log response
+                if log_info:
+                    logger.info(
+                        "Response: %s %s - %s (%s)", method, path, message["status"], duration
+                    )
 
-            return response
+                # Add timing header
+                headers = MutableHeaders(scope=message)
+                headers["X-Process-Time"] = duration
+
+            await send(message)
+
+        try:
+            # Process request
+            await self.app(scope, receive, send_with_timing)
 
         except Exception as e:
             # Calculate duration for error case
-            duration_ms = (time.time() - start_time) * 1000
+            duration = _format_duration(time.perf_counter_ns() - start_time)
 
             # Log error
             logger.error(
-                f"Error: {request.method} {request.url.path} - "
-                f"{type(e).__name__}: {e} ({duration_ms:.1f}ms)",
+                "Error: %s %s - %s: %s (%s)",
+                method,
+                path,
+                type(e).__name__,
+                e,
+                duration,
                 exc_info=True
             )
 
@@ -4,9 +4,10 @@ internal_http - HTTP client utilities package.
 Provides async HTTP client with authentication, retry logic, and Pydantic model support.
 """
 
-from .auth import AuthBase, BearerAuth, BasicAuth, ApiKeyAuth
-from .models import RetryConfig, AuthConfig
-from .client import HttpClient, HttpClientError
+from .auth import AuthBase, BearerAuth, BasicAuth, ApiKeyAuth, RefreshingAuth
+from .models import RetryConfig, AuthConfig, DEFAULT_RETRY_CONFIG
+from .client import HttpClient, HttpClientError, close_all
+from .loop import install_uvloop
 
 __all__ = [
     # Auth
@@ -14,10 +15,15 @@ __all__ = [
     "BearerAuth",
     "BasicAuth",
     "ApiKeyAuth",
+    "RefreshingAuth",
     # Models
     "RetryConfig",
     "AuthConfig",
+    "DEFAULT_RETRY_CONFIG",
     # Client
     "HttpClient",
     "HttpClientError",
+    "close_all",
+    # Event loop
+    "install_uvloop",
 ]
@@ -1,5 +1,5 @@
 """Auth module for internal_http."""
 
-from .auth import AuthBase, BearerAuth, BasicAuth, ApiKeyAuth
+from .auth import AuthBase, BearerAuth, BasicAuth, ApiKeyAuth, RefreshingAuth
 
-__all__ = ["AuthBase", "BearerAuth", "BasicAuth", "ApiKeyAuth"]
+__all__ = ["AuthBase", "BearerAuth", "BasicAuth", "ApiKeyAuth", "RefreshingAuth"]
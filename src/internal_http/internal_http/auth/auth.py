@@ -5,13 +5,15 @@ Provides various authentication mechanisms compatible with httpx.
 """
 
 import base64
-from typing import Optional
+from typing import Any, Callable, Generator, Optional
 import httpx
 
 
 class AuthBase:
     """Base authentication class."""
 
+    __slots__ = ()
+
     def auth_flow(self, request: httpx.Request) -> httpx.Request:
         """
         Apply authentication to request.
@@ -34,6 +36,8 @@ class AuthBase:
 class BearerAuth(AuthBase):
     """Bearer token authentication."""
 
+    __slots__ = ("token",)
+
     def __init__(self, token: str):
         """
         Initialize Bearer authentication.
@@ -52,6 +56,10 @@ class BearerAuth(AuthBase):
         """
         self.token = token
 
+    def with_token(self, token: str) -> "BearerAuth":
+        """Return the same authentication with a new token."""
+        return BearerAuth(token)
+
     def auth_flow(self, request: httpx.Request) -> httpx.Request:
         """Apply Bearer token to Authorization header."""
         request.headers["Authorization"] = f"Bearer {self.token}"
@@ -61,6 +69,8 @@ class BearerAuth(AuthBase):
 class BasicAuth(AuthBase):
     """HTTP Basic authentication."""
 
+    __slots__ = ("_username", "_password", "_auth_header")
+
     def __init__(self, username: str, password: str):
         """
         Initialize Basic authentication.
@@ -76,20 +86,46 @@ class BasicAuth(AuthBase):
             async_client = httpx.AsyncClient(base_url="https://api.example.com")
             client = HttpClient(client=async_client, auth_config=AuthConfig(auth=auth))
         """
-        self.username = username
-        self.password = password
+        self._username = username
+        self._password = password
+        self._encode()
+
+    def _encode(self) -> None:
+        """Encode the credentials once instead of on every request."""
+        encoded = base64.b64encode(f"{self._username}:{self._password}".encode()).decode()
+        self._auth_header = f"Basic {encoded}"
+
+    @property
+    def username(self) -> str:
+        """Username; setting it re-encodes the header value."""
+        return self._username
+
+    @username.setter
+    def username(self, username: str) -> None:
+        self._username = username
+        self._encode()
+
+    @property
+    def password(self) -> str:
+        """Password; setting it re-encodes the header value."""
+        return self._password
+
+    @password.setter
+    def password(self, password: str) -> None:
+        self._password = password
+        self._encode()
 
     def auth_flow(self, request: httpx.Request) -> httpx.Request:
         """Apply Basic auth to Authorization header."""
-        credentials = f"{self.username}:{self.password}"
-        encoded = base64.b64encode(credentials.encode()).decode()
-        request.headers["Authorization"] = f"Basic {encoded}"
+        request.headers["Authorization"] = self._auth_header
         return request
 
 
 class ApiKeyAuth(AuthBase):
     """API key authentication."""
 
+    __slots__ = ("api_key", "header_name", "prefix")
+
     def __init__(
         self,
         api_key: str,
@@ -119,8 +155,71 @@ class ApiKeyAuth(AuthBase):
         self.header_name = header_name
         self.prefix = prefix
 
+    def with_token(self, token: str) -> "ApiKeyAuth":
+        """Return the same authentication with a new API key."""
+        return ApiKeyAuth(token, self.header_name, self.prefix)
+
     def auth_flow(self, request: httpx.Request) -> httpx.Request:
         """Apply API key to custom header."""
         value = f"{self.prefix} {self.api_key}" if self.prefix else self.api_key
         request.headers[self.header_name] = value
         return request
+
+
+class RefreshingAuth(httpx.Auth):
+    """
+    httpx auth that refreshes the token once when a request gets a 401.
+
+    Wraps one of the auth strategies above; HttpClient uses it when
+    AuthConfig has a refresh_callback.
+    """
+
+    def __init__(self, auth: Any, refresh_callback: Callable[[], str]):
+        """
+        Initialize refreshing authentication.
+
+        Args:
+            auth: Authentication applied to requests (BearerAuth, ApiKeyAuth,
+                or any httpx.Auth)
+            refresh_callback: Callback returning a new token. Auth types with a
+                with_token() method keep their kind; others become BearerAuth.
+
+        Example:
+            auth = RefreshingAuth(BearerAuth(load_token()), refresh_callback=load_token)
+            async_client = httpx.AsyncClient(base_url="https://api.example.com", auth=auth)
+        """
+        self.auth = auth
+        self.refresh_callback = refresh_callback
+
+    @staticmethod
+    def _send(auth: Any, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, httpx.Response]:
+        """Apply auth to the request, send it and return the final response."""
+        if isinstance(auth, httpx.Auth):
+            # httpx auth is itself a flow and may send more than one request
+            flow = auth.auth_flow(request)
+            request = next(flow)
+            while True:
+                response = yield request
+                try:
+                    request = flow.send(response)
+                except StopIteration:
+                    return response
+
+        auth.auth_flow(request)
+        return (yield request)
+
+    def auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
+        """Send the request, refreshing the token and resending it once on a 401."""
+        auth = self.auth
+        response = yield from self._send(auth, request)
+
+        if response.status_code != 401:
+            return
+
+        # Another request may have refreshed the token while this one was in flight
+        if self.auth is auth:
+            token = self.refresh_callback()
+            with_token = getattr(auth, "with_token", None)
+            self.auth = with_token(token) if with_token else BearerAuth(token)
+
+        yield from self._send(self.auth, request)
@@ -1,5 +1,5 @@
 """Client module for internal_http."""
 
-from .http_client import HttpClient, HttpClientError
+from .http_client import HttpClient, HttpClientError, close_all
 
-__all__ = ["HttpClient", "HttpClientError"]
+__all__ = ["HttpClient", "HttpClientError", "close_all"]
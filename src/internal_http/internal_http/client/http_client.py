@@ -8,19 +8,71 @@ and application lifecycle management.
 import asyncio
 import logging
 import random
-from typing import Any, Dict, Optional, Type, TypeVar, Union
+import weakref
+from functools import partialmethod
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar, Union
 
 import httpx
 from internal_base import AsyncService, ServiceState
 from pydantic import BaseModel
 
-from ..models.config import AuthConfig, RetryConfig
+from ..auth.auth import RefreshingAuth
+from ..models.config import DEFAULT_AUTH_CONFIG, DEFAULT_RETRY_CONFIG, AuthConfig, RetryConfig
 
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T', bound=BaseModel)
 
+# Redirects that may be cached, and the methods and number of URLs cached per client
+_PERMANENT_REDIRECTS = frozenset({301, 308})
+_REDIRECT_CACHE_METHODS = frozenset({"GET", "HEAD"})
+_REDIRECT_CACHE_SIZE = 256
+
+# Methods whose concurrent identical requests may share one response
+_COALESCE_METHODS = frozenset({"GET", "HEAD"})
+
+# AsyncClients shared by HttpClient instances that do not inject their own,
+# keyed by connection settings. Clients are kept per event loop because
+# pooled connections cannot cross loops.
+_ClientKey = Tuple[Any, ...]
+_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[_ClientKey, httpx.AsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_shared_client(key: _ClientKey, **client_kwargs: Any) -> httpx.AsyncClient:
+    """
+    Get the AsyncClient shared for these connection settings.
+
+    Args:
+        key: Hashable connection settings identifying the client
+        **client_kwargs: Arguments used to create the client if none is open
+
+    Returns:
+        Shared AsyncClient for the running event loop
+    """
+    clients = _CLIENTS.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(key)
+
+    # Creating the client never awaits, so no lock is needed around this
+    if client is None or client.is_closed:
+        client = clients[key] = httpx.AsyncClient(**client_kwargs)
+
+    return client
+
+
+async def close_all() -> None:
+    """
+    Close every shared AsyncClient created on the running event loop.
+
+    Call this on application shutdown; HttpClient instances using a shared
+    client leave it open when they stop.
+    """
+    clients = _CLIENTS.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
+
 
 class HttpClientError(Exception):
     """HTTP client exception."""
@@ -51,7 +103,11 @@ class HttpClient(AsyncService):
     Example:
         from internal_http import HttpClient, BearerAuth, AuthConfig, RetryConfig
 
-        # Simple usage
+        # Shared client, reused by every HttpClient with the same settings
+        client = HttpClient(base_url="https://api.example.com")
+        response = await client.get("/users")
+
+        # Injected client owned by this instance
         async_client = httpx.AsyncClient(base_url="https://api.example.com")
         async with HttpClient(client=async_client) as client:
             response = await client.get("/users")
@@ -76,88 +132,174 @@ class HttpClient(AsyncService):
 
     def __init__(
         self,
-        client: httpx.AsyncClient,
+        client: Optional[httpx.AsyncClient] = None,
         retries: Optional[Union[int, RetryConfig]] = None,
         auth_config: Optional[AuthConfig] = None,
         default_headers: Optional[Dict[str, str]] = None,
         name: Optional[str] = None,
+        base_url: str = "",
+        timeout: Union[float, httpx.Timeout] = 10.0,
+        verify_ssl: bool = True,
+        follow_redirects: bool = False,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 300.0,
+        http2: bool = False,
     ):
         """
         Initialize HTTP client.
 
         Args:
-            client: Injected AsyncClient instance managed through this service lifecycle
+            client: Injected AsyncClient instance managed through this service lifecycle.
+                When omitted, a client shared by all instances with the same
+                base_url, timeout, verify_ssl and follow_redirects is used.
             retries: Retry configuration (int for simple retry count, or RetryConfig)
             auth_config: Authentication configuration
             default_headers: Default headers for all requests
             name: Optional lifecycle service name
+            base_url: Base URL of the shared client
+            timeout: Timeout of the shared client
+            verify_ssl: Whether the shared client verifies TLS certificates
+            follow_redirects: Whether the shared client follows redirects. Off by
+                default so redirects are not silently paid for; when followed,
+                same-origin permanent (301/308) redirects of GET/HEAD URLs are
+                cached and later calls go straight to the target.
+            max_connections: Connection pool size of the shared client
+            max_keepalive_connections: Idle connections the shared client keeps open
+            keepalive_expiry: Seconds an idle connection of the shared client is kept
+            http2: Let the shared client negotiate HTTP/2, multiplexing concurrent
+                requests over one connection. Requires the http2 extra (h2).
         """
         super().__init__(name=name)
         self._client = client
-        self.auth_config = auth_config or AuthConfig()
+        self._shared = client is None
+        self._client_kwargs = {
+            "base_url": base_url,
+            "timeout": timeout,
+            "verify": verify_ssl,
+            "follow_redirects": follow_redirects,
+            "limits": httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            "http2": http2,
+        }
+        timeout_key = tuple(timeout.as_dict().items()) if isinstance(timeout, httpx.Timeout) else timeout
+        self._client_key = (
+            base_url,
+            timeout_key,
+            verify_ssl,
+            follow_redirects,
+            max_connections,
+            max_keepalive_connections,
+            keepalive_expiry,
+            http2,
+        )
+        self.auth_config = auth_config or DEFAULT_AUTH_CONFIG
+        self._auth = self._build_auth(self.auth_config)
         self.default_headers = default_headers or {}
+        # Built once and reused for every request without per-call headers
+        self._default_headers = httpx.Headers(self.default_headers)
+        # URL -> target of a permanent redirect followed for it
+        self._redirect_cache: Dict[str, str] = {}
+        # Requests sent with coalesce=True that are still in flight
+        self._inflight: Dict[Tuple[Any, ...], "asyncio.Future[httpx.Response]"] = {}
 
         # Setup retry config
         if isinstance(retries, int):
             self.retry_config = RetryConfig(max_attempts=retries)
         elif isinstance(retries, RetryConfig):
             self.retry_config = retries
-        elif retries is None:
-            self.retry_config = RetryConfig()
         else:
-            self.retry_config = RetryConfig()
+            self.retry_config = DEFAULT_RETRY_CONFIG
+
+        # Hashed once so _should_retry does O(1) lookups per response
+        self._retry_status_set = frozenset(self.retry_config.retry_statuses)
+        self._retry_method_set = frozenset(m.upper() for m in self.retry_config.retry_methods)
+
+        # Backoff before each retry, before jitter: backoff_factor * 2 ** attempt
+        self._delays = tuple(
+            self.retry_config.backoff_factor * (1 << attempt)
+            for attempt in range(self.retry_config.max_attempts)
+        )
 
     async def _start(self) -> None:
         """Start the HTTP client service."""
-        if self._client.is_closed:
+        if self._shared:
+            self._client = _get_shared_client(self._client_key, **self._client_kwargs)
+        elif self._client is None or self._client.is_closed:
             raise RuntimeError("Injected HTTP client is already closed")
 
     async def _stop(self) -> None:
-        """Stop the HTTP client service and release resources."""
-        if not self._client.is_closed:
-            await self._client.aclose()
+        """Stop the HTTP client service, closing an injected client."""
+        client = self._client
+        if not self._shared and client is not None and not client.is_closed:
+            await client.aclose()
 
     async def _health_check(self) -> bool:
         """Check whether the underlying client is available."""
-        return not self._client.is_closed
+        return self._client is not None and not self._client.is_closed
 
     async def close(self) -> None:
         """Close the HTTP client and clean up resources."""
         if self.state in (ServiceState.IDLE, ServiceState.STOPPED):
-            if not self._client.is_closed:
-                await self._client.aclose()
+            client = self._client
+            if not self._shared and client is not None and not client.is_closed:
+                await client.aclose()
             return
 
         await self.stop()
 
     async def _ensure_client(self) -> httpx.AsyncClient:
-        """Ensure a managed or injected client is available."""
+        """Ensure a shared or injected client is available."""
         if self.state != ServiceState.RUNNING:
             await self.start()
 
-        if self._client.is_closed:
-            raise RuntimeError("Injected HTTP client is already closed")
+        client = self._client
+        if client is None or client.is_closed:
+            if not self._shared:
+                raise RuntimeError("Injected HTTP client is already closed")
+            # The shared client was closed by close_all(); get a fresh one
+            client = self._client = _get_shared_client(self._client_key, **self._client_kwargs)
+
+        return client
+
+    @staticmethod
+    def _build_auth(auth_config: AuthConfig) -> Any:
+        """
+        Build the auth passed to httpx for every request.
 
-        return self._client
+        Args:
+            auth_config: Authentication configuration
 
-    @property
-    async def client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        return await self._ensure_client()
+        Returns:
+            httpx auth, or httpx.USE_CLIENT_DEFAULT when none is configured
+        """
+        auth = auth_config.auth
+        if not auth:
+            return httpx.USE_CLIENT_DEFAULT
+        if auth_config.refresh_callback:
+            return RefreshingAuth(auth, auth_config.refresh_callback)
+        if isinstance(auth, httpx.Auth):
+            return auth
+        # httpx calls plain functions with the request and sends what they return
+        return auth.auth_flow
 
     def _should_retry(self, method: str, response: httpx.Response) -> bool:
         """
         Check if request should be retried based on response.
 
         Args:
+            method: HTTP method
             response: HTTP response
 
         Returns:
             True if should retry
         """
         return (
-            method.upper() in self.retry_config.retry_methods
-            and response.status_code in self.retry_config.retry_statuses
+            response.status_code in self._retry_status_set
+            and method.upper() in self._retry_method_set
         )
 
     def _prepare_request(
@@ -165,54 +307,82 @@ class HttpClient(AsyncService):
         method: str,
         url: str,
         headers: Optional[Dict[str, str]] = None,
-        **kwargs: Any
+        extra: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
-        Prepare request with headers and auth.
+        Prepare request with headers.
 
         Args:
             method: HTTP method
             url: Request URL
             headers: Request headers
-            **kwargs: Additional request parameters
+            extra: Additional request parameters
 
         Returns:
             Prepared request parameters
         """
-        # Merge headers
-        merged_headers = {**self.default_headers}
+        merged_headers = self._default_headers
         if headers:
+            merged_headers = httpx.Headers(merged_headers)
             merged_headers.update(headers)
 
-        # Apply auth if configured
-        if self.auth_config.auth:
-            # Create a temporary request to apply auth
-            temp_request = httpx.Request(method, url, headers=merged_headers)
-            temp_request = self.auth_config.auth.auth_flow(temp_request)
-            merged_headers = dict(temp_request.headers)
-
-        return {
+        request_params = {
             "method": method,
             "url": url,
             "headers": merged_headers,
-            **kwargs
         }
+        if extra:
+            request_params.update(extra)
+
+        return request_params
+
+    async def _sleep_backoff(self, attempt: int, reason: str) -> None:
+        """
+        Log a failed attempt and wait before retrying it.
+
+        Args:
+            attempt: Zero-based number of the failed attempt
+            reason: Why the attempt failed, for the log message
+        """
+        wait_time = self._delays[attempt]
+        if self.retry_config.jitter:
+            wait_time *= random.uniform(0.5, 1.5)
+
+        logger.warning(
+            "Request failed %s, retrying in %.2fs (attempt %d/%d)",
+            reason,
+            wait_time,
+            attempt + 1,
+            self.retry_config.max_attempts,
+        )
+        await asyncio.sleep(wait_time)
 
     async def _execute_request(
         self,
         method: str,
         url: str,
         headers: Optional[Dict[str, str]] = None,
-        **kwargs: Any
+        extra: Optional[Dict[str, Any]] = None,
+        *,
+        stream: bool = False,
+        coalesce: bool = False,
     ) -> httpx.Response:
         """
         Execute HTTP request with retry logic.
 
+        Request parameters are passed down as one dict rather than re-splatted
+        as **kwargs at every level.
+
         Args:
             method: HTTP method
             url: Request URL
             headers: Request headers
-            **kwargs: Additional request parameters
+            extra: Additional request parameters
+            stream: Return before reading the body; the caller must close the response
+            coalesce: Share one in-flight request between concurrent identical calls;
+                all callers receive the same response object. Only applies to
+                GET/HEAD requests without a per-call auth; ignored otherwise and
+                for streamed requests.
 
         Returns:
             HTTP response
@@ -220,51 +390,145 @@ class HttpClient(AsyncService):
         Raises:
             HttpClientError: On request failure
         """
-        client = await self.client
-        request_params = self._prepare_request(method, url, headers, **kwargs)
+        client = self._client
+        if self.state is not ServiceState.RUNNING or client is None or client.is_closed:
+            client = await self._ensure_client()
+
+        # Permanent same-origin redirects of plain GET/HEAD URLs are remembered
+        # so later calls go straight to the target, unless this call does not
+        # follow redirects
+        if extra and "follow_redirects" in extra:
+            follows = bool(extra["follow_redirects"])
+        else:
+            follows = client.follow_redirects
+        cache_redirects = (
+            follows
+            and method.upper() in _REDIRECT_CACHE_METHODS
+            and isinstance(url, str)
+            and not (extra and "params" in extra)
+        )
+        original_url = url
+        if cache_redirects:
+            url = self._redirect_cache.get(url, url)
+
+        request_params = self._prepare_request(method, url, headers, extra)
+
+        # auth and follow_redirects are applied on send; the rest builds the
+        # request once and the same request is resent on every attempt
+        auth = request_params.pop("auth", self._auth)
+        follow_redirects = request_params.pop("follow_redirects", httpx.USE_CLIENT_DEFAULT)
+        request = client.build_request(**request_params)
+
+        key = None
+        # Auth is applied on send, so requests with their own auth would share
+        # a response fetched with another caller's credentials
+        if (
+            coalesce
+            and not stream
+            and request.method in _COALESCE_METHODS
+            and "auth" not in (extra or ())
+        ):
+            try:
+                key = (
+                    request.method,
+                    str(request.url),
+                    tuple(request.headers.raw),
+                    request.content,
+                    follow_redirects,
+                )
+            except httpx.RequestNotRead:
+                # Streaming request bodies cannot be compared
+                pass
+
+        if key is None:
+            response = await self._send(client, request, auth, follow_redirects, stream)
+        else:
+            task = self._inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(self._send(client, request, auth, follow_redirects, stream))
+                self._inflight[key] = task
+                task.add_done_callback(lambda _: self._inflight.pop(key, None))
 
-        last_exception = None
-        backoff = self.retry_config.backoff_factor
+            # Shielded so one cancelled caller does not cancel the request for the others
+            response = await asyncio.shield(task)
 
-        for attempt in range(self.retry_config.max_attempts):
-            try:
-                response = await client.request(**request_params)
+        if cache_redirects and response.history:
+            self._remember_redirect(original_url, request.url, response)
 
-                # Check if we should retry based on status code
-                if self._should_retry(method, response) and attempt < self.retry_config.max_attempts - 1:
-                    # Calculate backoff with jitter
-                    wait_time = backoff * (2 ** attempt)
-                    if self.retry_config.jitter:
-                        wait_time *= (0.5 + random.random())
+        return response
 
-                    logger.warning(
-                        f"Request failed with status {response.status_code}, "
-                        f"retrying in {wait_time:.2f}s (attempt {attempt + 1}/{self.retry_config.max_attempts})"
-                    )
-                    await asyncio.sleep(wait_time)
-                    continue
+    def _remember_redirect(self, url: str, request_url: httpx.URL, response: httpx.Response) -> None:
+        """
+        Cache the target of a followed redirect chain.
 
-                return response
+        Only chains of permanent redirects that stay on the request's origin
+        are cached. httpx drops the Authorization header when a redirect
+        leaves the origin, but a cached target would be requested directly
+        with the client's auth.
 
-            except Exception as e:
-                last_exception = e
-                if attempt < self.retry_config.max_attempts - 1:
-                    wait_time = backoff * (2 ** attempt)
-                    if self.retry_config.jitter:
-                        wait_time *= (0.5 + random.random())
+        Args:
+            url: URL the caller passed, used as the cache key
+            request_url: Absolute URL the request was sent to
+            response: Final response, with the redirects in its history
+        """
+        if not all(hop.status_code in _PERMANENT_REDIRECTS for hop in response.history):
+            return
 
-                    logger.warning(
-                        f"Request failed with exception: {e}, "
-                        f"retrying in {wait_time:.2f}s (attempt {attempt + 1}/{self.retry_config.max_attempts})"
-                    )
-                    await asyncio.sleep(wait_time)
-                    continue
+        target = response.url
+        if (target.scheme, target.host, target.port) != (
+            request_url.scheme,
+            request_url.host,
+            request_url.port,
+        ):
+            return
 
-                raise HttpClientError(f"Request failed: {e}") from e
+        if len(self._redirect_cache) >= _REDIRECT_CACHE_SIZE:
+            # Drop the oldest entry
+            del self._redirect_cache[next(iter(self._redirect_cache))]
+        self._redirect_cache[url] = str(response.url)
 
-        # All retries exhausted
-        if last_exception:
-            raise HttpClientError(f"Request failed after {self.retry_config.max_attempts} attempts") from last_exception
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        request: httpx.Request,
+        auth: Any,
+        follow_redirects: Any,
+        stream: bool,
+    ) -> httpx.Response:
+        """
+        Send a built request, retrying it according to the retry config.
+
+        Args:
+            client: AsyncClient to send through
+            request: Request to send on every attempt
+            auth: Auth applied on each send
+            follow_redirects: Redirect behaviour for each send
+            stream: Return before reading the body
+
+        Returns:
+            HTTP response
+
+        Raises:
+            HttpClientError: On request failure
+        """
+        last_attempt = self.retry_config.max_attempts - 1
+        for attempt in range(self.retry_config.max_attempts):
+            try:
+                response = await client.send(
+                    request, auth=auth, follow_redirects=follow_redirects, stream=stream
+                )
+            except Exception as e:
+                if attempt == last_attempt:
+                    raise HttpClientError(f"Request failed: {e}") from e
+                reason = f"with exception: {e}"
+            else:
+                if attempt == last_attempt or not self._should_retry(request.method, response):
+                    return response
+                reason = f"with status {response.status_code}"
+                if stream:
+                    await response.aclose()
+
+            await self._sleep_backoff(attempt, reason)
 
         raise HttpClientError(f"Request failed after {self.retry_config.max_attempts} attempts")
 
@@ -273,6 +537,8 @@ class HttpClient(AsyncService):
         method: str,
         url: str,
         headers: Optional[Dict[str, str]] = None,
+        *,
+        coalesce: bool = False,
         **kwargs: Any
     ) -> httpx.Response:
         """
@@ -282,125 +548,102 @@ class HttpClient(AsyncService):
             method: HTTP method
             url: Request URL
             headers: Request headers
+            coalesce: Share one in-flight request between concurrent identical
+                GET/HEAD calls without a per-call auth
             **kwargs: Additional request parameters
 
         Returns:
             HTTP response
         """
-        return await self._execute_request(method, url, headers, **kwargs)
-
-    async def get(
-        self,
-        url: str,
-        headers: Optional[Dict[str, str]] = None,
-        **kwargs: Any
-    ) -> httpx.Response:
-        """Make GET request."""
-        return await self.request("GET", url, headers, **kwargs)
-
-    async def post(
-        self,
-        url: str,
-        headers: Optional[Dict[str, str]] = None,
-        **kwargs: Any
-    ) -> httpx.Response:
-        """Make POST request."""
-        return await self.request("POST", url, headers, **kwargs)
-
-    async def put(
-        self,
-        url: str,
-        headers: Optional[Dict[str, str]] = None,
-        **kwargs: Any
-    ) -> httpx.Response:
-        """Make PUT request."""
-        return await self.request("PUT", url, headers, **kwargs)
+        return await self._execute_request(method, url, headers, kwargs, coalesce=coalesce)
 
-    async def patch(
-        self,
-        url: str,
-        headers: Optional[Dict[str, str]] = None,
-        **kwargs: Any
-    ) -> httpx.Response:
-        """Make PATCH request."""
-        return await self.request("PATCH", url, headers, **kwargs)
-
-    async def delete(
-        self,
-        url: str,
-        headers: Optional[Dict[str, str]] = None,
-        **kwargs: Any
-    ) -> httpx.Response:
-        """Make DELETE request."""
-        return await self.request("DELETE", url, headers, **kwargs)
+    # Verb shortcuts: get(url, headers=None, **kwargs) -> httpx.Response
+    get = partialmethod(request, "GET")
+    post = partialmethod(request, "POST")
+    put = partialmethod(request, "PUT")
+    patch = partialmethod(request, "PATCH")
+    delete = partialmethod(request, "DELETE")
 
-    async def get_model(
+    async def _do_model(
         self,
+        method: str,
         url: str,
         response_model: Type[T],
         headers: Optional[Dict[str, str]] = None,
+        *,
+        coalesce: bool = False,
         **kwargs: Any
     ) -> T:
         """
-        Make GET request and parse response into Pydantic model.
+        Make HTTP request and parse response into Pydantic model.
 
         Args:
+            method: HTTP method
             url: Request URL
             response_model: Pydantic model class
             headers: Request headers
+            coalesce: Share one in-flight request between concurrent identical
+                GET/HEAD calls without a per-call auth
             **kwargs: Additional request parameters
 
         Returns:
             Parsed Pydantic model instance
+
+        Raises:
+            httpx.HTTPStatusError: If the response has an error status
         """
-        response = await self.get(url, headers, **kwargs)
+        response = await self._execute_request(method, url, headers, kwargs, coalesce=coalesce)
         response.raise_for_status()
-        return response_model.model_validate(response.json())
+        # Parse the body straight into the model, without an intermediate dict
+        return response_model.model_validate_json(response.content)
 
-    async def post_model(
+    async def stream_model(
         self,
+        method: str,
         url: str,
         response_model: Type[T],
         headers: Optional[Dict[str, str]] = None,
+        chunk_size: int = 65536,
         **kwargs: Any
     ) -> T:
-        """Make POST request and parse response into Pydantic model."""
-        response = await self.post(url, headers, **kwargs)
-        response.raise_for_status()
-        return response_model.model_validate(response.json())
+        """
+        Make HTTP request and parse a streamed response into Pydantic model.
 
-    async def put_model(
-        self,
-        url: str,
-        response_model: Type[T],
-        headers: Optional[Dict[str, str]] = None,
-        **kwargs: Any
-    ) -> T:
-        """Make PUT request and parse response into Pydantic model."""
-        response = await self.put(url, headers, **kwargs)
-        response.raise_for_status()
-        return response_model.model_validate(response.json())
+        The body is read in chunks into a single buffer and validated from
+        there, so large responses are not held as separate chunk, joined
+        bytes and decoded copies at once.
 
-    async def patch_model(
-        self,
-        url: str,
-        response_model: Type[T],
-        headers: Optional[Dict[str, str]] = None,
-        **kwargs: Any
-    ) -> T:
-        """Make PATCH request and parse response into Pydantic model."""
-        response = await self.patch(url, headers, **kwargs)
-        response.raise_for_status()
-        return response_model.model_validate(response.json())
+        Args:
+            method: HTTP method
+            url: Request URL
+            response_model: Pydantic model class
+            headers: Request headers
+            chunk_size: Bytes read per chunk
+            **kwargs: Additional request parameters
 
-    async def delete_model(
-        self,
-        url: str,
-        response_model: Type[T],
-        headers: Optional[Dict[str, str]] = None,
-        **kwargs: Any
-    ) -> T:
-        """Make DELETE request and parse response into Pydantic model."""
-        response = await self.delete(url, headers, **kwargs)
-        response.raise_for_status()
-        return response_model.model_validate(response.json())
+        Returns:
+            Parsed Pydantic model instance
+
+        Raises:
+            httpx.HTTPStatusError: If the response has an error status
+
+        Example:
+            report = await client.stream_model("GET", "/reports/large", Report)
+        """
+        response = await self._execute_request(method, url, headers, kwargs, stream=True)
+        try:
+            response.raise_for_status()
+            buffer = bytearray()
+            async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                buffer += chunk
+        finally:
+            await response.aclose()
+
+        return response_model.model_validate_json(buffer)
+
+    # Model shortcuts: get_model(url, response_model, headers=None, **kwargs) -> T
+    get_model = partialmethod(_do_model, "GET")
+    post_model = partialmethod(_do_model, "POST")
+    put_model = partialmethod(_do_model, "PUT")
+    patch_model = partialmethod(_do_model, "PATCH")
+    delete_model = partialmethod(_do_model, "DELETE")
@@ -0,0 +1,58 @@
+"""
+Event loop selection.
+
+Provides an opt-in helper to run asyncio on uvloop when it is installed.
+"""
+
+import asyncio
+import logging
+import os
+from types import ModuleType
+from typing import Optional
+
+uvloop: Optional[ModuleType]
+try:
+    import uvloop as _uvloop
+
+    uvloop = _uvloop
+except ImportError:
+    uvloop = None
+
+
+logger = logging.getLogger(__name__)
+
+USE_UVLOOP_ENV = "INTERNAL_HTTP_USE_UVLOOP"
+
+
+def install_uvloop() -> bool:
+    """
+    Make asyncio create uvloop event loops.
+
+    Only loops created after this call use uvloop, so call it before
+    asyncio.run() or the ASGI server starts its loop. Importing
+    internal_http calls it automatically when INTERNAL_HTTP_USE_UVLOOP=1.
+
+    Returns:
+        True if uvloop was installed, False if it is not available
+
+    Example:
+        from internal_http import install_uvloop
+
+        install_uvloop()
+        asyncio.run(main())
+    """
+    if uvloop is None:
+        logger.debug("uvloop is not installed, keeping the default event loop")
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def _install_uvloop_from_env() -> None:
+    """Install uvloop if INTERNAL_HTTP_USE_UVLOOP is set to 1 (run on import)."""
+    if os.getenv(USE_UVLOOP_ENV) == "1":
+        install_uvloop()
+
+
+_install_uvloop_from_env()
@@ -1,5 +1,5 @@
 """Models module for internal_http."""
 
-from .config import RetryConfig, AuthConfig
+from .config import RetryConfig, AuthConfig, DEFAULT_RETRY_CONFIG
 
-__all__ = ["RetryConfig", "AuthConfig"]
+__all__ = ["RetryConfig", "AuthConfig", "DEFAULT_RETRY_CONFIG"]
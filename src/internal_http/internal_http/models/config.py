@@ -4,20 +4,22 @@ HTTP client configuration models.
 Provides Pydantic models for HTTP client configuration.
 """
 
-from typing import List, Any, Optional, Callable
+from typing import Any, Callable, Optional, Tuple
 from pydantic import BaseModel, Field
 
 
 class RetryConfig(BaseModel):
     """Retry configuration."""
 
+    model_config = {"frozen": True}
+
     max_attempts: int = Field(default=3, description="Maximum retry attempts")
-    retry_statuses: List[int] = Field(
-        default=[500, 502, 503, 504],
+    retry_statuses: Tuple[int, ...] = Field(
+        default=(500, 502, 503, 504),
         description="HTTP status codes to retry"
     )
-    retry_methods: List[str] = Field(
-        default=["GET", "HEAD", "PUT", "DELETE", "OPTIONS", "TRACE"],
+    retry_methods: Tuple[str, ...] = Field(
+        default=("GET", "HEAD", "PUT", "DELETE", "OPTIONS", "TRACE"),
         description="HTTP methods to retry"
     )
     backoff_factor: float = Field(
@@ -28,16 +30,20 @@ class RetryConfig(BaseModel):
         default=True,
         description="Add random jitter to backoff"
     )
-    retry_exceptions: List[Any] = Field(
-        default_factory=list,
+    retry_exceptions: Tuple[Any, ...] = Field(
+        default=(),
         description="Exception types to retry"
     )
 
 
+# Shared by every HttpClient created without retries; safe since the model is frozen
+DEFAULT_RETRY_CONFIG = RetryConfig()
+
+
 class AuthConfig(BaseModel):
     """Authentication configuration."""
 
-    model_config = {"arbitrary_types_allowed": True}
+    model_config = {"arbitrary_types_allowed": True, "frozen": True}
 
     auth: Optional[Any] = Field(
         default=None,
@@ -51,3 +57,7 @@ class AuthConfig(BaseModel):
         default=None,
         description="Callback function to refresh auth token"
     )
+
+
+# Shared by every HttpClient created without auth_config
+DEFAULT_AUTH_CONFIG = AuthConfig()
@@ -0,0 +1,124 @@
+"""
+Engine setup shared by the SQLite database managers.
+
+Every SQLite engine is created through make_engine() so connection tuning
+applies to file-based and in-memory databases alike.
+"""
+
+from typing import Any, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+
+# Applied to every new connection: WAL lets readers run alongside a writer and,
+# with synchronous=NORMAL, only fsyncs at checkpoints; busy_timeout waits for
+# locks instead of failing; a 20 MB page cache and in-memory temp tables avoid
+# disk reads for repeated queries. Only performance settings belong here;
+# PRAGMAs that change behaviour, like foreign_keys, stay at SQLite's defaults.
+_PRAGMAS = (
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=MEMORY",
+)
+_WAL_PRAGMA = "PRAGMA journal_mode=WAL"
+_QUERY_ONLY_PRAGMA = "PRAGMA query_only=ON"
+
+# Execution option naming the BEGIN mode of a connection's next transaction
+_BEGIN_OPTION = "sqlite_begin"
+
+# SQLAlchemy's compiled statement cache (default 500 entries). SQLite apps tend
+# to run many small distinct statements in tight loops, so keep more of them.
+_QUERY_CACHE_SIZE = 1200
+
+
+def _apply_pragmas_on_connect(engine: AsyncEngine, pragmas: Tuple[str, ...]) -> None:
+    """
+    Run PRAGMAs on every new connection of an engine.
+
+    Args:
+        engine: Engine to register the connect hook on
+        pragmas: PRAGMA statements to run, in order
+    """
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _apply_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def _use_explicit_begin(engine: AsyncEngine) -> None:
+    """
+    Let SQLAlchemy emit BEGIN instead of the sqlite3 driver.
+
+    The driver otherwise starts its own DEFERRED transaction lazily, which
+    leaves no way to choose the transaction mode. The BEGIN mode is taken
+    from the connection's _BEGIN_OPTION execution option.
+
+    Args:
+        engine: Engine to register the hooks on
+    """
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection: Any, connection_record: Any) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _begin(connection: Any) -> None:
+        mode = connection.get_execution_options().get(_BEGIN_OPTION, "DEFERRED")
+        connection.exec_driver_sql(f"BEGIN {mode}")
+
+
+def make_engine(
+    url: str,
+    pragmas: Tuple[str, ...] = _PRAGMAS,
+    explicit_begin: bool = False,
+    **engine_kwargs: Any,
+) -> AsyncEngine:
+    """
+    Create a tuned SQLite async engine.
+
+    Sets the statement cache size and runs the PRAGMAs on each new connection.
+    Only writer engines should set explicit_begin: a transaction begun by
+    SQLAlchemy holds its read snapshot from the first statement, and a
+    DEFERRED transaction that reads and then writes fails at once with
+    "database is locked" when another connection is writing, as busy_timeout
+    does not retry that upgrade. Other engines leave transactions to the
+    driver, which only begins them before a write.
+
+    Args:
+        url: Database URL
+        pragmas: PRAGMA statements to run on new connections
+        explicit_begin: Let transactions choose their BEGIN mode (see begin_immediate())
+        **engine_kwargs: Further create_async_engine() arguments (pool, echo, connect_args)
+
+    Returns:
+        Configured AsyncEngine
+
+    Example:
+        engine = make_engine(
+            "sqlite+aiosqlite:///./app.db", explicit_begin=True, pool_size=1, max_overflow=0
+        )
+    """
+    engine = create_async_engine(url, query_cache_size=_QUERY_CACHE_SIZE, **engine_kwargs)
+    _apply_pragmas_on_connect(engine, pragmas)
+    if explicit_begin:
+        _use_explicit_begin(engine)
+    return engine
+
+
+async def begin_immediate(session: AsyncSession) -> None:
+    """
+    Make a session's transaction start with BEGIN IMMEDIATE.
+
+    Only has an effect on engines created with explicit_begin=True.
+
+    Args:
+        session: Session that has not started its transaction yet
+    """
+    await session.connection(execution_options={_BEGIN_OPTION: "IMMEDIATE"})
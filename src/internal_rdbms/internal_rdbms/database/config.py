@@ -4,7 +4,8 @@ Database configuration models.
 Provides Pydantic models for database configuration.
 """
 
-from typing import Optional, Dict, Any
+from functools import cached_property
+from typing import Optional, Dict, Any, Mapping, Self
 from pydantic import BaseModel, Field, computed_field
 
 
@@ -56,17 +57,33 @@ class DatabaseConfig(BaseModel):
         default=1800,
         description="Recycle connections after this many seconds"
     )
+    pool_pre_ping: bool = Field(
+        default=True,
+        description=(
+            "Test connections on checkout; costs a round-trip per checkout but "
+            "replaces connections dropped by the server"
+        )
+    )
+    pool_use_lifo: bool = Field(
+        default=True,
+        description=(
+            "Reuse the most recently returned connection first, keeping a warm "
+            "working set and letting idle extras expire via pool_recycle"
+        )
+    )
     connect_args: Dict[str, Any] = Field(
         default_factory=dict,
         description="Additional database-specific connection arguments"
     )
 
     @computed_field
-    @property
+    @cached_property
     def url(self) -> str:
         """
         Compute connection URL from configuration.
 
+        The URL is computed on first access and cached until a field changes.
+
         Returns:
             Database connection URL
 
@@ -103,6 +120,17 @@ class DatabaseConfig(BaseModel):
 
         return f"{self.driver}://{user_pass}{self.host}:{port}/{self.name}"
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set a field and drop the cached URL."""
+        super().__setattr__(name, value)
+        self.__dict__.pop("url", None)
+
+    def model_copy(self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False) -> Self:
+        """Copy the config without carrying over a cached URL."""
+        copy = super().model_copy(update=update, deep=deep)
+        copy.__dict__.pop("url", None)
+        return copy
+
     class Config:
         """Pydantic configuration."""
         use_enum_values = True
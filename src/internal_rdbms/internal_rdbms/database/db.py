@@ -1,33 +1,30 @@
 """
-Abstract database connection manager.
+Base database connection manager.
 
 Provides base class for database implementations.
 """
 
-from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict
 
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from .config import DatabaseConfig
 
 
-class Database(ABC):
+class Database:
     """
-    Abstract database connection manager.
+    Base database connection manager.
 
     Provides common functionality for database connections with SQLAlchemy.
-    Subclasses must implement _create_engine() for specific database types.
+    Every hook has a working default, so the class is usable as is;
+    subclasses override _engine_kwargs() when a database needs engine
+    arguments other than the pooled defaults.
 
     Example:
         class MyDatabase(Database):
-            def _create_engine(self) -> AsyncEngine:
-                return create_async_engine(
-                    self.settings.url,
-                    echo=self.settings.echo,
-                    pool_size=self.settings.pool_size,
-                )
+            def _engine_kwargs(self) -> Dict[str, Any]:
+                return {**super()._engine_kwargs(), "isolation_level": "READ COMMITTED"}
 
         config = DatabaseConfig(driver="mysql+aiomysql", host="localhost", name="mydb")
         db = MyDatabase(config)
@@ -59,45 +56,117 @@ class Database(ABC):
         """
         self.settings = settings
         self._engine: AsyncEngine = self._create_engine()
-        self._session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
-            self._engine,
+        self._read_engine: AsyncEngine = self._create_read_engine()
+        self._write_engine: AsyncEngine = self._create_write_engine()
+        self._session_factory: async_sessionmaker[AsyncSession] = self._sessionmaker(self._engine)
+        self._read_session_factory = self._session_factory_for(self._read_engine)
+        self._write_session_factory = self._session_factory_for(self._write_engine)
+
+    @staticmethod
+    def _sessionmaker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+        """Create the session factory for an engine."""
+        return async_sessionmaker(
+            engine,
             class_=AsyncSession,
             expire_on_commit=False,
             autoflush=False,
             autocommit=False,
         )
 
-    @abstractmethod
+    def _session_factory_for(self, engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+        """Reuse the default session factory when an engine is the main engine."""
+        if engine is self._engine:
+            return self._session_factory
+        return self._sessionmaker(engine)
+
+    def _engine_kwargs(self) -> Dict[str, Any]:
+        """
+        Build the keyword arguments passed to create_async_engine().
+
+        The defaults configure a connection pool from the settings; subclasses
+        override this for databases that need other engine arguments.
+
+        Returns:
+            Engine keyword arguments
+
+        Example:
+            def _engine_kwargs(self) -> Dict[str, Any]:
+                return {
+                    "echo": self.settings.echo,
+                    "poolclass": NullPool,
+                    "connect_args": self.settings.connect_args,
+                }
+        """
+        return {
+            "echo": self.settings.echo,
+            "pool_size": self.settings.pool_size,
+            "max_overflow": self.settings.max_overflow,
+            "pool_timeout": self.settings.pool_timeout,
+            "pool_recycle": self.settings.pool_recycle,
+            "pool_pre_ping": self.settings.pool_pre_ping,
+            "pool_use_lifo": self.settings.pool_use_lifo,
+            "connect_args": self.settings.connect_args,
+        }
+
     def _create_engine(self) -> AsyncEngine:
         """
         Create database engine.
 
-        Must be implemented by subclasses to provide database-specific engine creation.
+        Returns:
+            AsyncEngine for settings.url configured with _engine_kwargs()
+        """
+        return create_async_engine(self.settings.url, **self._engine_kwargs())
+
+    def _create_read_engine(self) -> AsyncEngine:
+        """
+        Create the engine used by read-only sessions.
+
+        Defaults to the main engine; subclasses override this to give readers
+        their own connection pool.
+
+        Returns:
+            AsyncEngine for session(readonly=True)
+        """
+        return self._engine
+
+    def _create_write_engine(self) -> AsyncEngine:
+        """
+        Create the engine used by sessions opened with readwrite=True.
+
+        Defaults to the main engine; subclasses override this to serialize
+        writers through their own connection pool.
 
         Returns:
-            AsyncEngine instance
+            AsyncEngine for session(readwrite=True)
+        """
+        return self._engine
 
-        Example:
-            def _create_engine(self) -> AsyncEngine:
-                return create_async_engine(
-                    self.settings.url,
-                    echo=self.settings.echo,
-                    pool_size=self.settings.pool_size,
-                    max_overflow=self.settings.max_overflow,
-                    pool_timeout=self.settings.pool_timeout,
-                    pool_recycle=self.settings.pool_recycle,
-                    connect_args=self.settings.connect_args,
-                )
-        """
-        pass
+    async def _begin_write(self, session: AsyncSession) -> None:
+        """
+        Start the transaction of a session opened with readwrite=True.
+
+        Intentionally a no-op by default: the transaction begins as usual on
+        the first statement. Databases that can take write locks up front
+        override this to begin the transaction accordingly.
+
+        Args:
+            session: Newly created write session
+        """
 
     @asynccontextmanager
-    async def session(self) -> AsyncGenerator[AsyncSession, None]:
+    async def session(
+        self, readonly: bool = False, readwrite: bool = False
+    ) -> AsyncGenerator[AsyncSession, None]:
         """
         Create and manage a database session.
 
         Provides automatic transaction handling - commits on success, rolls back on error.
 
+        Args:
+            readonly: Use the read engine, for sessions that only query
+            readwrite: Use the write engine and begin the transaction with a
+                write lock where the database supports it
+
         Yields:
             AsyncSession instance
 
@@ -107,9 +176,22 @@ class Database(ABC):
                 session.add(user)
                 # Automatically commits on exit
                 # Automatically rolls back on exception
+
+        Raises:
+            ValueError: If both readonly and readwrite are set
         """
-        session = self._session_factory()
+        if readonly and readwrite:
+            raise ValueError("A session cannot be both readonly and readwrite")
+
+        if readonly:
+            session = self._read_session_factory()
+        elif readwrite:
+            session = self._write_session_factory()
+        else:
+            session = self._session_factory()
         try:
+            if readwrite:
+                await self._begin_write(session)
             yield session
             await session.commit()
         except Exception:
@@ -132,3 +214,6 @@ class Database(ABC):
             await db.dispose()
         """
         await self._engine.dispose()
+        for engine in (self._read_engine, self._write_engine):
+            if engine is not self._engine:
+                await engine.dispose()
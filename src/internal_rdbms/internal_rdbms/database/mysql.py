@@ -4,8 +4,6 @@ MySQL database connection manager.
 Provides async MySQL connection management with aiomysql.
 """
 
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
-
 from .config import DatabaseConfig
 from .db import Database
 
@@ -64,26 +62,3 @@ class MySQLDatabase(Database):
             config.connect_args.setdefault("autocommit", False)
 
         super().__init__(config)
-
-    def _create_engine(self) -> AsyncEngine:
-        """
-        Create MySQL async engine.
-
-        Returns:
-            AsyncEngine configured for MySQL with aiomysql
-
-        Example:
-            # Called automatically during initialization
-            # Uses config.url to build connection string
-            # Applies pool settings from config
-        """
-        return create_async_engine(
-            self.settings.url,
-            echo=self.settings.echo,
-            pool_size=self.settings.pool_size,
-            max_overflow=self.settings.max_overflow,
-            pool_timeout=self.settings.pool_timeout,
-            pool_recycle=self.settings.pool_recycle,
-            pool_pre_ping=True,  # Enable connection health checks
-            connect_args=self.settings.connect_args,
-        )
@@ -4,8 +4,6 @@ PostgreSQL database connection manager.
 Provides async PostgreSQL connection management with asyncpg.
 """
 
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
-
 from .config import DatabaseConfig
 from .db import Database
 
@@ -67,26 +65,3 @@ class PostgresDatabase(Database):
             })
 
         super().__init__(config)
-
-    def _create_engine(self) -> AsyncEngine:
-        """
-        Create PostgreSQL async engine.
-
-        Returns:
-            AsyncEngine configured for PostgreSQL with asyncpg
-
-        Example:
-            # Called automatically during initialization
-            # Uses config.url to build connection string
-            # Applies pool settings from config
-        """
-        return create_async_engine(
-            self.settings.url,
-            echo=self.settings.echo,
-            pool_size=self.settings.pool_size,
-            max_overflow=self.settings.max_overflow,
-            pool_timeout=self.settings.pool_timeout,
-            pool_recycle=self.settings.pool_recycle,
-            pool_pre_ping=True,  # Enable connection health checks
-            connect_args=self.settings.connect_args,
-        )
@@ -4,9 +4,13 @@ SQLite file-based database connection manager.
 Provides async SQLite connection management with aiosqlite.
 """
 
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
-from sqlalchemy.pool import NullPool
+import os
+from typing import Any, Dict, Tuple
 
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.pool import StaticPool
+
+from ._sqlite_common import _PRAGMAS, _QUERY_ONLY_PRAGMA, _WAL_PRAGMA, begin_immediate, make_engine
 from .config import DatabaseConfig
 from .db import Database
 
@@ -34,6 +38,16 @@ class SQLiteDatabase(Database):
             session.add(user)
             # Automatically commits
 
+        # Take the write lock up front instead of on the first write. Write
+        # sessions share one connection, so they run one at a time and must
+        # not be nested
+        async with db.session(readwrite=True) as session:
+            await session.execute(update(User).values(active=True))
+
+        # Queries can run in parallel on the reader pool
+        async with db.session(readonly=True) as session:
+            users = (await session.execute(select(User))).scalars().all()
+
         await db.dispose()
     """
 
@@ -52,29 +66,114 @@ class SQLiteDatabase(Database):
             )
             db = SQLiteDatabase(config)
         """
-        # Set default SQLite-specific connect_args if not provided
-        if "check_same_thread" not in config.connect_args:
-            config.connect_args.setdefault("check_same_thread", False)
+        # Default SQLite-specific connect_args on a copy, leaving the caller's config as is
+        config = config.model_copy(
+            update={"connect_args": {"check_same_thread": False, **config.connect_args}}
+        )
 
         super().__init__(config)
 
+    def _engine_kwargs(self) -> Dict[str, Any]:
+        """
+        Build SQLite file-based engine arguments for default sessions.
+
+        Default sessions get a pool sized from the settings, so they can run
+        concurrently and be nested. A :memory: database uses StaticPool, as
+        the database lives in that connection.
+
+        Returns:
+            Engine keyword arguments
+        """
+        if self.settings.name == ":memory:":
+            return {
+                "echo": self.settings.echo,
+                "poolclass": StaticPool,
+                "connect_args": self.settings.connect_args,
+            }
+
+        return {
+            "echo": self.settings.echo,
+            "pool_size": self.settings.pool_size,
+            "max_overflow": self.settings.max_overflow,
+            "pool_timeout": self.settings.pool_timeout,
+            "connect_args": self.settings.connect_args,
+        }
+
+    def _pragmas(self) -> Tuple[str, ...]:
+        """PRAGMAs for new connections; WAL is skipped for :memory: databases."""
+        if self.settings.name == ":memory:":
+            return _PRAGMAS
+        return (_WAL_PRAGMA, *_PRAGMAS)
+
     def _create_engine(self) -> AsyncEngine:
         """
-        Create SQLite file-based async engine.
+        Create SQLite file-based engine for default sessions.
 
-        Uses NullPool since SQLite doesn't support connection pooling effectively.
+        Default sessions leave transactions to the driver, which begins them
+        only before a write, so a session that reads and then writes waits
+        on busy_timeout instead of failing while another session writes.
 
         Returns:
-            AsyncEngine configured for SQLite with aiosqlite
+            AsyncEngine applying the performance PRAGMAs to new connections
+        """
+        return make_engine(self.settings.url, self._pragmas(), **self._engine_kwargs())
 
-        Example:
-            # Called automatically during initialization
-            # Creates engine pointing to file: ./database.db
-            # No connection pooling (uses NullPool)
+    def _create_write_engine(self) -> AsyncEngine:
+        """
+        Create SQLite file-based writer engine.
+
+        SQLite allows one writer at a time, so readwrite sessions share a
+        single connection and queue for it instead of contending for the
+        write lock. A readwrite session nested in another one waits for the
+        outer one and fails after pool_timeout. A :memory: database keeps
+        writing through its one connection.
+
+        Returns:
+            AsyncEngine with a one-connection pool for readwrite sessions
         """
-        return create_async_engine(
+        if self.settings.name == ":memory:":
+            return self._engine
+
+        return make_engine(
+            self.settings.url,
+            self._pragmas(),
+            explicit_begin=True,
+            **{**self._engine_kwargs(), "pool_size": 1, "max_overflow": 0},
+        )
+
+    def _create_read_engine(self) -> AsyncEngine:
+        """
+        Create SQLite file-based reader engine.
+
+        With WAL, readers do not block the writer or each other, so read-only
+        sessions get a pool with a connection per CPU. Reader connections are
+        set to query_only. A :memory: database exists only within its one
+        connection, so it keeps reading through the main engine.
+
+        Returns:
+            AsyncEngine for read-only sessions
+        """
+        if self.settings.name == ":memory:":
+            return self._engine
+
+        return make_engine(
             self.settings.url,
-            echo=self.settings.echo,
-            poolclass=NullPool,  # SQLite doesn't benefit from pooling
-            connect_args=self.settings.connect_args,
+            (*self._pragmas(), _QUERY_ONLY_PRAGMA),
+            **{**self._engine_kwargs(), "pool_size": os.cpu_count() or 1, "max_overflow": 0},
         )
+
+    async def _begin_write(self, session: AsyncSession) -> None:
+        """
+        Start the session's transaction with BEGIN IMMEDIATE.
+
+        The write lock is taken when the transaction starts, so a busy
+        database is waited on (busy_timeout) before any work is done rather
+        than failing the deferred lock upgrade midway through. A :memory:
+        database writes through its one connection, so there is no lock to
+        wait for and the driver begins the transaction as usual.
+
+        Args:
+            session: Newly created write session
+        """
+        if self.settings.name != ":memory:":
+            await begin_immediate(session)
@@ -4,9 +4,14 @@ SQLite in-memory database connection manager.
 Provides async SQLite in-memory connection management with aiosqlite.
 """
 
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
-from sqlalchemy.pool import StaticPool
+import sqlite3
+from typing import Any, Dict
+from uuid import uuid4
 
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
+
+from ._sqlite_common import _PRAGMAS, _QUERY_ONLY_PRAGMA, make_engine
 from .config import DatabaseConfig
 from .db import Database
 
@@ -18,9 +23,17 @@ class SQLiteMemDatabase(Database):
     Uses aiosqlite driver for async SQLite in-memory connections.
     Perfect for testing - fast, isolated, and ephemeral.
 
-    IMPORTANT: Uses StaticPool to ensure single connection is reused,
-    which is critical for in-memory databases (otherwise each connection
-    would see a different empty database).
+    Each instance gets its own named shared-cache in-memory database. Default
+    and readwrite sessions share one connection, as with a plain :memory:
+    database, so they never contend for locks. Read-only sessions get a pool
+    of query_only connections to the same database and can run in parallel.
+    A plain sqlite3 connection is held open until dispose() so the database
+    is not dropped when the engines close their connections.
+
+    Shared-cache connections lock whole tables and busy_timeout does not
+    apply to those locks, so a read-only session fails with OperationalError
+    ("database table is locked") if it reads a table while a write to it is
+    pending.
 
     Example:
         from internal_rdbms import SQLiteMemDatabase, DatabaseConfig
@@ -37,11 +50,14 @@ class SQLiteMemDatabase(Database):
         async with db._engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
 
-        # Use database
         async with db.session() as session:
             user = User(name="Test", email="test@example.com")
             session.add(user)
 
+        # Queries can run in parallel on the reader pool
+        async with db.session(readonly=True) as session:
+            users = (await session.execute(select(User))).scalars().all()
+
         await db.dispose()
         # Database is gone after disposal (in-memory only)
     """
@@ -61,35 +77,79 @@ class SQLiteMemDatabase(Database):
             )
             db = SQLiteMemDatabase(config)
         """
-        # Force in-memory database
-        if config.name != ":memory:":
-            config.name = ":memory:"
+        # Force in-memory database and default SQLite-specific connect_args on
+        # a copy, leaving the caller's config as is
+        config = config.model_copy(
+            update={
+                "name": ":memory:",
+                "connect_args": {"check_same_thread": False, **config.connect_args},
+            }
+        )
 
-        # Set default SQLite-specific connect_args if not provided
-        if "check_same_thread" not in config.connect_args:
-            config.connect_args.setdefault("check_same_thread", False)
+        # An in-memory database lives as long as one connection to it is open
+        self._uri = f"file:mem_{uuid4().hex}?mode=memory&cache=shared"
+        self._keepalive = sqlite3.connect(self._uri, uri=True, check_same_thread=False)
 
         super().__init__(config)
 
+    def _engine_kwargs(self) -> Dict[str, Any]:
+        """
+        Build SQLite in-memory engine arguments for default sessions.
+
+        Returns:
+            Engine keyword arguments for a single shared connection (StaticPool)
+        """
+        return {
+            "echo": self.settings.echo,
+            "poolclass": StaticPool,
+            "connect_args": self.settings.connect_args,
+        }
+
     def _create_engine(self) -> AsyncEngine:
         """
         Create SQLite in-memory async engine.
 
-        Uses StaticPool to ensure a single connection is reused across all sessions.
-        This is critical for in-memory databases - without it, each connection would
-        create a new empty database.
+        Connects to this instance's shared-cache database instead of a
+        private :memory: database, so the reader pool sees the same data.
 
         Returns:
             AsyncEngine configured for SQLite in-memory with aiosqlite
+        """
+        return make_engine(self._url, **self._engine_kwargs())
 
-        Example:
-            # Called automatically during initialization
-            # Creates engine pointing to in-memory database
-            # Uses StaticPool for connection reuse
+    def _create_read_engine(self) -> AsyncEngine:
         """
-        return create_async_engine(
-            self.settings.url,
+        Create SQLite in-memory reader engine.
+
+        Read-only sessions get a query_only pool sized from the settings,
+        connected to the same shared-cache database.
+
+        Returns:
+            AsyncEngine for read-only sessions
+        """
+        return make_engine(
+            self._url,
+            (*_PRAGMAS, _QUERY_ONLY_PRAGMA),
             echo=self.settings.echo,
-            poolclass=StaticPool,  # Critical: reuse single connection
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=self.settings.pool_size,
+            max_overflow=self.settings.max_overflow,
+            pool_timeout=self.settings.pool_timeout,
             connect_args=self.settings.connect_args,
         )
+
+    @property
+    def _url(self) -> str:
+        """SQLAlchemy URL of this instance's shared-cache database."""
+        return f"{self.settings.driver}:///{self._uri}&uri=true"
+
+    async def dispose(self) -> None:
+        """
+        Dispose of the engine and drop the in-memory database.
+
+        Example:
+            await db.dispose()
+            # Database is gone after disposal (in-memory only)
+        """
+        await super().dispose()
+        self._keepalive.close()
@@ -5,13 +5,60 @@ Provides decorators and helpers for datetime handling.
 """
 
 from datetime import datetime, timezone
-from typing import Callable
-from functools import wraps
+from typing import Any, Callable, Optional
 
+_UTC = timezone.utc
 
-def ensure_utc(func: Callable[..., datetime]) -> property:
+
+class _UtcProperty:
+    # Read-through property that normalizes the getter's datetime to UTC.
+    # Implements the descriptor protocol directly instead of wrapping the
+    # getter for ``property``, so each access costs a single Python frame.
+
+    __slots__ = ("fget", "fset", "__doc__")
+
+    def __init__(
+        self,
+        fget: Callable[[Any], datetime],
+        fset: Optional[Callable[[Any, datetime], None]] = None,
+    ) -> None:
+        self.fget = fget
+        self.fset = fset
+        self.__doc__ = fget.__doc__
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None, _UTC=_UTC) -> Any:
+        if obj is None:
+            return self
+
+        value = self.fget(obj)
+        if value is None:
+            return value
+
+        tz = value.tzinfo
+        # Already UTC: return as-is without allocating a new datetime
+        if tz is _UTC:
+            return value
+
+        # If naive, assume UTC
+        if tz is None:
+            return value.replace(tzinfo=_UTC)
+
+        # Otherwise convert to UTC
+        return value.astimezone(_UTC)
+
+    def __set__(self, obj: Any, value: datetime) -> None:
+        if self.fset is None:
+            raise AttributeError(f"property {self.fget.__name__!r} has no setter")
+        self.fset(obj, value)
+
+    def setter(self, fset: Callable[[Any, datetime], None]) -> "_UtcProperty":
+        """Return a copy of this property with the given setter, like property.setter."""
+        return type(self)(self.fget, fset)
+
+
+def ensure_utc(func: Callable[..., datetime]) -> _UtcProperty:
     """
-    Decorator that wraps property getters to ensure datetime values are UTC-aware.
+    Decorator that turns a getter into a property returning UTC-aware datetimes.
 
     Converts naive datetimes to UTC and ensures aware datetimes are in UTC timezone.
     Useful for database models where timestamps should always be UTC-aware.
@@ -20,7 +67,7 @@ def ensure_utc(func: Callable[..., datetime]) -> property:
         func: Property getter function that returns a datetime
 
     Returns:
-        Property with UTC-aware datetime guarantee
+        Property-like descriptor with UTC-aware datetime guarantee
 
     Example:
         from datetime import datetime
@@ -38,7 +85,6 @@ def ensure_utc(func: Callable[..., datetime]) -> property:
                 nullable=False
             )
 
-            @property
             @ensure_utc
             def created_at(self) -> datetime:
                 return self._created_at
@@ -52,17 +98,4 @@ def ensure_utc(func: Callable[..., datetime]) -> property:
         user.created_at = datetime(2024, 1, 1, 12, 0, 0)  # Naive datetime
         print(user.created_at)  # 2024-01-01 12:00:00+00:00 (UTC-aware)
     """
-    @wraps(func)
-    def wrapper(self) -> datetime:
-        value = func(self)
-        if value is None:
-            return value
-
-        # If already timezone-aware, convert to UTC
-        if value.tzinfo is not None:
-            return value.astimezone(timezone.utc)
-
-        # If naive, assume UTC
-        return value.replace(tzinfo=timezone.utc)
-
-    return property(wrapper)
+    return _UtcProperty(func)
@@ -4,6 +4,7 @@ import pytest
 import pytest_asyncio
 from testcontainers.localstack import LocalStackContainer
 from testcontainers.core.waiting_utils import wait_for_logs
+from botocore.exceptions import ClientError
 
 from internal_aws import (
     S3Client, S3ClientConfig,
@@ -28,7 +29,7 @@ def localstack_container():
     localstack.stop()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def aws_credentials(localstack_container):
     """Create AWS credentials for LocalStack."""
     return ExplicitCredentialProvider(
@@ -48,7 +49,7 @@ def s3_config(localstack_container):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dynamodb_config(localstack_container):
     """DynamoDB configuration for LocalStack."""
     return DynamoDBConfig(
@@ -58,7 +59,7 @@ def dynamodb_config(localstack_container):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sqs_config(localstack_container):
     """SQS configuration for LocalStack."""
     # Create queue first
@@ -95,9 +96,9 @@ async def s3_client(s3_config, aws_credentials):
     yield client
 
 
-@pytest_asyncio.fixture
-async def dynamodb_table(dynamodb_config, aws_credentials):
-    """DynamoDB table connected to LocalStack."""
+@pytest_asyncio.fixture(scope="class", loop_scope="class")
+async def shared_dynamodb_table(dynamodb_config, aws_credentials):
+    """DynamoDB table connected to LocalStack, created once per test class."""
     from pydantic import BaseModel
 
     class UserModel(BaseModel):
@@ -123,8 +124,37 @@ async def dynamodb_table(dynamodb_config, aws_credentials):
     yield table
 
 
-@pytest_asyncio.fixture
-async def sqs_client(sqs_config, aws_credentials):
-    """SQS client connected to LocalStack."""
-    client = SQSClient(sqs_config, aws_credentials)
-    yield client
+@pytest_asyncio.fixture(loop_scope="class")
+async def dynamodb_table(shared_dynamodb_table):
+    """Class-shared DynamoDB table, emptied after each test."""
+    yield shared_dynamodb_table
+
+    # Cleanup: delete the test's items (BatchWriteItem takes 25 requests at most)
+    keys = [{"user_id": item.user_id} for item in await shared_dynamodb_table.scan()]
+    for start in range(0, len(keys), 25):
+        await shared_dynamodb_table.batch_write_items(items_to_delete=keys[start:start + 25])
+
+
+@pytest.fixture(scope="class")
+def shared_sqs_client(sqs_config, aws_credentials):
+    """SQS client connected to LocalStack, shared by a test class."""
+    return SQSClient(sqs_config, aws_credentials)
+
+
+@pytest_asyncio.fixture(loop_scope="class")
+async def sqs_client(shared_sqs_client):
+    """Class-shared SQS client whose queue is emptied after each test."""
+    yield shared_sqs_client
+
+    # Cleanup: SQS allows one purge per queue every 60 seconds, so fall back
+    # to receiving and deleting what is left
+    try:
+        await shared_sqs_client.purge_queue()
+    except ClientError as e:
+        if e.response["Error"]["Code"] != "AWS.SimpleQueueService.PurgeQueueInProgress":
+            raise
+        while messages := await shared_sqs_client.receive_message(max_number_of_messages=10):
+            await shared_sqs_client.delete_message_batch([
+                {"Id": str(i), "ReceiptHandle": message["ReceiptHandle"]}
+                for i, message in enumerate(messages)
+            ])
@@ -4,6 +4,8 @@ Integration tests for DynamoTable with LocalStack.
 Tests real DynamoDB operations - NO MOCKING.
 """
 
+import asyncio
+
 import pytest
 from pydantic import BaseModel
 
@@ -18,7 +20,7 @@ class UserModel(BaseModel):
 
 @pytest.mark.integration
 @pytest.mark.localstack
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="class")
 class TestDynamoTable:
     """Test DynamoTable with real LocalStack DynamoDB."""
 
@@ -67,14 +69,16 @@ class TestDynamoTable:
     async def test_query_items(self, dynamodb_table):
         """Test querying items."""
         # Put multiple items
-        for i in range(5):
-            user = UserModel(
+        users = [
+            UserModel(
                 user_id=f"user{i}",
                 name=f"User {i}",
                 email=f"user{i}@example.com",
                 age=20 + i
             )
-            await dynamodb_table.put_item(user)
+            for i in range(5)
+        ]
+        await asyncio.gather(*(dynamodb_table.put_item(user) for user in users))
         
         # Query by user_id
         results = await dynamodb_table.query(
@@ -88,13 +92,15 @@ class TestDynamoTable:
     async def test_scan_items(self, dynamodb_table):
         """Test scanning all items."""
         # Put multiple items
-        for i in range(3):
-            user = UserModel(
+        users = [
+            UserModel(
                 user_id=f"scan{i}",
                 name=f"Scan {i}",
                 email=f"scan{i}@example.com"
             )
-            await dynamodb_table.put_item(user)
+            for i in range(3)
+        ]
+        await asyncio.gather(*(dynamodb_table.put_item(user) for user in users))
         
         # Scan all
         results = await dynamodb_table.scan()
@@ -105,14 +111,16 @@ class TestDynamoTable:
     async def test_scan_with_filter(self, dynamodb_table):
         """Test scanning with filter expression."""
         # Put items with different ages
-        for i in range(5):
-            user = UserModel(
+        users = [
+            UserModel(
                 user_id=f"filter{i}",
                 name=f"Filter {i}",
                 email=f"filter{i}@example.com",
                 age=20 + i * 5
             )
-            await dynamodb_table.put_item(user)
+            for i in range(5)
+        ]
+        await asyncio.gather(*(dynamodb_table.put_item(user) for user in users))
         
         # Scan with filter for age > 25
         results = await dynamodb_table.scan(
@@ -155,21 +163,25 @@ class TestDynamoTable:
         await dynamodb_table.batch_write_items_to_table(items)
         
         # Verify all written
-        for i in range(10):
-            result = await dynamodb_table.get_item({"user_id": f"batch{i}"})
+        results = await asyncio.gather(
+            *(dynamodb_table.get_item({"user_id": f"batch{i}"}) for i in range(10))
+        )
+        for i, result in enumerate(results):
             assert result is not None
             assert result.name == f"Batch {i}"
 
     async def test_batch_get_items(self, dynamodb_table):
         """Test batch getting items."""
         # Put multiple items
-        for i in range(5):
-            user = UserModel(
+        users = [
+            UserModel(
                 user_id=f"batchget{i}",
                 name=f"BatchGet {i}",
                 email=f"batchget{i}@example.com"
             )
-            await dynamodb_table.put_item(user)
+            for i in range(5)
+        ]
+        await asyncio.gather(*(dynamodb_table.put_item(user) for user in users))
         
         # Batch get
         keys = [{"user_id": f"batchget{i}"} for i in range(5)]
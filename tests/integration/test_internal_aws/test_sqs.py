@@ -7,7 +7,7 @@ Tests real SQS operations - NO MOCKING.
 import pytest
 import asyncio
 from pydantic import BaseModel
-from tests.test_utils import wait_for_condition
+from tests.test_utils import wait_for_condition, wait_for_sqs_messages
 
 
 class MessageModel(BaseModel):
@@ -18,7 +18,7 @@ class MessageModel(BaseModel):
 
 @pytest.mark.integration
 @pytest.mark.localstack
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="class")
 class TestSQSClient:
     """Test SQSClient with real LocalStack SQS."""
 
@@ -29,8 +29,7 @@ class TestSQSClient:
         assert "MessageId" in response
         
         # Receive message
-        messages = await sqs_client.receive_message(max_number_of_messages=1)
-        assert len(messages) >= 1
+        messages = await wait_for_sqs_messages(sqs_client, 1)
         assert messages[0]["Body"] == "Hello, SQS!"
 
     async def test_send_dict_message(self, sqs_client):
@@ -41,9 +40,8 @@ class TestSQSClient:
         assert "MessageId" in response
         
         # Receive and parse
-        messages = await sqs_client.receive_message()
-        assert len(messages) >= 1
-        
+        messages = await wait_for_sqs_messages(sqs_client, 1)
+
         import json
         body = json.loads(messages[0]["Body"])
         assert body["key"] == "value"
@@ -57,9 +55,8 @@ class TestSQSClient:
         assert "MessageId" in response
         
         # Receive and parse
-        messages = await sqs_client.receive_message()
-        assert len(messages) >= 1
-        
+        messages = await wait_for_sqs_messages(sqs_client, 1)
+
         import json
         body = json.loads(messages[0]["Body"])
         assert body["id"] == "123"
@@ -81,9 +78,8 @@ class TestSQSClient:
         await sqs_client.send_message("Delete me")
         
         # Receive message
-        messages = await sqs_client.receive_message()
-        assert len(messages) >= 1
-        
+        messages = await wait_for_sqs_messages(sqs_client, 1)
+
         receipt_handle = messages[0]["ReceiptHandle"]
         
         # Delete message
@@ -106,7 +102,7 @@ class TestSQSClient:
         assert "MessageId" in response
         
         # Receive and check attributes
-        messages = await sqs_client.receive_message()
+        messages = await wait_for_sqs_messages(sqs_client, 1)
         if messages and "MessageAttributes" in messages[0]:
             attrs = messages[0]["MessageAttributes"]
             if "priority" in attrs:
@@ -158,19 +154,17 @@ class TestSQSClient:
 
 @pytest.mark.integration
 @pytest.mark.localstack
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="class")
 class TestSQSConsumer:
     """Test SQSConsumer with real LocalStack SQS."""
 
-    async def test_consumer_process_batch(self, sqs_config, aws_credentials):
+    async def test_consumer_process_batch(self, sqs_client, sqs_config, aws_credentials):
         """Test consumer processing a batch."""
         from internal_aws import SQSConsumer
-        
+
         # Send test messages
-        from internal_aws import SQSClient
-        client = SQSClient(sqs_config, aws_credentials)
         for i in range(3):
-            await client.send_message(f"Consumer test {i}")
+            await sqs_client.send_message(f"Consumer test {i}")
 
         # Track processed messages
         processed = []
@@ -198,14 +192,13 @@ class TestSQSConsumer:
         assert len(processed) >= 1
         assert len(results) >= 1
 
-    async def test_consumer_start_stop(self, sqs_config, aws_credentials):
+    async def test_consumer_start_stop(self, sqs_client, sqs_config, aws_credentials):
         """Test consumer start and stop."""
-        from internal_aws import SQSConsumer, SQSClient
+        from internal_aws import SQSConsumer
 
         # Send test messages first
-        client = SQSClient(sqs_config, aws_credentials)
         for i in range(3):
-            await client.send_message(f"Test message {i}")
+            await sqs_client.send_message(f"Test message {i}")
 
         processed = []
 
@@ -200,3 +200,43 @@ async def test_flush_pattern_with_no_matches(redis_client):
 
 
 
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_mset_and_mget(redis_client):
+    """Test mset writes and mget reads several keys in one round-trip."""
+    assert await redis_client.mset({"batch:1": {"id": 1}, "batch:2": "two"}, ttl=60)
+
+    values = await redis_client.mget(["batch:1", "batch:missing", "batch:2"])
+
+    assert values == [{"id": 1}, None, "two"]
+    assert 0 < await redis_client.ttl("batch:1") <= 60
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_flush_pattern_in_batches(redis_client):
+    """Test flush_pattern deletes matches spanning several batches."""
+    await redis_client.mset({f"bulk:{i}": i for i in range(25)})
+    await redis_client.set("keep:1", "data")
+
+    count = await redis_client.flush_pattern("bulk:*", batch_size=10)
+
+    assert count == 25
+    assert await redis_client.scan_keys("bulk:*") == []
+    assert await redis_client.exists("keep:1") == 1
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_set_raw_and_get_raw(redis_client):
+    """Test raw payloads are stored and returned untouched."""
+    from internal_cache import JSONBytes
+
+    assert await redis_client.set_raw("raw:1", b"\x00payload", ttl=60)
+    assert await redis_client.get_raw("raw:1") == b"\x00payload"
+    assert await redis_client.get_raw("raw:missing") is None
+
+    await redis_client.set("raw:json", JSONBytes(b'{"a": 1}'))
+    assert await redis_client.get("raw:json") == {"a": 1}
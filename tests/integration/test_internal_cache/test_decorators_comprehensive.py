@@ -7,7 +7,7 @@ Uses shared session-scoped Redis container from root conftest.py for speed.
 
 import pytest
 import asyncio
-from internal_cache import cached, cache_aside
+from internal_cache import cached, cache_aside, cache_aside_batch
 from internal_cache.decorators import _generate_cache_key, _invalidate_cache
 
 # Note: redis_client fixture is provided by tests/conftest.py with session-scoped Redis container
@@ -52,7 +52,7 @@ class TestGenerateCacheKey:
         key = _generate_cache_key(test_func, (1,), {"b": 2})
 
         assert "test_func" in key
-        assert "b=" in key
+        assert key != _generate_cache_key(test_func, (1,), {"b": 3})
 
     def test_generate_cache_key_with_non_json_kwargs(self):
         """Test key generation with non-JSON-serializable kwargs."""
@@ -70,7 +70,7 @@ class TestGenerateCacheKey:
         assert "test_func" in key
 
     def test_generate_cache_key_long_key_hashing(self):
-        """Test that long keys are hashed."""
+        """Test that long argument lists still produce a short hashed key."""
 
         def test_func_with_very_long_name_that_should_trigger_hashing():
             pass
@@ -383,3 +383,59 @@ async def test_cached_with_complex_types(redis_client):
     result2 = await get_complex_data("test")
     assert result2["dict"]["nested"] == "value"
     assert call_count == 1
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_cache_aside_batch_only_fetches_misses(redis_client):
+    """Test cache_aside_batch calls the function only for uncached ids."""
+    calls = []
+
+    @cache_aside_batch(redis_client, ttl=10, key_func=lambda item_id: f"item:{item_id}")
+    async def get_items(item_ids):
+        calls.append(list(item_ids))
+        return {item_id: {"id": item_id} for item_id in item_ids}
+
+    assert await get_items([1, 2]) == {1: {"id": 1}, 2: {"id": 2}}
+    assert await get_items([2, 3, 1]) == {2: {"id": 2}, 3: {"id": 3}, 1: {"id": 1}}
+    assert calls == [[1, 2], [3]]
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_cached_negative_ttl_caches_none(redis_client):
+    """Test None results are cached with the shorter negative TTL."""
+    call_count = 0
+
+    @cached(redis_client, ttl=600, negative_ttl=30, key_builder=lambda f, a, k: f"neg:{a[0]}")
+    async def find_user(user_id):
+        nonlocal call_count
+        call_count += 1
+        return None
+
+    assert await find_user(1) is None
+    assert await find_user(1) is None
+    assert call_count == 1
+    assert 0 < await redis_client.ttl("neg:1") <= 30
+
+    # Invalidation removes the negative entry too
+    await find_user.cache_invalidate(1)
+    assert await find_user(1) is None
+    assert call_count == 2
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_cached_none_not_cached_by_default(redis_client):
+    """Test None results are recomputed without negative_ttl."""
+    call_count = 0
+
+    @cached(redis_client, ttl=600)
+    async def find_user(user_id):
+        nonlocal call_count
+        call_count += 1
+        return None
+
+    await find_user(2)
+    await find_user(2)
+    assert call_count == 2
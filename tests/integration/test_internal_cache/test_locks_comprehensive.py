@@ -434,3 +434,195 @@ async def test_with_lock_decorator_with_args_kwargs(redis_client):
     # Lock should be released
     exists = await redis_client.exists("lock:test:decorator_args")
     assert exists == 0
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_lock_release_reloads_flushed_scripts(redis_client):
+    """Test release falls back to reloading scripts after SCRIPT FLUSH."""
+    lock = DistributedLock(
+        client=redis_client,
+        lock_name="test:script_flush",
+        timeout=10,
+    )
+
+    await lock.acquire()
+
+    # Simulate a Redis restart dropping the script cache
+    await redis_client.client.script_flush()
+
+    assert await lock.release() is True
+    assert await redis_client.exists("lock:test:script_flush") == 0
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_lock_waiter_woken_by_release(redis_client):
+    """Test a blocked waiter is notified as soon as the holder releases."""
+    holder = DistributedLock(redis_client, "test:notify", timeout=10)
+    waiter = DistributedLock(redis_client, "test:notify", timeout=10)
+
+    await holder.acquire()
+    waiting = asyncio.create_task(waiter.acquire(timeout=5.0))
+    await asyncio.sleep(0.2)  # Legitimate: let the waiter subscribe
+
+    loop = asyncio.get_running_loop()
+    released_at = loop.time()
+    await holder.release()
+
+    assert await waiting is True
+    # Woken by the release notification, not the capped safety wait
+    assert loop.time() - released_at < 0.5
+
+    await waiter.release()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_lock_waiter_wakes_when_holder_expires(redis_client):
+    """Test a waiter sleeps only as long as the holder's remaining TTL."""
+    holder = DistributedLock(redis_client, "test:expiry_wait", timeout=1)
+    waiter = DistributedLock(redis_client, "test:expiry_wait", timeout=10)
+
+    await holder.acquire()
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    assert await waiter.acquire(timeout=3.0) is True
+    assert loop.time() - start < 1.5
+
+    await waiter.release()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_acquire_many_all_free(redis_client):
+    """Test acquire_many takes every lock and each can be released."""
+    locks = await DistributedLock.acquire_many(redis_client, ["test:many:a", "test:many:b"])
+
+    assert [lock.lock_name for lock in locks] == ["lock:test:many:a", "lock:test:many:b"]
+    assert await redis_client.exists("lock:test:many:a", "lock:test:many:b") == 2
+
+    for lock in locks:
+        assert await lock.release() is True
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_acquire_many_rolls_back_partial(redis_client):
+    """Test acquire_many releases what it took when one lock is held."""
+    holder = DistributedLock(redis_client, "test:many:held", timeout=10)
+    await holder.acquire()
+
+    locks = await DistributedLock.acquire_many(
+        redis_client, ["test:many:free", "test:many:held"]
+    )
+
+    assert locks is None
+    assert await redis_client.exists("lock:test:many:free") == 0
+    assert await redis_client.exists("lock:test:many:held") == 1
+
+    await holder.release()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_local_waiters_share_one_redis_wait(redis_client):
+    """Test only one in-process waiter at a time waits on Redis."""
+    holder = DistributedLock(redis_client, "test:gate", timeout=10)
+    await holder.acquire()
+
+    async def wait_then_release():
+        lock = DistributedLock(redis_client, "test:gate", timeout=10)
+        assert await lock.acquire(timeout=5.0) is True
+        await lock.release()
+
+    waiters = [asyncio.create_task(wait_then_release()) for _ in range(5)]
+    await asyncio.sleep(0.2)  # Legitimate: let the waiters queue up
+
+    # One pattern subscription for release channels, one for keyspace events
+    assert await redis_client.client.pubsub_numpat() == 2
+
+    await holder.release()
+    await asyncio.gather(*waiters)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_lock_is_locked_and_owned(redis_client):
+    """Test is_locked checks Redis while owned tracks this instance."""
+    lock = DistributedLock(redis_client, "test:is_locked", timeout=10)
+    other = DistributedLock(redis_client, "test:is_locked", timeout=10)
+
+    assert await lock.is_locked() is False
+    await lock.acquire()
+
+    assert await other.is_locked() is True
+    assert lock.owned is True
+    assert other.owned is False
+
+    await lock.release()
+    assert lock.owned is False
+    assert await lock.is_locked() is False
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_auto_renewal_batches_several_locks(redis_client):
+    """Test several auto-renewed locks are all kept alive past their timeout."""
+    locks = [
+        DistributedLock(redis_client, f"test:batch_renew:{i}", timeout=1, auto_renewal=True)
+        for i in range(3)
+    ]
+    for lock in locks:
+        assert await lock.acquire() is True
+
+    await asyncio.sleep(1.5)  # Legitimate: outlive the lock timeout
+
+    assert await redis_client.exists(*(f"lock:test:batch_renew:{i}" for i in range(3))) == 3
+    for lock in locks:
+        assert await lock.release() is True
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_with_lock_concurrent_calls_use_own_tokens(redis_client):
+    """Test concurrent decorated calls don't release each other's lock."""
+    active = 0
+    peak = 0
+
+    @with_lock(redis_client, "test:decorator_concurrent", timeout=10)
+    async def decorated_function():
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.05)
+        active -= 1
+
+    await asyncio.gather(*(decorated_function() for _ in range(3)))
+
+    assert peak == 1
+    assert await redis_client.exists("lock:test:decorator_concurrent") == 0
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_waiters_on_different_locks_share_one_subscription(redis_client):
+    """Test waiters on many lock keys use one pubsub connection per client."""
+    holders = [DistributedLock(redis_client, f"test:notify:{i}", timeout=10) for i in range(5)]
+    for holder in holders:
+        await holder.acquire()
+
+    async def wait_then_release(name: str):
+        lock = DistributedLock(redis_client, name, timeout=10)
+        assert await lock.acquire(timeout=5.0) is True
+        await lock.release()
+
+    waiters = [asyncio.create_task(wait_then_release(f"test:notify:{i}")) for i in range(5)]
+    await asyncio.sleep(0.2)  # Legitimate: let the waiters subscribe
+
+    assert await redis_client.client.pubsub_numpat() == 2
+
+    for holder in holders:
+        await holder.release()
+    await asyncio.wait_for(asyncio.gather(*waiters), 1.0)
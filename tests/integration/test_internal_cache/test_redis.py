@@ -121,11 +121,11 @@ async def test_redis_hash_operations(redis_client):
 
     # Get hash field
     value = await redis_client.client.hget("test:hash", "field1")
-    assert value == "value1"
+    assert value == b"value1"
 
     # Get all hash fields
     all_fields = await redis_client.client.hgetall("test:hash")
-    assert all_fields == {"field1": "value1", "field2": "value2"}
+    assert all_fields == {b"field1": b"value1", b"field2": b"value2"}
 
 
 @pytest.mark.integration
@@ -143,7 +143,7 @@ async def test_redis_list_operations(redis_client):
 
     # Get list range
     items = await redis_client.client.lrange("test:list", 0, -1)
-    assert items == ["item2", "item1", "item3"]
+    assert items == [b"item2", b"item1", b"item3"]
 
 
 @pytest.mark.integration
@@ -162,7 +162,7 @@ async def test_redis_set_operations(redis_client):
     # Get all members
     members = await redis_client.client.smembers("test:set")
     assert len(members) == 3
-    assert "member1" in members
+    assert b"member1" in members
 
 
 @pytest.mark.integration
@@ -297,7 +297,7 @@ async def test_redis_pubsub(redis_client):
 
     assert message is not None
     assert message["type"] == "message"
-    assert message["data"] == "test message"
+    assert message["data"] == b"test message"
 
     await pubsub.unsubscribe("test:channel")
 
@@ -1,5 +1,7 @@
 """Fixtures for internal_rdbms integration tests."""
 
+from contextlib import asynccontextmanager
+
 import pytest
 import pytest_asyncio
 from testcontainers.postgres import PostgresContainer
@@ -7,7 +9,7 @@ from testcontainers.mysql import MySqlContainer
 
 from internal_rdbms import DatabaseConfig, PostgresDatabase, MySQLDatabase, SQLiteMemDatabase
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, String, text
 
 
 # Test model
@@ -33,7 +35,7 @@ def postgres_container():
     postgres.stop()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def postgres_config(postgres_container):
     """PostgreSQL configuration."""
     return DatabaseConfig(
@@ -57,7 +59,7 @@ def mysql_container():
     mysql.stop()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mysql_config(mysql_container):
     """MySQL configuration."""
     return DatabaseConfig(
@@ -70,7 +72,7 @@ def mysql_config(mysql_container):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sqlite_mem_config():
     """SQLite in-memory configuration."""
     return DatabaseConfig(
@@ -79,51 +81,94 @@ def sqlite_mem_config():
     )
 
 
+async def _create_schema(db):
+    """Create the test tables once, then release the connections."""
+    async with db._engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await db.dispose()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def postgres_schema(postgres_config):
+    """Create PostgreSQL tables once per test session."""
+    await _create_schema(PostgresDatabase(postgres_config))
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def mysql_schema(mysql_config):
+    """Create MySQL tables once per test session."""
+    await _create_schema(MySQLDatabase(mysql_config))
+
+
 @pytest_asyncio.fixture
-async def postgres_db(postgres_config):
+async def postgres_db(postgres_config, postgres_schema):
     """PostgreSQL database instance."""
     db = PostgresDatabase(postgres_config)
-    
-    # Create tables
-    async with db._engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    
+
     yield db
-    
-    # Cleanup
+
+    # Cleanup: one TRUNCATE instead of dropping and recreating the schema
+    tables = ", ".join(table.name for table in reversed(Base.metadata.sorted_tables))
     async with db._engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-    
+        await conn.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
+
     await db.dispose()
 
 
 @pytest_asyncio.fixture
-async def mysql_db(mysql_config):
+async def mysql_db(mysql_config, mysql_schema):
     """MySQL database instance."""
     db = MySQLDatabase(mysql_config)
-    
-    # Create tables
-    async with db._engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    
+
     yield db
-    
-    # Cleanup
+
+    # Cleanup: MySQL truncates one table per statement
     async with db._engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-    
+        for table in reversed(Base.metadata.sorted_tables):
+            await conn.execute(text(f"TRUNCATE TABLE {table.name}"))
+
     await db.dispose()
 
 
-@pytest_asyncio.fixture
-async def sqlite_db(sqlite_mem_config):
-    """SQLite in-memory database instance."""
+@asynccontextmanager
+async def rolled_back(db):
+    """
+    Run db.session() calls inside one transaction that is rolled back at exit.
+
+    Default sessions join the transaction through a savepoint, so their
+    commits only release the savepoint. The sqlite3 driver only begins a
+    transaction before a write and releasing an outermost SAVEPOINT commits,
+    so BEGIN is emitted explicitly to keep the savepoints nested.
+    """
+    factory = db._session_factory
+    kw = factory.kw.copy()
+    async with db._engine.connect() as conn:
+        transaction = await conn.begin()
+        await conn.exec_driver_sql("BEGIN")
+        factory.configure(bind=conn, join_transaction_mode="create_savepoint")
+        try:
+            yield db
+        finally:
+            factory.kw = kw
+            await transaction.rollback()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def sqlite_engine(sqlite_mem_config):
+    """SQLite in-memory database with its tables, shared by the whole session."""
     db = SQLiteMemDatabase(sqlite_mem_config)
-    
+
     # Create tables
     async with db._engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-    
+
     yield db
-    
+
     await db.dispose()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def sqlite_db(sqlite_engine):
+    """Shared SQLite in-memory database whose writes are rolled back after the test."""
+    async with rolled_back(sqlite_engine) as db:
+        yield db
@@ -7,7 +7,7 @@ NO MOCKING - uses testcontainers for real databases.
 
 import pytest
 from sqlalchemy import select
-from tests.integration.test_internal_rdbms.conftest import User
+from tests.integration.test_internal_rdbms.conftest import User, rolled_back
 
 
 @pytest.mark.integration
@@ -106,7 +106,7 @@ class TestMySQLDatabase:
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 class TestSQLiteMemDatabase:
     """Test SQLite in-memory database (fast unit tests)."""
 
@@ -132,12 +132,10 @@ class TestSQLiteMemDatabase:
         """Test multiple operations in SQLite."""
         # Insert multiple users
         async with sqlite_db.session() as session:
-            users = [
+            session.add_all(
                 User(name=f"User{i}", email=f"user{i}@example.com")
                 for i in range(10)
-            ]
-            for user in users:
-                session.add(user)
+            )
 
         # Query all
         async with sqlite_db.session() as session:
@@ -145,6 +143,20 @@ class TestSQLiteMemDatabase:
             all_users = result.scalars().all()
             assert len(all_users) == 10
 
+    async def test_sqlite_tests_are_isolated(self, sqlite_engine):
+        """Test writes committed through db.session() are rolled back afterwards."""
+        query = select(User).where(User.name == "Isolated")
+
+        async with rolled_back(sqlite_engine) as db:
+            async with db.session() as session:
+                session.add(User(name="Isolated", email="isolated@example.com"))
+
+            async with db.session() as session:
+                assert (await session.execute(query)).scalar_one().name == "Isolated"
+
+        async with sqlite_engine.session() as session:
+            assert (await session.execute(query)).scalars().all() == []
+
 
 @pytest.mark.unit
 @pytest.mark.asyncio
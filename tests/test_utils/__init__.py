@@ -6,6 +6,7 @@ from .wait import (
     wait_for_redis_key_deleted,
     wait_for_ttl_expiry,
     wait_for_lock_renewal,
+    wait_for_sqs_messages,
 )
 
 __all__ = [
@@ -14,4 +15,5 @@ __all__ = [
     "wait_for_redis_key_deleted",
     "wait_for_ttl_expiry",
     "wait_for_lock_renewal",
+    "wait_for_sqs_messages",
 ]
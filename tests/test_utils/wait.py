@@ -177,3 +177,44 @@ async def wait_for_lock_renewal(
         timeout_ms=timeout_ms,
     )
     return True
+
+
+async def wait_for_sqs_messages(
+    sqs_client,
+    count: int,
+    timeout_ms: int = 5000,
+) -> list:
+    """
+    Receive from an SQS queue until at least count messages have arrived.
+
+    Each receive long-polls for up to a second and returns as soon as
+    messages are visible, so the wait ends as soon as the messages do.
+
+    Args:
+        sqs_client: SQSClient instance
+        count: Number of messages to wait for
+        timeout_ms: Maximum time to wait in milliseconds
+
+    Returns:
+        Received messages (at least count)
+
+    Raises:
+        TimeoutError: If fewer than count messages arrive within timeout
+    """
+    messages: list = []
+
+    async def check_received():
+        messages.extend(
+            await sqs_client.receive_message(
+                max_number_of_messages=10,
+                wait_time_seconds=1,
+            )
+        )
+        return len(messages) >= count
+
+    await wait_for_condition(
+        check_received,
+        f"{count} SQS message(s) to be received",
+        timeout_ms=timeout_ms,
+    )
+    return messages
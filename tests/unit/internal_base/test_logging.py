@@ -44,6 +44,11 @@ class TestLoggingConfig:
         assert config.level == "DEBUG"
         assert config.propagate is False
 
+    def test_string_format_coerced_to_member(self):
+        """Test plain strings are coerced to the LogFormat singleton."""
+        config = LoggingConfig(format="json")
+        assert config.format is LogFormat.JSON
+
 
 class TestGetLogger:
     """Test getLogger function."""
@@ -4,6 +4,8 @@ Additional edge case tests for AsyncService.
 Tests uncovered edge cases in async_service.py.
 """
 
+import asyncio
+
 import pytest
 from internal_base.service.async_service import AsyncService
 from internal_base.service.protocol import ServiceState
@@ -93,6 +95,44 @@ class TestAsyncServiceEdgeCases:
         with pytest.raises(RuntimeError, match="Cannot stop service"):
             await service.stop()
 
+    @pytest.mark.asyncio
+    async def test_start_when_running_skips_lock(self):
+        """Test start on a running service returns without taking the lock."""
+        service = SimpleService()
+        await service.start()
+
+        async with service._start_lock:
+            await service.start()
+
+        assert service.state == ServiceState.RUNNING
+
+    @pytest.mark.asyncio
+    async def test_stop_when_stopped_skips_lock(self):
+        """Test stop on an idle service returns without taking the lock."""
+        service = SimpleService()
+
+        async with service._stop_lock:
+            await service.stop()
+
+        assert service.state == ServiceState.IDLE
+
+    @pytest.mark.asyncio
+    async def test_concurrent_start_runs_once(self):
+        """Test concurrent start calls only start the service once."""
+        calls = 0
+
+        class CountingService(SimpleService):
+            async def _start(self) -> None:
+                nonlocal calls
+                calls += 1
+                await asyncio.sleep(0)
+
+        service = CountingService()
+        await asyncio.gather(service.start(), service.start())
+
+        assert calls == 1
+        assert service.state == ServiceState.RUNNING
+
     @pytest.mark.asyncio
     async def test_start_failure_sets_failed_state(self):
         """Test that start failure sets FAILED state."""
@@ -6,7 +6,8 @@ Tests RedisClient and RedisConfig.
 
 import pytest
 import json
-from internal_cache import RedisClient, RedisConfig
+from unittest.mock import AsyncMock
+from internal_cache import JSONBytes, RedisClient, RedisConfig
 
 
 class TestRedisConfig:
@@ -24,8 +25,10 @@ class TestRedisConfig:
         assert config.socket_timeout == 5.0
         assert config.socket_connect_timeout == 5.0
         assert config.max_connections == 50
-        assert config.decode_responses is True
+        assert config.decode_responses is False
         assert config.key_prefix == ""
+        assert config.protocol == 3
+        assert config.health_check_interval == 30
 
     def test_custom_config(self):
         """Test custom configuration."""
@@ -39,7 +42,7 @@ class TestRedisConfig:
             socket_timeout=10.0,
             socket_connect_timeout=3.0,
             max_connections=100,
-            decode_responses=False,
+            decode_responses=True,
             key_prefix="myapp:"
         )
         assert config.host == "redis.example.com"
@@ -51,7 +54,7 @@ class TestRedisConfig:
         assert config.socket_timeout == 10.0
         assert config.socket_connect_timeout == 3.0
         assert config.max_connections == 100
-        assert config.decode_responses is False
+        assert config.decode_responses is True
         assert config.key_prefix == "myapp:"
 
 
@@ -83,8 +86,268 @@ class TestRedisClient:
         client = RedisClient(config)
         assert client._get_key("test:key") == "app:test:key"
 
+    def test_get_key_bytes(self):
+        """Test _get_key_b returns the prefixed key as bytes."""
+        client = RedisClient(RedisConfig(key_prefix="app:"))
+        assert client._get_key_b("test:key") == b"app:test:key"
+        assert client._get_key_b(b"test:key") == b"app:test:key"
+
     def test_client_property_not_connected(self):
         """Test client property raises error when not connected."""
         client = RedisClient()
         with pytest.raises(RuntimeError, match="Redis client not connected"):
             _ = client.client
+
+    async def test_ping_connected_returns_true(self):
+        """Test ping reports a reachable server as alive."""
+        client = RedisClient()
+        client._client = AsyncMock()
+        client._client.ping.return_value = True
+
+        assert await client.ping() is True
+        client._client.ping.assert_awaited_once()
+
+    async def test_mget_empty_keys(self):
+        """Test mget with no keys returns an empty list."""
+        client = RedisClient()
+        assert await client.mget([]) == []
+
+    async def test_mget_not_connected_returns_none(self):
+        """Test mget returns a None per key on failure."""
+        client = RedisClient()
+        assert await client.mget(["a", "b"]) == [None, None]
+
+    async def test_mset_empty_mapping(self):
+        """Test mset with an empty mapping is a no-op."""
+        client = RedisClient()
+        assert await client.mset({}) is True
+
+    async def test_mset_not_connected_returns_false(self):
+        """Test mset returns False on failure."""
+        client = RedisClient()
+        assert await client.mset({"a": 1}) is False
+
+    def test_deserialize_json_bytes(self):
+        """Test JSON is parsed directly from bytes."""
+        assert RedisClient._deserialize(b'{"a": 1}') == {"a": 1}
+
+    def test_deserialize_plain_bytes_as_str(self):
+        """Test non-JSON UTF-8 bytes are returned as str."""
+        assert RedisClient._deserialize(b"plain value") == "plain value"
+
+    def test_deserialize_binary_bytes(self):
+        """Test non-UTF-8 bytes are returned unchanged."""
+        assert RedisClient._deserialize(b"\xff\xfe") == b"\xff\xfe"
+
+    def test_deserialize_str_reply(self):
+        """Test str replies (decode_responses=True) are still handled."""
+        assert RedisClient._deserialize("[1, 2]") == [1, 2]
+        assert RedisClient._deserialize("plain") == "plain"
+
+    def test_compression_requires_binary_responses(self):
+        """Test compression cannot be combined with decode_responses."""
+        config = RedisConfig(compress_threshold=1024, decode_responses=True)
+        with pytest.raises(ValueError, match="decode_responses"):
+            RedisClient(config)
+
+    def test_small_values_not_compressed(self):
+        """Test payloads under the threshold are stored as plain JSON."""
+        client = RedisClient(RedisConfig(compress_threshold=1024))
+        assert client._serialize({"a": 1}) == b'\x02{"a":1}'
+
+    def test_large_values_round_trip_compressed(self):
+        """Test large payloads are compressed and read back transparently."""
+        client = RedisClient(RedisConfig(compress_threshold=1024))
+        value = {"items": ["x" * 10 for _ in range(500)]}
+
+        payload = client._serialize(value)
+        assert payload.startswith(b"\x01")
+        assert len(payload) < 1024
+        assert client._deserialize(payload) == value
+
+    def test_large_strings_round_trip_compressed(self):
+        """Test large string values are compressed too."""
+        client = RedisClient(RedisConfig(compress_threshold=16))
+        payload = client._serialize("plain text " * 10)
+        assert payload.startswith(b"\x01")
+        assert client._deserialize(payload) == "plain text " * 10
+
+    async def test_ensure_connects_lazily(self):
+        """Test _ensure creates the underlying client on first use only."""
+        client = RedisClient()
+        first = await client._ensure()
+        assert client._client is first
+        assert await client._ensure() is first
+        await client.close()
+        assert client._client is None
+
+    async def test_flush_pattern_not_connected_returns_zero(self):
+        """Test flush_pattern returns 0 when Redis is unreachable."""
+        client = RedisClient(RedisConfig(port=1))
+        assert await client.flush_pattern("session:*") == 0
+
+    def test_serialize_tags_json_documents(self):
+        """Test non-scalar values are stored as tagged JSON."""
+        client = RedisClient()
+        assert client._serialize({"a": 1}) == b'\x02{"a":1}'
+        assert client._serialize([1, 2]) == b"\x02[1,2]"
+        assert client._serialize(True) == b"\x02true"
+
+    def test_serialize_keeps_scalars_untagged(self):
+        """Test strings, bytes and numbers stay usable by raw commands."""
+        client = RedisClient()
+        assert client._serialize("lock-token") == "lock-token"
+        assert client._serialize(b"raw") == b"raw"
+        assert client._serialize(10) == b"10"
+        assert client._serialize(1.5) == b"1.5"
+
+    def test_round_trip_values(self):
+        """Test values survive a serialize/deserialize round-trip."""
+        client = RedisClient()
+        for value in ({"a": [1, 2]}, [1, "x"], True, None, "plain", "true", "null", "false", 10, 1.5):
+            assert client._deserialize(client._serialize(value)) == value
+
+    def test_deserialize_untagged_legacy_values(self):
+        """Test values written untagged with json.dumps still read back."""
+        for value in (None, False, True, {"a": 1}, [1], 2):
+            assert RedisClient._deserialize(json.dumps(value).encode()) == value
+
+    def test_deserialize_untagged_words_as_str(self):
+        """Test plain strings starting like a JSON literal stay strings."""
+        for value in ("nope", "total", "falsy"):
+            assert RedisClient._deserialize(value.encode()) == value
+
+    def test_round_trip_string_looking_like_header(self):
+        """Test strings starting with a header byte are not misread."""
+        client = RedisClient()
+        for value in ("\x01abc", "\x02abc", "\x03abc"):
+            assert client._deserialize(client._serialize(value)) == value
+
+    def test_round_trip_str_subclass_looking_like_header(self):
+        """Test str subclasses starting with a header byte are tagged as well."""
+
+        class Token(str):
+            pass
+
+        client = RedisClient()
+        assert client._deserialize(client._serialize(Token("\x02abc"))) == "\x02abc"
+
+    def test_round_trip_bytes_looking_like_header(self):
+        """Test bytes starting with a header byte read back unchanged."""
+        client = RedisClient()
+        for value in (b"\x01\x02", b"\x02abc", b"\x03abc", b"\x01"):
+            assert client._serialize(value) == b"\x03" + value
+            assert client._deserialize(client._serialize(value)) == value
+
+    def test_round_trip_compressed_bytes_looking_like_header(self):
+        """Test header-prefixed bytes are tagged before being compressed."""
+        client = RedisClient(RedisConfig(compress_threshold=16))
+        value = b"\x02" + b"x" * 100
+        payload = client._serialize(value)
+        assert payload.startswith(b"\x01")
+        assert client._deserialize(payload) == value
+
+    def test_serialize_json_bytes_not_reencoded(self):
+        """Test JSONBytes payloads are tagged without re-encoding."""
+        client = RedisClient()
+        payload = JSONBytes(b'{"a": 1}')
+        assert client._serialize(payload) == b'\x02{"a": 1}'
+        assert client._deserialize(client._serialize(payload)) == {"a": 1}
+
+    async def test_raw_ops_not_connected(self):
+        """Test get_raw/set_raw fall back on failure."""
+        client = RedisClient(RedisConfig(port=1))
+        assert await client.get_raw("k") is None
+        assert await client.set_raw("k", b"v") is False
+
+    async def test_ops_not_connected_return_fallbacks(self):
+        """Test every operation logs and returns its fallback on failure."""
+        client = RedisClient(RedisConfig(port=1))
+        assert await client.get("k", default="fallback") == "fallback"
+        assert await client.set("k", "v") is False
+        assert await client.delete("k") == 0
+        assert await client.exists("k") == 0
+        assert await client.expire("k", 10) is False
+        assert await client.ttl("k") == -2
+        assert await client.increment("k") == 0
+        assert await client.decrement("k") == 0
+        assert await client.scan_keys("*") == []
+        assert await client.ping() is False
+
+    async def test_failure_logs_keys_not_values(self, caplog):
+        """Test failed operations log the key(s) but never the values."""
+        client = RedisClient(RedisConfig(port=1))
+        await client.set("user:1", "secret-value")
+        await client.mset({"user:2": "secret-payload"})
+
+        assert "'user:1'" in caplog.text
+        assert "['user:2']" in caplog.text
+        assert "secret" not in caplog.text
+
+    def test_ops_keep_metadata(self):
+        """Test the error-handling wrapper preserves names and docs."""
+        assert RedisClient.get.__name__ == "get"
+        assert "Get value from Redis" in RedisClient.get.__doc__
+
+
+class TestSharedConnectionPool:
+    """Test connection pool sharing between clients."""
+
+    async def test_clients_with_same_settings_share_pool(self):
+        """Test identical configurations reuse one pool until all close."""
+        client1 = RedisClient(RedisConfig(key_prefix="a:"))
+        client2 = RedisClient(RedisConfig(key_prefix="b:"))
+        await client1.connect()
+        await client2.connect()
+
+        pool = client1._client.connection_pool
+        assert client2._client.connection_pool is pool
+        assert RedisClient.shared_pool(RedisConfig()) is pool
+        await RedisClient.release_shared_pool(RedisConfig())
+
+        await client1.close()
+        assert RedisClient.shared_pool(RedisConfig()) is pool
+        await RedisClient.release_shared_pool(RedisConfig())
+
+        await client2.close()
+        assert RedisClient.shared_pool(RedisConfig()) is not pool
+        await RedisClient.release_shared_pool(RedisConfig())
+
+    async def test_released_shared_pool_disconnected(self):
+        """Test a pool obtained from shared_pool() is disconnected on release."""
+        pool = RedisClient.shared_pool(RedisConfig())
+        pool.disconnect = AsyncMock()
+
+        client = RedisClient()
+        await client.connect()
+        await RedisClient.release_shared_pool(RedisConfig())
+        pool.disconnect.assert_not_awaited()
+
+        await client.close()
+        pool.disconnect.assert_awaited_once()
+
+        # Releasing an unknown pool is a no-op
+        await RedisClient.release_shared_pool(RedisConfig())
+
+    async def test_different_db_uses_separate_pool(self):
+        """Test differing connection settings get their own pool."""
+        assert RedisClient.shared_pool(RedisConfig(db=0)) is not RedisClient.shared_pool(
+            RedisConfig(db=1)
+        )
+        await RedisClient.release_shared_pool(RedisConfig(db=0))
+        await RedisClient.release_shared_pool(RedisConfig(db=1))
+
+    async def test_pool_uses_resp3_by_default(self):
+        """Test the pool is created with RESP3 and a health check interval."""
+        pool = RedisClient.shared_pool(RedisConfig())
+        assert pool.connection_kwargs["protocol"] == 3
+        assert pool.connection_kwargs["health_check_interval"] == 30
+        await RedisClient.release_shared_pool(RedisConfig())
+
+    async def test_ssl_uses_tls_connection(self):
+        """Test ssl=True selects the TLS connection class."""
+        from redis.asyncio.connection import SSLConnection
+
+        pool = RedisClient.shared_pool(RedisConfig(ssl=True))
+        assert pool.connection_class is SSLConnection
+        await RedisClient.release_shared_pool(RedisConfig(ssl=True))
@@ -4,10 +4,20 @@ Unit tests for caching decorators.
 Tests cached and cache_aside decorators.
 """
 
+import asyncio
 import pytest
 import json
-from internal_cache.decorators import _generate_cache_key, cached, cache_aside, _invalidate_cache
-from internal_cache import RedisClient, RedisConfig
+import math
+from collections import OrderedDict
+from internal_cache.decorators import (
+    _generate_cache_key,
+    _memoizable,
+    cached,
+    cache_aside,
+    cache_aside_batch,
+    _invalidate_cache,
+)
+from internal_cache import RedisClient, RedisConfig, decorators
 
 
 class TestGenerateCacheKey:
@@ -29,20 +39,37 @@ class TestGenerateCacheKey:
 
         key = _generate_cache_key(my_func, (1,), {"b": 20})
         assert "my_func" in key
-        assert "b=" in key
+        assert key != _generate_cache_key(my_func, (1,), {"b": 30})
 
-    def test_long_key_hashing(self):
-        """Test that long keys are hashed."""
+    def test_kwargs_order_independent(self):
+        """Test kwargs produce the same key regardless of order."""
+        def my_func(a=1, b=2):
+            return a + b
+
+        key1 = _generate_cache_key(my_func, (), {"a": 1, "b": 2})
+        key2 = _generate_cache_key(my_func, (), {"b": 2, "a": 1})
+        assert key1 == key2
+
+    def test_deterministic(self):
+        """Test same arguments always produce the same key."""
+        def my_func(a, b):
+            return a + b
+
+        assert _generate_cache_key(my_func, (1, 2), {}) == _generate_cache_key(my_func, (1, 2), {})
+        assert _generate_cache_key(my_func, (1, 2), {}) != _generate_cache_key(my_func, (2, 1), {})
+
+    def test_fixed_length_key(self):
+        """Test that keys have a fixed length regardless of argument size."""
         def my_func_with_very_long_name_that_exceeds_limit(*args):
             pass
 
-        # Create args that will make key > 200 chars
+        short_key = _generate_cache_key(my_func_with_very_long_name_that_exceeds_limit, ("x",), {})
         long_args = tuple(["x" * 50 for _ in range(10)])
         key = _generate_cache_key(my_func_with_very_long_name_that_exceeds_limit, long_args, {})
 
-        # Should be hashed
-        assert len(key) < 200
-        assert "cache:my_func_with_very_long_name_that_exceeds_limit:" in key
+        assert len(key) == len(short_key)
+        assert "cache:" in key
+        assert "my_func_with_very_long_name_that_exceeds_limit:" in key
 
     def test_json_serializable_args(self):
         """Test with JSON serializable arguments."""
@@ -55,13 +82,330 @@ class TestGenerateCacheKey:
     def test_non_json_serializable_args(self):
         """Test with non-JSON serializable arguments."""
         class CustomClass:
+            def __init__(self, name):
+                self.name = name
+
             def __str__(self):
-                return "custom"
+                return self.name
 
         def my_func(obj):
             return obj
 
-        obj = CustomClass()
-        key = _generate_cache_key(my_func, (obj,), {})
+        key = _generate_cache_key(my_func, (CustomClass("a"),), {})
         assert "my_func" in key
-        assert "custom" in key
+        assert key == _generate_cache_key(my_func, (CustomClass("a"),), {})
+        assert key != _generate_cache_key(my_func, (CustomClass("b"),), {})
+
+    def test_tuple_and_list_args_differ(self):
+        """Test a tuple and a list with the same items get different keys."""
+        def my_func(items):
+            return items
+
+        assert _generate_cache_key(my_func, ((1, 2),), {}) != _generate_cache_key(
+            my_func, ([1, 2],), {}
+        )
+        assert _generate_cache_key(my_func, (), {"items": (1, 2)}) != _generate_cache_key(
+            my_func, (), {"items": [1, 2]}
+        )
+
+    def test_str_fallback_does_not_collide_with_scalars(self):
+        """Test an object whose str() is "1" does not share the key of the int 1."""
+        class One:
+            def __str__(self):
+                return "1"
+
+        def my_func(value):
+            return value
+
+        assert _generate_cache_key(my_func, (One(),), {}) != _generate_cache_key(
+            my_func, (1,), {}
+        )
+
+
+class TestCachedKeyMemoization:
+    """Test memoization of generated cache keys."""
+
+    def test_memoizable_scalars(self):
+        """Test only immutable scalar arguments are memoizable."""
+        assert _memoizable((1, "a", True, None, b"x"), {"k": 1})
+        assert not _memoizable((2.0,), {})
+        assert not _memoizable(([1],), {})
+        assert not _memoizable((), {"k": {"a": 1}})
+
+    def test_cache_key_cache_clear_exposed(self):
+        """Test the memoized key cache can be cleared from the wrapper."""
+        client = RedisClient()
+
+        @cached(client)
+        async def my_func(a):
+            return a
+
+        assert callable(my_func.cache_key_cache_clear)
+        my_func.cache_key_cache_clear()
+
+    def test_equal_scalars_of_different_types_differ(self):
+        """Test 1, 1.0 and True do not collapse into the same key."""
+        def my_func(a):
+            return a
+
+        keys = {_generate_cache_key(my_func, (v,), {}) for v in (1, 1.0, True)}
+        assert len(keys) == 3
+
+
+    async def test_signed_zeros_get_own_keys(self):
+        """Test -0.0 does not reuse the key memoized for 0.0."""
+        client = RedisClient()
+
+        @cached(client, ttl=60, local_ttl=30)
+        async def my_func(a):
+            return a
+
+        assert math.copysign(1, await my_func(0.0)) == 1
+        assert math.copysign(1, await my_func(-0.0)) == -1
+
+
+class TestCachedLocalCache:
+    """Test the in-process L1 cache in front of Redis."""
+
+    async def test_local_hit_skips_function(self):
+        """Test repeat calls are served from the local cache."""
+        client = RedisClient()
+        call_count = 0
+
+        @cached(client, ttl=60, local_ttl=30)
+        async def my_func(a):
+            nonlocal call_count
+            call_count += 1
+            return a * 2
+
+        assert await my_func(2) == 4
+        assert await my_func(2) == 4
+        assert call_count == 1
+
+    async def test_local_invalidate(self):
+        """Test local_invalidate drops the local entry."""
+        client = RedisClient()
+        call_count = 0
+
+        @cached(client, ttl=60, local_ttl=30)
+        async def my_func(a):
+            nonlocal call_count
+            call_count += 1
+            return a
+
+        await my_func(1)
+        assert my_func.local_invalidate(1) is True
+        assert my_func.local_invalidate(1) is False
+        await my_func(1)
+        assert call_count == 2
+
+    async def test_local_cache_disabled_by_default(self):
+        """Test no local caching happens without local_ttl."""
+        client = RedisClient()
+        call_count = 0
+
+        @cached(client, ttl=60)
+        async def my_func(a):
+            nonlocal call_count
+            call_count += 1
+            return a
+
+        await my_func(1)
+        await my_func(1)
+        assert call_count == 2
+
+    def test_store_local_evicts_least_recently_used(self, monkeypatch):
+        """Test the least recently used entry is evicted at capacity."""
+        monkeypatch.setattr(decorators, "_LOCAL_CACHE_SIZE", 3)
+        local = OrderedDict(
+            (key, (float("inf"), key)) for key in ("old", "used", "new")
+        )
+
+        assert decorators._get_local(local, "old") == "old"
+        decorators._store_local(local, "k1", "v1", float("inf"))
+        assert list(local) == ["new", "old", "k1"]
+
+        decorators._store_local(local, "new", "v2", float("inf"))
+        assert list(local) == ["old", "k1", "new"]
+        assert local["new"] == (float("inf"), "v2")
+
+    def test_get_local_drops_expired(self):
+        """Test expired entries are dropped when read."""
+        local = OrderedDict({"k": (0.0, "v")})
+        assert decorators._get_local(local, "k") is None
+        assert not local
+
+
+class TestCachedSingleFlight:
+    """Test coalescing of concurrent cache misses."""
+
+    async def test_concurrent_misses_execute_once(self):
+        """Test concurrent callers share a single execution."""
+        client = RedisClient()
+        call_count = 0
+        release = asyncio.Event()
+
+        @cached(client, ttl=60)
+        async def my_func(a):
+            nonlocal call_count
+            call_count += 1
+            await release.wait()
+            return a * 2
+
+        tasks = [asyncio.create_task(my_func(3)) for _ in range(5)]
+        while call_count == 0:
+            await asyncio.sleep(0.01)
+        # Give the remaining callers time to fail their cache read and queue up
+        await asyncio.sleep(0.2)
+        release.set()
+
+        assert await asyncio.gather(*tasks) == [6] * 5
+        assert call_count == 1
+
+    async def test_exception_propagates_to_all_waiters(self):
+        """Test a failing execution raises in every coalesced caller."""
+        client = RedisClient()
+        release = asyncio.Event()
+
+        @cached(client, ttl=60)
+        async def my_func(a):
+            await release.wait()
+            raise ValueError("boom")
+
+        tasks = [asyncio.create_task(my_func(1)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(r, ValueError) for r in results)
+
+    async def test_cancelled_leader_hands_over(self):
+        """Test cancelling the executing caller lets a waiting caller take over."""
+        client = RedisClient()
+        call_count = 0
+        release = asyncio.Event()
+
+        @cached(client, ttl=60)
+        async def my_func(a):
+            nonlocal call_count
+            call_count += 1
+            await release.wait()
+            return a * 2
+
+        leader = asyncio.create_task(my_func(3))
+        while call_count == 0:
+            await asyncio.sleep(0.01)
+        followers = [asyncio.create_task(my_func(3)) for _ in range(3)]
+        await asyncio.sleep(0.2)
+
+        leader.cancel()
+        while call_count == 1:
+            await asyncio.sleep(0.01)
+        release.set()
+
+        assert await asyncio.gather(*followers) == [6] * 3
+        assert call_count == 2
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+    async def test_result_shared_until_stored(self, monkeypatch):
+        """Test callers reuse the result while the background write is pending."""
+        client = RedisClient()
+        call_count = 0
+        written = asyncio.Event()
+
+        async def slow_set(self, key, value, ttl=None):
+            await written.wait()
+
+        monkeypatch.setattr(RedisClient, "set", slow_set)
+
+        @cached(client, ttl=60, background_write=True)
+        async def my_func(a):
+            nonlocal call_count
+            call_count += 1
+            return a
+
+        assert await my_func(1) == 1
+        assert await my_func(1) == 1
+        assert call_count == 1
+
+        written.set()
+        await asyncio.gather(*decorators._pending_writes)
+        await asyncio.sleep(0)
+        assert await my_func(1) == 1
+        assert call_count == 2
+
+    async def test_different_keys_not_coalesced(self):
+        """Test calls with different arguments run independently."""
+        client = RedisClient()
+        call_count = 0
+
+        @cached(client, ttl=60)
+        async def my_func(a):
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0)
+            return a
+
+        assert await asyncio.gather(my_func(1), my_func(2)) == [1, 2]
+        assert call_count == 2
+
+
+class TestBackgroundWrite:
+    """Test fire-and-forget cache writes."""
+
+    async def test_cached_background_write_scheduled(self):
+        """Test the cache write runs as a tracked background task."""
+        client = RedisClient()
+
+        @cached(client, ttl=60, background_write=True)
+        async def my_func(a):
+            return a
+
+        assert await my_func(1) == 1
+        assert len(decorators._pending_writes) == 1
+
+        await asyncio.gather(*decorators._pending_writes)
+        await asyncio.sleep(0)
+        assert not decorators._pending_writes
+
+    async def test_cache_aside_background_write_swallows_errors(self):
+        """Test failed background writes do not surface to the caller."""
+        client = RedisClient()
+
+        @cache_aside(client, ttl=60, key_func=lambda a: f"k:{a}", background_write=True)
+        async def my_func(a):
+            return a
+
+        assert await my_func(1) == 1
+        results = await asyncio.gather(*decorators._pending_writes, return_exceptions=True)
+        assert results == [None]
+
+
+class TestCacheAsideBatch:
+    """Test the batch cache-aside decorator."""
+
+    async def test_fetches_missing_ids_in_order(self):
+        """Test misses are fetched in one call and results keep id order."""
+        client = RedisClient()
+        calls = []
+
+        @cache_aside_batch(client, ttl=60, key_func=lambda user_id: f"user:{user_id}")
+        async def get_users(user_ids):
+            calls.append(list(user_ids))
+            return {user_id: {"id": user_id} for user_id in user_ids if user_id != 2}
+
+        result = await get_users([3, 1, 2])
+        assert list(result) == [3, 1]
+        assert calls == [[3, 1, 2]]
+
+    async def test_empty_ids(self):
+        """Test an empty id list short-circuits."""
+        client = RedisClient()
+
+        @cache_aside_batch(client)
+        async def get_users(user_ids):
+            raise AssertionError("should not be called")
+
+        assert await get_users([]) == {}
+
@@ -4,8 +4,9 @@ Unit tests for distributed locks.
 Tests DistributedLock and with_lock decorator.
 """
 
+import asyncio
+
 import pytest
-import uuid
 from internal_cache.locks import DistributedLock, with_lock
 from internal_cache import RedisClient, RedisConfig
 
@@ -23,15 +24,17 @@ class TestDistributedLock:
         assert lock.timeout == 30
         assert lock.auto_renewal is True
         assert isinstance(lock._lock_value, str)
-        # UUID validation
-        try:
-            uuid.UUID(lock._lock_value)
-            valid_uuid = True
-        except ValueError:
-            valid_uuid = False
-        assert valid_uuid
+        # 128-bit random hex token
+        assert len(lock._lock_value) == 32
+        int(lock._lock_value, 16)
         assert lock._renewal_task is None
 
+    def test_tokens_unique_per_instance(self):
+        """Test each lock instance gets its own token."""
+        client = RedisClient()
+        tokens = {DistributedLock(client, "same")._lock_value for _ in range(100)}
+        assert len(tokens) == 100
+
     def test_init_defaults(self):
         """Test lock initialization with defaults."""
         client = RedisClient()
@@ -47,3 +50,153 @@ class TestDistributedLock:
         lock = DistributedLock(client, "my_resource")
         assert lock.lock_name == "lock:my_resource"
         assert lock.lock_name.startswith("lock:")
+
+    @pytest.mark.asyncio
+    async def test_notifier_watch_not_connected(self):
+        """Test watching falls back to polling when not connected."""
+        from internal_cache.locks import _lock_notifier
+
+        client = RedisClient()
+        notifier = _lock_notifier(client)
+        assert await notifier.watch(client, b"lock:my_resource") is None
+        assert notifier._waiters == {}
+        assert notifier.listening is False
+
+    @pytest.mark.asyncio
+    async def test_notifier_shared_per_pool_and_prefix(self):
+        """Test clients on the same pool and prefix share one notifier."""
+        from internal_cache.locks import _lock_notifier
+
+        assert _lock_notifier(RedisClient()) is _lock_notifier(RedisClient())
+        assert _lock_notifier(RedisClient()) is not _lock_notifier(
+            RedisClient(RedisConfig(key_prefix="app:"))
+        )
+
+    def test_notifier_maps_messages_to_keys(self):
+        """Test release and removal notifications map to the freed lock key."""
+        from internal_cache.locks import _LockNotifier
+
+        notifier = _LockNotifier(0, b"app:")
+        assert notifier._patterns == (b"app:lock:*:free", b"__keyspace@0__:app:lock:*")
+        assert notifier._freed_key(b"app:lock:a:free", b"1") == b"app:lock:a"
+        assert notifier._freed_key(b"__keyspace@0__:app:lock:a", b"expired") == b"app:lock:a"
+        assert notifier._freed_key("__keyspace@0__:app:lock:a", "del") == b"app:lock:a"
+        assert notifier._freed_key(b"__keyspace@0__:app:lock:a", b"set") is None
+
+    def test_notifier_escapes_prefix_pattern(self):
+        """Test glob characters in the key prefix are matched literally."""
+        from internal_cache.locks import _LockNotifier
+
+        notifier = _LockNotifier(1, b"a*[b]:")
+        assert notifier._patterns[0] == b"a\\*\\[b\\]:lock:*:free"
+
+    @pytest.mark.asyncio
+    async def test_wait_for_release_wakes_on_event(self):
+        """Test a set event ends the wait before the timeout."""
+        event = asyncio.Event()
+        asyncio.get_running_loop().call_later(0.01, event.set)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await DistributedLock._wait_for_release(event, 1.0, 0.05)
+        assert loop.time() - start < 0.5
+
+    @pytest.mark.asyncio
+    async def test_wait_for_release_polls_without_pubsub(self):
+        """Test waiting without a subscription sleeps for the poll delay."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await DistributedLock._wait_for_release(None, 1.0, 0.05)
+        assert 0.04 <= loop.time() - start < 0.5
+
+    def test_backoff_grows_with_jitter(self):
+        """Test retry delays grow exponentially, jittered and capped."""
+        from internal_cache.locks import _BACKOFF_CAP, _backoff
+
+        for attempt, base in ((0, 0.005), (3, 0.04)):
+            delays = {_backoff(attempt) for _ in range(50)}
+            assert all(base * 0.5 <= delay < base * 1.5 for delay in delays)
+            assert len(delays) > 1
+        assert _backoff(100) < _BACKOFF_CAP * 1.5
+
+    @pytest.mark.asyncio
+    async def test_acquire_unreachable_returns_false(self):
+        """Test acquire reports failure instead of raising when Redis is down."""
+        client = RedisClient(RedisConfig(port=1))
+        lock = DistributedLock(client, "my_resource")
+        assert await lock.acquire(blocking=False) is False
+        assert await lock.acquire(timeout=0.2) is False
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_acquire_many_empty(self):
+        """Test acquiring no locks succeeds trivially."""
+        assert await DistributedLock.acquire_many(RedisClient(), []) == []
+
+    @pytest.mark.asyncio
+    async def test_acquire_many_unreachable_returns_none(self):
+        """Test acquire_many reports failure when Redis is down."""
+        client = RedisClient(RedisConfig(port=1))
+        assert await DistributedLock.acquire_many(client, ["a", "b"]) is None
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_local_gate_shared_per_key(self):
+        """Test waiters for the same key share one in-process gate."""
+        from internal_cache.locks import _local_gate
+
+        gate = _local_gate(b"lock:a")
+        assert _local_gate(b"lock:a") is gate
+        assert _local_gate(b"lock:b") is not gate
+
+    @pytest.mark.asyncio
+    async def test_blocked_waiter_times_out_on_local_gate(self):
+        """Test a waiter queued behind a local one still honours its timeout."""
+        from internal_cache.locks import _local_gate
+
+        lock = DistributedLock(RedisClient(), "gated")
+        gate = _local_gate(lock._full_key)
+        async with gate:
+            assert await lock.acquire(timeout=0.05) is False
+
+    @pytest.mark.asyncio
+    async def test_is_locked_unreachable(self):
+        """Test is_locked is a coroutine reporting False when Redis is down."""
+        client = RedisClient(RedisConfig(port=1))
+        lock = DistributedLock(client, "my_resource")
+        assert await lock.is_locked() is False
+        assert lock.owned is False
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_renew_loop_registers_with_scheduler(self):
+        """Test auto-renewal registers with the loop's shared scheduler."""
+        from internal_cache.locks import _renewal_scheduler
+
+        client = RedisClient(RedisConfig(port=1))
+        locks = [DistributedLock(client, f"renew:{i}", timeout=1) for i in range(3)]
+        tasks = [asyncio.create_task(lock._renew_loop()) for lock in locks]
+        await asyncio.sleep(0)
+
+        scheduler = _renewal_scheduler()
+        assert set(scheduler._locks) == set(locks)
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        assert scheduler._locks == {}
+
+    def test_key_and_token_encoded_once(self):
+        """Test the prefixed key and token are precomputed as bytes."""
+        client = RedisClient(RedisConfig(key_prefix="app:"))
+        lock = DistributedLock(client, "my_resource")
+        assert lock._full_key == b"app:lock:my_resource"
+        assert lock._value_bytes == lock._lock_value.encode()
+
+    def test_script_shas_precomputed(self):
+        """Test script SHA1s match what SCRIPT LOAD would return."""
+        import hashlib
+
+        from internal_cache.locks import _SCRIPTS, _SHAS
+
+        for name, script in _SCRIPTS.items():
+            assert _SHAS[name] == hashlib.sha1(script.encode()).hexdigest()
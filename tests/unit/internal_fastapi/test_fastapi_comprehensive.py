@@ -9,7 +9,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from internal_fastapi.api.fastapi import FastAPISetup
+from internal_fastapi.api.fastapi import FastAPISetup, FastCORSMiddleware
 from internal_fastapi.api.config import APIConfig
 
 try:
@@ -136,6 +136,47 @@ class TestFastAPISetupCORS:
         # CORS middleware should be configured
         assert response.status_code in [200, 405]  # Options or method not allowed
 
+    def test_cors_origin_checks(self):
+        """Test literal origins use a set and wildcard origins a regex."""
+        middleware = FastCORSMiddleware(
+            app=FastAPI(),
+            allow_origins=["http://localhost:3000", "https://*.example.com"],
+            allow_origin_regex=r"https://app\.test",
+        )
+
+        assert middleware.allow_origins == frozenset({"http://localhost:3000"})
+        assert middleware.is_allowed_origin("http://localhost:3000")
+        assert middleware.is_allowed_origin("https://api.example.com")
+        assert middleware.is_allowed_origin("https://a.b.example.com")
+        assert middleware.is_allowed_origin("https://app.test")
+        assert not middleware.is_allowed_origin("https://example.com")
+        assert not middleware.is_allowed_origin("https://evil.com/.example.com")
+        assert not middleware.is_allowed_origin("http://localhost:8000")
+
+    def test_cors_allow_all(self):
+        """Test the "*" origin still allows everything."""
+        middleware = FastCORSMiddleware(app=FastAPI(), allow_origins=["*"])
+        assert middleware.is_allowed_origin("https://anything.test")
+
+    def test_cors_preflight_allowed_origin(self, api_config):
+        """Test a preflight from an allowed origin echoes the origin."""
+        app = FastAPISetup(api_config).create_fastapi_app()
+
+        @app.get("/test")
+        def test_route():
+            return {"message": "test"}
+
+        response = TestClient(app).options(
+            "/test",
+            headers={
+                "Origin": "http://localhost:3000",
+                "Access-Control-Request-Method": "GET",
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+
 
 class TestFastAPISetupWithSetupHandler:
     """Test FastAPISetup with setup handler."""
@@ -171,6 +212,41 @@ class TestFastAPISetupWithSetupHandler:
 
         assert isinstance(app, FastAPI)
 
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not HAS_INTERNAL_BASE, reason="internal_base not available")
+    async def test_parallel_services_start_concurrently(self, api_config):
+        """Test parallel=True starts the services at the same time."""
+        import asyncio
+
+        started = 0
+
+        class TestService(AsyncService):
+            async def _start(self) -> None:
+                nonlocal started
+                started += 1
+                # Sequential startup would never let the other service in
+                for _ in range(100):
+                    if started == 2:
+                        return
+                    await asyncio.sleep(0.01)
+                raise RuntimeError("services did not start concurrently")
+
+            async def _stop(self) -> None:
+                pass
+
+            async def _health_check(self) -> bool:
+                return True
+
+        async def setup_handler():
+            return [TestService(name="a"), TestService(name="b")]
+
+        setup = FastAPISetup(api_config, setup_handler=setup_handler, parallel=True)
+
+        app = setup.create_fastapi_app()
+
+        async with app.router.lifespan_context(app):
+            assert started == 2
+
 
 class TestFastAPISetupIntegration:
     """Integration tests for FastAPISetup."""
@@ -211,3 +287,15 @@ class TestFastAPISetupIntegration:
         assert app.description == "Test Description"
         assert app.version == "1.0.0"
         assert app.debug is True
+
+
+class TestFastAPISetupCoreConfig:
+    """Test FastAPISetup with an APIConfigCore."""
+
+    def test_create_app_from_core_config(self):
+        """Test an APIConfigCore can be passed directly."""
+        setup = FastAPISetup(APIConfig(title="Core API", debug=False).to_core())
+        app = setup.create_fastapi_app()
+
+        assert app.title == "Core API"
+        assert app.debug is False
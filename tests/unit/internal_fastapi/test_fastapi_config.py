@@ -4,8 +4,10 @@ Unit tests for internal_fastapi configuration.
 Tests APIConfig and Environment.
 """
 
+from dataclasses import FrozenInstanceError, replace
+
 import pytest
-from internal_fastapi import APIConfig, Environment
+from internal_fastapi import APIConfig, APIConfigCore, Environment
 
 
 class TestEnvironment:
@@ -104,3 +106,63 @@ class TestAPIConfig:
         assert config.workers == 8
         assert config.debug is False
         assert len(config.cors_origins) == 2
+
+
+class TestAPIConfigCore:
+    """Test APIConfigCore dataclass."""
+
+    def test_defaults_come_from_api_config(self):
+        """Test the core has no defaults of its own."""
+        with pytest.raises(TypeError):
+            APIConfigCore()
+
+        assert APIConfig().to_core().title == APIConfig().title
+
+    def test_to_core(self):
+        """Test converting a parsed APIConfig."""
+        config = APIConfig(env=Environment.PROD, port=9000, cors_origins=["https://a.com"])
+        core = config.to_core()
+
+        assert core.env is Environment.PROD
+        assert core.port == 9000
+        assert core.cors_origins == ("https://a.com",)
+
+    def test_immutable_and_slotted(self):
+        """Test the core config is frozen and has no instance dict."""
+        core = APIConfig().to_core()
+
+        with pytest.raises(FrozenInstanceError):
+            core.port = 1
+        assert not hasattr(core, "__dict__")
+
+    def test_validation(self):
+        """Test port and worker validation."""
+        core = APIConfig().to_core()
+
+        with pytest.raises(ValueError, match="Port must be between"):
+            replace(core, port=0)
+        with pytest.raises(ValueError, match="Workers must be at least 1"):
+            replace(core, workers=0)
+
+
+class TestAPIConfigTrusted:
+    """Test APIConfig.trusted."""
+
+    def test_trusted_clone(self):
+        """Test cloning a validated config without re-validating."""
+        config = APIConfig(env=Environment.PROD, port=9000, workers=4)
+        clone = APIConfig.trusted(**config.model_dump())
+
+        assert clone == config
+        assert clone.to_core() == config.to_core()
+
+    def test_trusted_fills_defaults(self):
+        """Test missing fields get their defaults."""
+        config = APIConfig.trusted(title="Fast")
+
+        assert config.title == "Fast"
+        assert config.port == 8000
+
+    def test_trusted_skips_validation(self):
+        """Test validators don't run for trusted values."""
+        assert APIConfig.trusted(port=0).port == 0
@@ -82,6 +82,18 @@ class TestHealthCheck:
         assert len(health.checks) == 1
         assert health.checks[0][0] == "database"
         assert health.checks[0][1] == check_db
+        assert health.checks[0][2] is False
+
+    def test_add_check_records_async(self):
+        """Test coroutine functions are detected once when added."""
+        health = HealthCheck()
+
+        async def check_redis():
+            return {"status": "ok"}
+
+        health.add_check("redis", check_redis)
+
+        assert health.checks == [("redis", check_redis, True)]
 
     def test_add_multiple_checks(self):
         """Test adding multiple checks."""
@@ -163,6 +175,103 @@ class TestHealthCheck:
         assert data["status"] == "healthy"
         assert data["details"]["cache"]["status"] == "ok"
 
+    def test_health_endpoint_runs_async_checks_concurrently(self):
+        """Test async checks overlap and results keep registration order."""
+        import asyncio
+
+        app = FastAPI()
+        health = HealthCheck(app)
+        running = 0
+        peak = 0
+
+        def make_check(name):
+            async def check():
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+                return {"status": "ok", "name": name}
+            return check
+
+        async def failing_check():
+            raise RuntimeError("Cache down")
+
+        health.add_check("db", make_check("db"))
+        health.add_check("sync", lambda: {"status": "ok"})
+        health.add_check("cache", failing_check)
+        health.add_check("queue", make_check("queue"))
+
+        data = TestClient(app).get("/health").json()
+
+        assert peak == 2
+        assert list(data["details"]) == ["db", "sync", "cache", "queue"]
+        assert data["details"]["cache"] == {"status": "error", "error": "Cache down"}
+        assert data["status"] == "unhealthy"
+
+    def test_health_endpoint_caches_healthy_response(self):
+        """Test a healthy response is reused within the cache TTL."""
+        app = FastAPI()
+        health = HealthCheck(app, cache_ttl=60)
+        calls = 0
+
+        def check_db():
+            nonlocal calls
+            calls += 1
+            return {"status": "ok"}
+
+        health.add_check("database", check_db)
+        client = TestClient(app)
+
+        first = client.get("/health")
+        second = client.get("/health")
+
+        assert calls == 1
+        assert second.content == first.content
+        assert second.headers["content-type"] == "application/json"
+        assert second.json() == {"status": "healthy", "details": {"database": {"status": "ok"}}}
+
+        # Adding a check invalidates the cached response
+        health.add_check("cache", lambda: {"status": "ok"})
+        assert "cache" in client.get("/health").json()["details"]
+        assert calls == 2
+
+    def test_health_endpoint_does_not_cache_unhealthy(self):
+        """Test unhealthy responses are always recomputed."""
+        app = FastAPI()
+        health = HealthCheck(app, cache_ttl=60)
+        calls = 0
+
+        def check_db():
+            nonlocal calls
+            calls += 1
+            return {"status": "down"}
+
+        health.add_check("database", check_db)
+        client = TestClient(app)
+        client.get("/health")
+        client.get("/health")
+
+        assert calls == 2
+
+    def test_health_endpoint_cache_disabled(self):
+        """Test cache_ttl=0 runs the checks on every request."""
+        app = FastAPI()
+        health = HealthCheck(app, cache_ttl=0)
+        calls = 0
+
+        def check_db():
+            nonlocal calls
+            calls += 1
+            return {"status": "ok"}
+
+        health.add_check("database", check_db)
+        client = TestClient(app)
+        client.get("/health")
+        client.get("/health")
+
+        assert calls == 2
+
     def test_health_endpoint_check_error(self):
         """Test health endpoint when check raises error."""
         app = FastAPI()
@@ -228,6 +337,18 @@ class TestHealthCheck:
         response = client.get("/health")
         assert response.status_code == 200
 
+    def test_schema_documents_health_response(self):
+        """Test the pre-serialized response is still documented as HealthResponse."""
+        app = FastAPI()
+        HealthCheck().add_to_app(app, include_in_schema=True)
+
+        schema = app.openapi()
+        content = schema["paths"]["/health"]["get"]["responses"]["200"]["content"]
+        assert content["application/json"]["schema"] == {
+            "$ref": "#/components/schemas/HealthResponse"
+        }
+        assert "HealthResponse" in schema["components"]["schemas"]
+
 
 class TestCreateHealthEndpoint:
     """Test create_health_endpoint function."""
@@ -126,6 +126,26 @@ class TestLifecycleManager:
         assert manual_service.started is True
         assert all(s.started for s in manager._services)
 
+    @pytest.mark.asyncio
+    async def test_start_ignores_services_added_while_starting(self):
+        """Test a service added during start is registered but not started."""
+        manager = LifecycleManager()
+        late = MockService("Late")
+
+        class AddingService(MockService):
+            async def start(self) -> None:
+                manager.add_service(late)
+                await super().start()
+
+        first = AddingService("First")
+        manager.add_service(first)
+
+        await manager.start()
+
+        assert first.started is True
+        assert late.started is False
+        assert manager._services == [first, late]
+
     @pytest.mark.asyncio
     async def test_start_already_running(self):
         """Test starting when already running."""
@@ -154,6 +174,105 @@ class TestLifecycleManager:
 
         assert manager._state == ServiceState.FAILED
 
+    @pytest.mark.asyncio
+    async def test_parallel_start_and_stop_overlap(self):
+        """Test a parallel manager starts and stops services concurrently."""
+        running = 0
+        peak = 0
+
+        class SlowService(MockService):
+            async def _overlap(self) -> None:
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+            async def start(self) -> None:
+                await self._overlap()
+                await super().start()
+
+            async def stop(self) -> None:
+                await self._overlap()
+                await super().stop()
+
+        manager = LifecycleManager(parallel=True)
+        services = [SlowService(f"Service{i}") for i in range(3)]
+        for service in services:
+            manager.add_service(service)
+
+        await manager.start()
+        assert peak == 3
+        assert all(service.started for service in services)
+
+        peak = 0
+        await manager.stop()
+        assert peak == 3
+        assert all(service.stopped for service in services)
+
+    @pytest.mark.asyncio
+    async def test_parallel_start_failure(self):
+        """Test a parallel start raises the failure after all starts ran."""
+        manager = LifecycleManager(parallel=True)
+        ok = MockService("Ok")
+        manager.add_service(MockService("Bad", fail_start=True))
+        manager.add_service(ok)
+
+        with pytest.raises(RuntimeError, match="Failed to start Bad"):
+            await manager.start()
+
+        assert ok.started is True
+        assert manager._state == ServiceState.FAILED
+
+    @pytest.mark.asyncio
+    async def test_parallel_start_cancelled(self):
+        """Test a service cancelled while starting leaves the manager FAILED."""
+        manager = LifecycleManager(parallel=True)
+        cancelled = MockService("Cancelled")
+
+        async def start():
+            raise asyncio.CancelledError
+
+        cancelled.start = start
+        manager.add_service(cancelled)
+
+        with pytest.raises(asyncio.CancelledError):
+            await manager.start()
+
+        assert manager._state == ServiceState.FAILED
+
+    @pytest.mark.asyncio
+    async def test_parallel_stop_logs_base_exceptions(self, caplog):
+        """Test a service cancelled while stopping is logged."""
+        manager = LifecycleManager(parallel=True)
+        cancelled = MockService("Cancelled")
+
+        async def stop():
+            raise asyncio.CancelledError
+
+        cancelled.stop = stop
+        manager.add_service(cancelled)
+
+        await manager.start()
+        await manager.stop()
+
+        assert "Error stopping service Cancelled" in caplog.text
+        assert manager._state == ServiceState.STOPPED
+
+    @pytest.mark.asyncio
+    async def test_parallel_stop_with_error(self):
+        """Test a parallel stop still stops the other services on error."""
+        manager = LifecycleManager(parallel=True)
+        ok = MockService("Ok")
+        manager.add_service(MockService("Bad", fail_stop=True))
+        manager.add_service(ok)
+
+        await manager.start()
+        await manager.stop()
+
+        assert ok.stopped is True
+        assert manager._state == ServiceState.STOPPED
+
     @pytest.mark.asyncio
     async def test_stop_services(self):
         """Test stopping services."""
@@ -309,6 +428,44 @@ class TestLifecycleManager:
         assert manager._state == ServiceState.STOPPED
         assert service.stopped is True
 
+    @pytest.mark.asyncio
+    async def test_schedule_shutdown_tracks_task(self):
+        """Test signal-triggered shutdown tasks are referenced until done."""
+        manager = LifecycleManager()
+        service = MockService()
+        manager.add_service(service)
+        await manager.start()
+
+        manager._schedule_shutdown(signal.SIGTERM)
+        assert len(manager._shutdown_tasks) == 1
+
+        await asyncio.gather(*manager._shutdown_tasks)
+        await asyncio.sleep(0)  # Let the done callback run
+
+        assert manager._shutdown_tasks == set()
+        assert service.stopped is True
+
+    @pytest.mark.asyncio
+    async def test_fastapi_lifespan_waits_for_signal_shutdown(self):
+        """Test lifespan exit waits for an in-flight signal shutdown."""
+        stop_finished = asyncio.Event()
+
+        class SlowStopService(MockService):
+            async def stop(self) -> None:
+                await asyncio.sleep(0.05)
+                await super().stop()
+                stop_finished.set()
+
+        manager = LifecycleManager()
+        manager.add_service(SlowStopService())
+
+        async with manager.fastapi_lifespan()(FastAPI()):
+            manager._schedule_shutdown(signal.SIGTERM)
+            await asyncio.sleep(0)  # Shutdown is now in progress
+
+        assert stop_finished.is_set()
+        assert manager.status == ServiceState.STOPPED
+
 
 class TestServiceState:
     """Test ServiceState enum."""
@@ -8,7 +8,7 @@ import pytest
 import logging
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from internal_fastapi.logging.middleware import LoggingMiddleware
+from internal_fastapi.logging.middleware import LoggingMiddleware, _format_duration
 
 
 class TestLoggingMiddleware:
@@ -88,3 +88,74 @@ class TestLoggingMiddleware:
         # Should log request even without client info
         logs = [record.message for record in caplog.records]
         assert any("Request: GET /test" in log for log in logs)
+
+    def test_middleware_streams_response(self):
+        """Test streaming responses pass through with the timing header."""
+        from fastapi.responses import StreamingResponse
+
+        app = FastAPI()
+        app.add_middleware(LoggingMiddleware)
+
+        @app.get("/stream")
+        async def stream_endpoint():
+            async def chunks():
+                yield b"a"
+                yield b"b"
+            return StreamingResponse(chunks())
+
+        response = TestClient(app).get("/stream")
+
+        assert response.status_code == 200
+        assert response.content == b"ab"
+        assert response.headers["X-Process-Time"].endswith("ms")
+
+    def test_format_duration(self):
+        """Test nanosecond intervals are formatted as milliseconds."""
+        assert _format_duration(15_234_567) == "15.2ms"
+        assert _format_duration(99_999) == "0.0ms"
+        assert _format_duration(1_000_000_000) == "1000.0ms"
+
+    def test_middleware_skips_info_logs_when_disabled(self, caplog):
+        """Test nothing is logged at INFO when the level is disabled."""
+        app = FastAPI()
+        app.add_middleware(LoggingMiddleware)
+
+        @app.get("/test")
+        async def test_endpoint():
+            return {"message": "ok"}
+
+        with caplog.at_level(logging.WARNING, logger="internal_fastapi.logging.middleware"):
+            response = TestClient(app).get("/test")
+
+        assert response.status_code == 200
+        assert "X-Process-Time" in response.headers
+        assert not [r for r in caplog.records if r.name == "internal_fastapi.logging.middleware"]
+
+    def test_middleware_skips_excluded_paths(self, caplog):
+        """Test excluded paths pass through without logging or timing."""
+        app = FastAPI()
+        app.add_middleware(LoggingMiddleware, exclude_paths={"/health"})
+
+        @app.get("/health")
+        async def health():
+            return {"status": "ok"}
+
+        @app.get("/test")
+        async def test_endpoint():
+            return {"message": "ok"}
+
+        with caplog.at_level(logging.INFO):
+            client = TestClient(app)
+            health_response = client.get("/health")
+            test_response = client.get("/test")
+
+        assert health_response.status_code == 200
+        assert "X-Process-Time" not in health_response.headers
+        assert "X-Process-Time" in test_response.headers
+
+        logs = [
+            record.message for record in caplog.records
+            if record.name == "internal_fastapi.logging.middleware"
+        ]
+        assert not any("/health" in log for log in logs)
+        assert any("Request: GET /test" in log for log in logs)
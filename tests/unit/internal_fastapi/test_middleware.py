@@ -38,6 +38,14 @@ class TestAppTokenAuth:
         assert auth.settings.header_name == "X-Custom-Key"
         assert auth.settings.tokens == {"app1": "secret1"}
 
+    def test_config_is_frozen(self):
+        """Test settings can't change after auth tables are derived."""
+        from pydantic import ValidationError
+
+        config = AppTokenConfig(tokens={"app1": "token1"})
+        with pytest.raises(ValidationError):
+            config.enabled = False
+
     @pytest.mark.asyncio
     async def test_call_with_excluded_path(self):
         """Test __call__ with excluded path."""
@@ -92,6 +100,18 @@ class TestAppTokenAuth:
         result = await auth(request, api_key="token2")
         assert result == "app2"
 
+    @pytest.mark.asyncio
+    async def test_call_with_shared_token_returns_first_app(self):
+        """Test a token shared by several apps resolves to the first one."""
+        auth = AppTokenAuth(AppTokenConfig(tokens={"app1": "shared", "app2": "shared"}))
+
+        class MockRequest:
+            class URL:
+                path = "/api/data"
+            url = URL()
+
+        assert await auth(MockRequest(), api_key="shared") == "app1"
+
     @pytest.mark.asyncio
     async def test_call_with_invalid_token(self):
         """Test __call__ with invalid token."""
@@ -107,6 +127,18 @@ class TestAppTokenAuth:
         result = await auth(request, api_key="wrong_token")
         assert result is None
 
+    def test_token_index_uses_digests(self):
+        """Test tokens are indexed by digest and confirmed in constant time."""
+        import hashlib
+        from internal_fastapi.auth.middleware import _find_app
+
+        auth = AppTokenAuth(AppTokenConfig(tokens={"app1": "token1"}))
+
+        assert b"token1" not in auth._token_index
+        assert auth._token_index[hashlib.sha256(b"token1").digest()] == ("app1", b"token1")
+        assert _find_app(auth._token_index, b"token1") == "app1"
+        assert _find_app(auth._token_index, b"token") is None
+
     def test_is_path_excluded_exact_match(self):
         """Test exact path matching."""
         config = AppTokenConfig(exclude_paths={"/health", "/metrics"})
@@ -137,22 +169,69 @@ class TestAppTokenAuth:
         assert auth._is_path_excluded("/test") is False
         assert auth._is_path_excluded("/test12") is False
 
-    def test_convert_pattern_to_regex(self):
-        """Test glob pattern to regex conversion."""
-        config = AppTokenConfig()
+    def test_exclude_paths_compiled_once(self):
+        """Test exclude paths are split into exact paths, prefixes and globs."""
+        config = AppTokenConfig(
+            exclude_paths={"/health", "/api/public/*", "/docs*", "/v?", "/a/*/b"}
+        )
         auth = AppTokenAuth(config)
 
-        # Test * wildcard
-        regex = auth._convert_pattern_to_regex("/api/*/data")
-        assert regex.match("/api/users/data") is not None
-        assert regex.match("/api/posts/data") is not None
-        assert regex.match("/api/data") is None
+        assert auth._exact_excludes == frozenset({"/health"})
+        assert auth._prefix_excludes == ("/api/public/", "/docs")
+        assert len(auth._glob_matchers) == 2
+        assert auth._is_path_excluded("/docs/api") is True
+        assert auth._is_path_excluded("/a/x/b") is True
+        assert auth._is_path_excluded("/v1") is True
+        assert auth._is_path_excluded("/api/public/x") is True
+        assert auth._is_path_excluded("/v12") is False
+
+    def test_exclude_paths_without_globs(self):
+        """Test no glob matchers are built when all excludes are exact."""
+        auth = AppTokenAuth(AppTokenConfig(exclude_paths={"/health"}))
 
-        # Test ? wildcard
-        regex = auth._convert_pattern_to_regex("/test?")
-        assert regex.match("/test1") is not None
-        assert regex.match("/test2") is not None
-        assert regex.match("/test") is None
+        assert auth._prefix_excludes == ()
+        assert auth._glob_matchers == ()
+        assert auth._is_path_excluded("/health") is True
+        assert auth._is_path_excluded("/other") is False
+
+    @pytest.mark.parametrize(
+        "pattern, path, expected",
+        [
+            ("/api/*", "/api/", True),
+            ("/api/*", "/api/users/1", True),
+            ("/api/*", "/api", False),
+            ("/api/*/data", "/api/users/data", True),
+            ("/api/*/data", "/api/data", False),
+            ("*", "", True),
+            ("/a*b*c", "/abc", True),
+            ("/a*b*c", "/axxbyyc", True),
+            ("/a*b*c", "/axxbyy", False),
+            ("/ab*ba", "/aba", False),
+            ("/test?", "/test1", True),
+            ("/test?", "/test", False),
+            ("/v?/*/x", "/v1/a/b/x", True),
+            ("/v?/*/x", "/v12/a/x", False),
+            ("*?", "", False),
+        ],
+    )
+    def test_glob_matchers(self, pattern, path, expected):
+        """Test the linear glob matchers match whole paths."""
+        from internal_fastapi.auth.middleware import _compile_glob, _glob_match
+
+        assert _compile_glob(pattern)(path) is expected
+        assert _glob_match(pattern, path) is expected
+
+    def test_glob_matchers_linear_on_pathological_pattern(self):
+        """Test patterns that make regex backtrack still match quickly."""
+        import time
+        from internal_fastapi.auth.middleware import _compile_glob, _glob_match
+
+        pattern, path = "/" + "a*" * 20 + "b", "/" + "a" * 200
+        start = time.perf_counter()
+        assert _compile_glob(pattern)(path) is False
+        assert _glob_match(pattern, path) is False
+        assert _glob_match(pattern.replace("b", "?b"), path) is False
+        assert time.perf_counter() - start < 1.0
 
 
 class TestTokenAuthMiddleware:
@@ -247,6 +326,26 @@ class TestTokenAuthMiddleware:
         assert response.status_code == 401
         assert "Missing authentication token" in response.text
 
+    def test_rejections_use_prebuilt_json_bodies(self):
+        """Test 401 responses carry the static JSON bodies and headers."""
+        app = FastAPI()
+        app.add_middleware(TokenAuthMiddleware, settings=AppTokenConfig(tokens={"app1": "t"}))
+
+        @app.get("/api/data")
+        async def protected_endpoint():
+            return {"status": "ok"}
+
+        client = TestClient(app)
+        for headers, error in (
+            ({}, "Missing authentication token"),
+            ({"x-app-token": "bad"}, "Invalid authentication token"),
+        ):
+            response = client.get("/api/data", headers=headers)
+            assert response.status_code == 401
+            assert response.json() == {"error": error}
+            assert response.headers["content-type"] == "application/json"
+            assert response.headers["content-length"] == str(len(response.content))
+
     def test_dispatch_missing_token_custom_handler(self):
         """Test dispatch with custom missing token handler - uses real HTTP requests."""
         app = FastAPI()
@@ -338,6 +437,57 @@ class TestTokenAuthMiddleware:
         assert response.status_code == 200
         assert response.json() == {"status": "ok"}
 
+    def test_fast_path_flags(self):
+        """Test disabled auth and empty excludes are resolved at construction."""
+        app = FastAPI()
+
+        middleware = TokenAuthMiddleware(app, settings=AppTokenConfig(enabled=False))
+        assert middleware._always_pass is True
+        assert middleware._has_globs is False
+
+        middleware = TokenAuthMiddleware(app, settings=AppTokenConfig(exclude_paths={"/health"}))
+        assert middleware._always_pass is False
+        assert middleware._has_globs is False
+        assert middleware._glob_matchers == ()
+
+    def test_middleware_classes_use_slots(self):
+        """Test auth handlers and middleware don't carry a per-instance __dict__."""
+        from internal_fastapi.logging.middleware import LoggingMiddleware
+
+        app = FastAPI()
+        for instance in (AppTokenAuth(), TokenAuthMiddleware(app), LoggingMiddleware(app)):
+            assert not hasattr(instance, "__dict__")
+
+    @pytest.mark.asyncio
+    async def test_non_http_scope_passes_through(self):
+        """Test non-HTTP connections are handed to the app untouched."""
+        seen = []
+
+        async def inner_app(scope, receive, send):
+            seen.append(scope["type"])
+
+        middleware = TokenAuthMiddleware(inner_app, settings=AppTokenConfig(tokens={"app1": "t"}))
+        await middleware({"type": "lifespan"}, None, None)
+
+        assert seen == ["lifespan"]
+
+    def test_header_name_matched_case_insensitively(self):
+        """Test the configured header name is matched regardless of case."""
+        app = FastAPI()
+        config = AppTokenConfig(header_name="X-API-Key", tokens={"app1": "secret"})
+        app.add_middleware(TokenAuthMiddleware, settings=config)
+
+        @app.get("/api/data")
+        async def protected_endpoint(request: Request):
+            return {"app": request.state.app_name}
+
+        middleware = TokenAuthMiddleware(app, settings=config)
+        assert middleware._header_key == b"x-api-key"
+
+        response = TestClient(app).get("/api/data", headers={"X-Api-KEY": "secret"})
+        assert response.status_code == 200
+        assert response.json() == {"app": "app1"}
+
     def test_is_path_excluded(self):
         """Test _is_path_excluded method."""
         app = FastAPI()
@@ -379,6 +529,31 @@ class TestHelperFunctions:
         assert "APIKeyHeader" in app.openapi_schema["components"]["securitySchemes"]
         assert app.openapi_schema["security"] == [{"APIKeyHeader": []}]
 
+    def test_add_api_key_security_scheme_before_schema_generated(self):
+        """Test the scheme is applied when the schema is generated later."""
+        app = FastAPI()
+
+        @app.get("/items")
+        async def items():
+            return []
+
+        add_api_key_security_scheme(app, "X-API-Key", enabled=True)
+        assert app.openapi_schema is None
+
+        schema = TestClient(app).get("/openapi.json").json()
+
+        assert schema["components"]["securitySchemes"]["APIKeyHeader"]["name"] == "X-API-Key"
+        assert schema["security"] == [{"APIKeyHeader": []}]
+        assert app.openapi() is app.openapi_schema
+
+    def test_middleware_adds_security_scheme(self):
+        """Test the middleware documents its header in the OpenAPI schema."""
+        app = FastAPI()
+        TokenAuthMiddleware(app, settings=AppTokenConfig(header_name="X-Key"))
+
+        schema = app.openapi()
+        assert schema["components"]["securitySchemes"]["APIKeyHeader"]["name"] == "X-Key"
+
     def test_setup_token_auth(self):
         """Test setup_token_auth helper."""
         app = FastAPI()
@@ -6,7 +6,8 @@ Tests all auth mechanisms.
 
 import pytest
 import base64
-from internal_http import AuthBase, BearerAuth, BasicAuth, ApiKeyAuth
+import httpx
+from internal_http import AuthBase, BearerAuth, BasicAuth, ApiKeyAuth, RefreshingAuth
 
 
 class TestAuthBase:
@@ -26,6 +27,11 @@ class TestAuthBase:
         # Should return request unchanged
         assert result == request
 
+    def test_auth_classes_use_slots(self):
+        """Test built-in auth objects don't carry a per-instance __dict__."""
+        for auth in (AuthBase(), BearerAuth("t"), BasicAuth("u", "p"), ApiKeyAuth("k")):
+            assert not hasattr(auth, "__dict__")
+
 
 class TestBearerAuth:
     """Test BearerAuth."""
@@ -61,6 +67,17 @@ class TestBearerAuth:
         assert result1.headers["Authorization"] == "Bearer token1"
         assert result2.headers["Authorization"] == "Bearer token2"
 
+    def test_bearer_auth_token_update(self):
+        """Test a changed token is used by later requests."""
+        auth = BearerAuth("one")
+        auth.token = "two"
+
+        class MockRequest:
+            def __init__(self):
+                self.headers = {}
+
+        assert auth.auth_flow(MockRequest()).headers["Authorization"] == "Bearer two"
+
 
 class TestBasicAuth:
     """Test BasicAuth."""
@@ -100,6 +117,32 @@ class TestBasicAuth:
         decoded = base64.b64decode(encoded).decode()
         assert decoded == "user@example.com:p@ssw0rd!"
 
+    def test_basic_auth_header_encoded_once(self):
+        """Test the header value is built at construction and reused."""
+        auth = BasicAuth("user", "pass")
+        assert auth._auth_header == "Basic dXNlcjpwYXNz"
+
+        class MockRequest:
+            def __init__(self):
+                self.headers = {}
+
+        first = auth.auth_flow(MockRequest()).headers["Authorization"]
+        second = auth.auth_flow(MockRequest()).headers["Authorization"]
+        assert first is second is auth._auth_header
+
+    def test_basic_auth_credentials_update_header(self):
+        """Test changing the credentials re-encodes the header value."""
+        auth = BasicAuth("user", "pass")
+        auth.password = "other"
+
+        class MockRequest:
+            def __init__(self):
+                self.headers = {}
+
+        header = auth.auth_flow(MockRequest()).headers["Authorization"]
+        assert base64.b64decode(header.split(" ")[1]).decode() == "user:other"
+        assert auth.password == "other"
+
 
 class TestApiKeyAuth:
     """Test ApiKeyAuth."""
@@ -153,3 +196,63 @@ class TestApiKeyAuth:
         result = auth.auth_flow(request)
         
         assert result.headers["X-API-Key"] == "secret456"
+
+
+class TestRefreshingAuth:
+    """Test RefreshingAuth."""
+
+    @staticmethod
+    def _client(auth, valid="fresh"):
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(dict(request.headers))
+            header = request.headers.get("Authorization") or request.headers.get("X-API-Key")
+            status = 200 if header.endswith(valid) else 401
+            return httpx.Response(status, request=request)
+
+        return httpx.Client(transport=httpx.MockTransport(handler), auth=auth), seen
+
+    def test_refreshes_once_on_401(self):
+        """Test a 401 refreshes the token and resends the request."""
+        auth = RefreshingAuth(BearerAuth("stale"), refresh_callback=lambda: "fresh")
+        client, seen = self._client(auth)
+
+        response = client.get("http://testserver/")
+
+        assert response.status_code == 200
+        assert [h["authorization"] for h in seen] == ["Bearer stale", "Bearer fresh"]
+        assert auth.auth.token == "fresh"
+
+    def test_no_refresh_when_authorized(self):
+        """Test the callback is not called for successful requests."""
+        calls = []
+        auth = RefreshingAuth(BearerAuth("fresh"), refresh_callback=lambda: calls.append(1))
+        client, seen = self._client(auth)
+
+        assert client.get("http://testserver/").status_code == 200
+        assert calls == []
+
+    def test_gives_up_after_one_refresh(self):
+        """Test a 401 after refreshing is returned to the caller."""
+        auth = RefreshingAuth(BearerAuth("stale"), refresh_callback=lambda: "still-stale")
+        client, seen = self._client(auth)
+
+        assert client.get("http://testserver/").status_code == 401
+        assert len(seen) == 2
+
+    def test_keeps_api_key_header(self):
+        """Test refreshed API keys stay in their header."""
+        auth = RefreshingAuth(ApiKeyAuth("stale", prefix="Key"), refresh_callback=lambda: "fresh")
+        client, seen = self._client(auth)
+
+        assert client.get("http://testserver/").status_code == 200
+        assert seen[-1]["x-api-key"] == "Key fresh"
+
+    def test_applies_httpx_auth(self):
+        """Test wrapped httpx auth still sets its credentials."""
+        auth = RefreshingAuth(httpx.BasicAuth("u", "p"), refresh_callback=lambda: "fresh")
+        client, seen = self._client(auth, valid="dTpw")
+
+        assert client.get("http://testserver/").status_code == 200
+        assert seen == [{**seen[0], "authorization": "Basic dTpw"}]
@@ -2,11 +2,19 @@
 Unit tests for internal_http HttpClient lifecycle behavior.
 """
 
+import asyncio
+
 import pytest
 import httpx
 from internal_base import ServiceState
 
-from internal_http import HttpClient, RetryConfig
+from internal_http import AuthConfig, BearerAuth, HttpClient, HttpClientError, RetryConfig, close_all
+
+try:
+    import h2  # noqa: F401
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
 
 
 @pytest.mark.asyncio
@@ -135,3 +143,576 @@ class TestHttpClientLifecycle:
         assert calls["count"] == 1
 
         await client.close()
+
+
+@pytest.mark.asyncio
+class TestSharedAsyncClient:
+    """Test the AsyncClient shared by instances without an injected client."""
+
+    async def test_same_settings_share_client(self):
+        """Instances with identical settings reuse one AsyncClient."""
+        first = HttpClient(base_url="http://testserver")
+        second = HttpClient(base_url="http://testserver")
+        other = HttpClient(base_url="http://testserver", timeout=httpx.Timeout(5.0))
+
+        await first.start()
+        await second.start()
+        await other.start()
+
+        assert first._client is second._client
+        assert other._client is not first._client
+
+        await first.stop()
+        await second.stop()
+        assert other._client.is_closed is False
+
+        await close_all()
+        assert first._client.is_closed is True
+        assert other._client.is_closed is True
+
+    async def test_shared_client_recreated_after_close_all(self):
+        """A running instance picks up a fresh client after close_all()."""
+        client = HttpClient(base_url="http://testserver")
+        await client.start()
+        closed = client._client
+
+        await close_all()
+        fresh = await client._ensure_client()
+
+        assert fresh is not closed
+        assert fresh.is_closed is False
+
+        await close_all()
+
+    async def test_shared_client_pool_limits(self):
+        """Pool limits are applied to the shared client and part of its key."""
+        client = HttpClient(base_url="http://testserver", max_connections=10)
+        default = HttpClient(base_url="http://testserver")
+        await client.start()
+        await default.start()
+
+        pool = client._client._transport._pool
+        assert pool._max_connections == 10
+        assert pool._max_keepalive_connections == 10
+        assert pool._keepalive_expiry == 300.0
+        assert default._client is not client._client
+
+        await close_all()
+
+    async def test_http2_is_part_of_shared_client_key(self):
+        """HTTP/1.1 and HTTP/2 clients are kept apart in the registry."""
+        client = HttpClient(base_url="http://testserver", http2=True)
+
+        assert client._client_kwargs["http2"] is True
+        assert client._client_key != HttpClient(base_url="http://testserver")._client_key
+
+    @pytest.mark.skipif(HAS_H2, reason="h2 is installed")
+    async def test_http2_without_h2_fails_start(self):
+        """Starting an HTTP/2 client without the http2 extra fails clearly."""
+        client = HttpClient(base_url="http://testserver", http2=True)
+
+        with pytest.raises(ImportError, match="http2"):
+            await client.start()
+
+
+@pytest.mark.asyncio
+class TestRequestPreparation:
+    """Test headers and auth applied to outgoing requests."""
+
+    async def test_default_headers_and_auth_applied(self):
+        """Default, per-call and auth headers all reach the request."""
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers)
+            return httpx.Response(200, request=request)
+
+        async_client = httpx.AsyncClient(
+            base_url="http://testserver",
+            transport=httpx.MockTransport(handler),
+        )
+        client = HttpClient(
+            client=async_client,
+            auth_config=AuthConfig(auth=BearerAuth("token")),
+            default_headers={"X-Default": "1"},
+        )
+
+        await client.get("/plain")
+        await client.get("/extra", headers={"X-Extra": "2"})
+
+        assert seen[0]["authorization"] == "Bearer token"
+        assert seen[0]["x-default"] == "1"
+        assert "x-extra" not in seen[0]
+        assert seen[1]["x-extra"] == "2"
+        assert seen[1]["authorization"] == "Bearer token"
+        assert "x-extra" not in client._default_headers
+
+        await client.close()
+
+    async def test_verb_and_model_shortcuts(self):
+        """Verb and *_model shortcuts send their method and parse models."""
+        from pydantic import BaseModel
+
+        class Item(BaseModel):
+            method: str
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"method": request.method}, request=request)
+
+        async_client = httpx.AsyncClient(
+            base_url="http://testserver",
+            transport=httpx.MockTransport(handler),
+        )
+        client = HttpClient(client=async_client)
+
+        for verb in ("get", "post", "put", "patch", "delete"):
+            response = await getattr(client, verb)("/item")
+            assert response.json() == {"method": verb.upper()}
+
+            item = await getattr(client, f"{verb}_model")("/item", Item)
+            assert item == Item(method=verb.upper())
+
+        await client.close()
+
+
+    async def test_refresh_callback_used_on_401(self):
+        """A configured refresh_callback renews the token after a 401."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            ok = request.headers["authorization"] == "Bearer fresh"
+            return httpx.Response(200 if ok else 401, request=request)
+
+        async_client = httpx.AsyncClient(
+            base_url="http://testserver",
+            transport=httpx.MockTransport(handler),
+        )
+        client = HttpClient(
+            client=async_client,
+            auth_config=AuthConfig(auth=BearerAuth("stale"), refresh_callback=lambda: "fresh"),
+        )
+
+        assert (await client.get("/first")).status_code == 200
+        assert (await client.get("/second")).status_code == 200
+        assert client._auth.auth.token == "fresh"
+
+        await client.close()
+
+    async def test_refresh_callback_keeps_httpx_auth(self):
+        """httpx auth combined with a refresh_callback still sends credentials."""
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers.get("authorization"))
+            return httpx.Response(200, request=request)
+
+        async_client = httpx.AsyncClient(
+            base_url="http://testserver",
+            transport=httpx.MockTransport(handler),
+        )
+        client = HttpClient(
+            client=async_client,
+            auth_config=AuthConfig(auth=httpx.BasicAuth("u", "p"), refresh_callback=lambda: "fresh"),
+        )
+
+        assert (await client.get("/")).status_code == 200
+        assert seen == ["Basic dTpw"]
+
+        await client.close()
+
+class TestRetryBackoff:
+    """Test the retry backoff schedule."""
+
+    def test_delays_precomputed(self):
+        """Delays double per attempt starting at backoff_factor."""
+        client = HttpClient(retries=RetryConfig(max_attempts=4, backoff_factor=0.5))
+        assert client._delays == (0.5, 1.0, 2.0, 4.0)
+
+    @pytest.mark.asyncio
+    async def test_sleep_backoff_jitter_bounds(self, monkeypatch):
+        """Jitter scales the delay between 0.5x and 1.5x."""
+        waits = []
+
+        async def fake_sleep(delay):
+            waits.append(delay)
+
+        monkeypatch.setattr("internal_http.client.http_client.asyncio.sleep", fake_sleep)
+        client = HttpClient(retries=RetryConfig(max_attempts=3, backoff_factor=1.0))
+
+        for _ in range(20):
+            await client._sleep_backoff(1, "with status 503")
+
+        assert all(1.0 <= wait <= 3.0 for wait in waits)
+
+        client.retry_config = RetryConfig(max_attempts=3, backoff_factor=1.0, jitter=False)
+        await client._sleep_backoff(1, "with status 503")
+        assert waits[-1] == 2.0
+
+    def test_should_retry_uses_sets(self):
+        """Retry statuses and methods are matched through frozensets."""
+        client = HttpClient(retries=RetryConfig(retry_statuses=[503], retry_methods=["get"]))
+        assert client._retry_status_set == frozenset({503})
+
+        assert client._should_retry("GET", httpx.Response(503))
+        assert not client._should_retry("GET", httpx.Response(500))
+        assert not client._should_retry("POST", httpx.Response(503))
+
+    async def test_running_client_used_directly(self, monkeypatch):
+        """Once running, requests skip _ensure_client."""
+        async_client = httpx.AsyncClient(
+            base_url="http://testserver",
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, request=request)
+            ),
+        )
+        client = HttpClient(client=async_client)
+        await client.start()
+
+        async def fail():
+            raise AssertionError("_ensure_client should not be called")
+
+        monkeypatch.setattr(client, "_ensure_client", fail)
+        response = await client.get("/fast")
+
+        assert response.status_code == 200
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_request_resent_until_success(self):
+        """Status and exception failures share one retry path."""
+        outcomes = [httpx.ConnectError("boom"), 503, 200]
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return httpx.Response(outcome, request=request)
+
+        async_client = httpx.AsyncClient(
+            base_url="http://testserver",
+            transport=httpx.MockTransport(handler),
+        )
+        client = HttpClient(
+            client=async_client,
+            retries=RetryConfig(max_attempts=3, backoff_factor=0),
+            auth_config=AuthConfig(auth=BearerAuth("token")),
+        )
+
+        response = await client.get("/flaky", params={"q": "1"})
+
+        assert response.status_code == 200
+        assert len(seen) == 3
+        assert all(request.url == seen[0].url for request in seen)
+        assert all(request.headers["authorization"] == "Bearer token" for request in seen)
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_last_exception_raises_client_error(self):
+        """An exception on the last attempt is wrapped in HttpClientError."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("down")
+
+        async_client = httpx.AsyncClient(
+            base_url="http://testserver",
+            transport=httpx.MockTransport(handler),
+        )
+        client = HttpClient(client=async_client, retries=RetryConfig(max_attempts=2, backoff_factor=0))
+
+        with pytest.raises(HttpClientError, match="Request failed: down"):
+            await client.get("/down")
+
+        await client.close()
+
+
+@pytest.mark.asyncio
+class TestModelParsing:
+    """Test parsing responses into Pydantic models."""
+
+    async def test_model_invalid_json_raises_validation_error(self):
+        """Bodies that are not valid JSON fail model validation."""
+        from pydantic import BaseModel, ValidationError
+
+        class Item(BaseModel):
+            id: int
+
+        async_client = httpx.AsyncClient(
+            base_url="http://testserver",
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, content=b"not json", request=request)
+            ),
+        )
+        client = HttpClient(client=async_client)
+
+        with pytest.raises(ValidationError):
+            await client.get_model("/item", Item)
+
+        await client.close()
+
+    async def test_stream_model(self):
+        """Streamed bodies are buffered and parsed into the model."""
+        from pydantic import BaseModel
+
+        class Report(BaseModel):
+            rows: list[int]
+
+        outcomes = [503, 200]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            status = outcomes.pop(0)
+            return httpx.Response(status, json={"rows": list(range(1000))}, request=request)
+
+        async_client = httpx.AsyncClient(
+            base_url="http://testserver",
+            transport=httpx.MockTransport(handler),
+        )
+        client = HttpClient(client=async_client, retries=RetryConfig(backoff_factor=0))
+
+        report = await client.stream_model("GET", "/report", Report, chunk_size=64)
+
+        assert report.rows == list(range(1000))
+        assert outcomes == []
+
+        await client.close()
+
+    async def test_stream_model_error_status(self):
+        """Error statuses raise before the body is parsed."""
+        from pydantic import BaseModel
+
+        class Report(BaseModel):
+            rows: list[int]
+
+        async_client = httpx.AsyncClient(
+            base_url="http://testserver",
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(404, request=request)
+            ),
+        )
+        client = HttpClient(client=async_client)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.stream_model("GET", "/missing", Report)
+
+        await client.close()
+
+
+@pytest.mark.asyncio
+class TestRequestCoalescing:
+    """Test sharing in-flight requests between identical concurrent calls."""
+
+    @staticmethod
+    def _client(calls):
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"path": request.url.path}, request=request)
+
+        async_client = httpx.AsyncClient(
+            base_url="http://testserver",
+            transport=httpx.MockTransport(handler),
+        )
+        return HttpClient(client=async_client)
+
+    async def test_identical_requests_share_one_send(self):
+        """Concurrent identical coalesced requests hit the wire once."""
+        calls = []
+        client = self._client(calls)
+
+        responses = await asyncio.gather(
+            *(client.get("/same", coalesce=True) for _ in range(5)),
+            client.get("/other", coalesce=True),
+        )
+
+        assert calls.count("/same") == 1
+        assert calls.count("/other") == 1
+        assert all(response is responses[0] for response in responses[:5])
+        assert client._inflight == {}
+
+        await client.close()
+
+    async def test_model_requests_coalesced(self):
+        """*_model calls accept coalesce as well."""
+        from pydantic import BaseModel
+
+        class Page(BaseModel):
+            path: str
+
+        calls = []
+        client = self._client(calls)
+
+        pages = await asyncio.gather(
+            *(client.get_model("/page", Page, coalesce=True) for _ in range(3))
+        )
+
+        assert calls == ["/page"]
+        assert all(page.path == "/page" for page in pages)
+        await client.close()
+
+    async def test_requests_not_coalesced_by_default(self):
+        """Without coalesce every call sends its own request."""
+        calls = []
+        client = self._client(calls)
+
+        await asyncio.gather(*(client.get("/same") for _ in range(3)))
+
+        assert calls.count("/same") == 3
+        await client.close()
+
+    async def test_non_idempotent_requests_not_coalesced(self):
+        """Only GET/HEAD requests are coalesced, even with identical bodies."""
+        calls = []
+        client = self._client(calls)
+
+        await asyncio.gather(
+            client.post("/same", json={"a": 1}, coalesce=True),
+            client.post("/same", json={"a": 1}, coalesce=True),
+        )
+
+        assert calls.count("/same") == 2
+        await client.close()
+
+    async def test_per_call_auth_not_coalesced(self):
+        """Requests with their own auth never share another caller's response."""
+        calls = []
+        client = self._client(calls)
+
+        alice, bob = await asyncio.gather(
+            client.get("/same", coalesce=True, auth=httpx.BasicAuth("alice", "pw")),
+            client.get("/same", coalesce=True, auth=httpx.BasicAuth("bob", "pw")),
+        )
+
+        assert calls.count("/same") == 2
+        assert alice is not bob
+        assert alice.request.headers["Authorization"] != bob.request.headers["Authorization"]
+        await client.close()
+
+    async def test_cancelled_caller_does_not_cancel_shared_request(self):
+        """Cancelling one waiter leaves the shared request running."""
+        calls = []
+        client = self._client(calls)
+
+        first = asyncio.ensure_future(client.get("/same", coalesce=True))
+        second = asyncio.ensure_future(client.get("/same", coalesce=True))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        response = await second
+        assert response.status_code == 200
+        assert calls == ["/same"]
+
+        await client.close()
+
+
+@pytest.mark.asyncio
+class TestRedirectCache:
+    """Test followed permanent redirects are cached."""
+
+    @staticmethod
+    def _client(calls, status, location="/new", auth_config=None):
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append((request.url.host, request.url.path, request.headers.get("Authorization")))
+            if request.url.path == "/old":
+                return httpx.Response(status, headers={"Location": location}, request=request)
+            return httpx.Response(200, request=request)
+
+        async_client = httpx.AsyncClient(
+            base_url="http://testserver",
+            transport=httpx.MockTransport(handler),
+            follow_redirects=True,
+        )
+        return HttpClient(client=async_client, auth_config=auth_config)
+
+    async def test_permanent_redirect_cached(self):
+        """A followed 301 sends later calls straight to the target."""
+        calls = []
+        client = self._client(calls, 301)
+
+        await client.get("/old")
+        response = await client.get("/old")
+
+        assert [path for _, path, _ in calls] == ["/old", "/new", "/new"]
+        assert response.url == "http://testserver/new"
+        assert client._redirect_cache == {"/old": "http://testserver/new"}
+
+        await client.close()
+
+    async def test_temporary_redirect_not_cached(self):
+        """302 redirects are followed every time."""
+        calls = []
+        client = self._client(calls, 302)
+
+        await client.get("/old")
+        await client.get("/old")
+
+        assert [path for _, path, _ in calls] == ["/old", "/new", "/old", "/new"]
+        assert client._redirect_cache == {}
+
+        await client.close()
+
+    async def test_cross_origin_redirect_not_cached(self):
+        """A permanent redirect to another origin never receives the client's auth."""
+        calls = []
+        client = self._client(
+            calls,
+            301,
+            location="https://other.example.net/new",
+            auth_config=AuthConfig(auth=BearerAuth("SECRET")),
+        )
+
+        await client.get("/old")
+        await client.get("/old")
+
+        assert client._redirect_cache == {}
+        assert [(host, auth) for host, _, auth in calls if host == "other.example.net"] == [
+            ("other.example.net", None),
+            ("other.example.net", None),
+        ]
+
+        await client.close()
+
+    async def test_cache_keyed_on_caller_url(self):
+        """A cached target is stored under the URL the caller passed."""
+        calls = []
+        client = self._client(calls, 308)
+
+        await client.get("/old")
+        await client.get("/old")
+        await client.get("/old")
+
+        assert client._redirect_cache == {"/old": "http://testserver/new"}
+        assert [path for _, path, _ in calls] == ["/old", "/new", "/new", "/new"]
+
+        await client.close()
+
+    async def test_call_without_follow_redirects_skips_cache(self):
+        """A call that does not follow redirects gets the redirect itself."""
+        calls = []
+        client = self._client(calls, 301)
+
+        await client.get("/old")
+        response = await client.get("/old", follow_redirects=False)
+
+        assert response.status_code == 301
+        assert [path for _, path, _ in calls] == ["/old", "/new", "/old"]
+
+        await client.close()
+
+    async def test_redirect_not_cached_when_not_following(self):
+        """A redirect the caller did not follow is not remembered."""
+        calls = []
+        client = self._client(calls, 301)
+
+        await client.get("/old", follow_redirects=False)
+
+        assert client._redirect_cache == {}
+
+        await client.close()
+
+    async def test_shared_client_does_not_follow_by_default(self):
+        """The shared client leaves redirects to the caller unless enabled."""
+        client = HttpClient(base_url="http://testserver")
+        await client.start()
+
+        assert client._client.follow_redirects is False
+
+        await close_all()
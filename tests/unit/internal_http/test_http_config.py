@@ -5,7 +5,9 @@ Tests RetryConfig and AuthConfig.
 """
 
 import pytest
-from internal_http import RetryConfig, AuthConfig, BearerAuth
+from pydantic import ValidationError
+
+from internal_http import DEFAULT_RETRY_CONFIG, AuthConfig, BearerAuth, HttpClient, RetryConfig
 
 
 class TestRetryConfig:
@@ -16,11 +18,11 @@ class TestRetryConfig:
         config = RetryConfig()
         
         assert config.max_attempts == 3
-        assert config.retry_statuses == [500, 502, 503, 504]
-        assert config.retry_methods == ["GET", "HEAD", "PUT", "DELETE", "OPTIONS", "TRACE"]
+        assert config.retry_statuses == (500, 502, 503, 504)
+        assert config.retry_methods == ("GET", "HEAD", "PUT", "DELETE", "OPTIONS", "TRACE")
         assert config.backoff_factor == 0.5
         assert config.jitter is True
-        assert config.retry_exceptions == []
+        assert config.retry_exceptions == ()
 
     def test_custom_config(self):
         """Test custom retry configuration."""
@@ -32,7 +34,7 @@ class TestRetryConfig:
         )
         
         assert config.max_attempts == 5
-        assert config.retry_statuses == [429, 500]
+        assert config.retry_statuses == (429, 500)
         assert config.backoff_factor == 1.0
         assert config.jitter is False
 
@@ -42,7 +44,7 @@ class TestRetryConfig:
             retry_methods=["GET", "POST"]
         )
         
-        assert config.retry_methods == ["GET", "POST"]
+        assert config.retry_methods == ("GET", "POST")
 
 
 class TestAuthConfig:
@@ -78,3 +80,25 @@ class TestAuthConfig:
         
         assert config.refresh_callback == refresh
         assert config.refresh_callback() == "new-token"
+
+
+class TestFrozenConfigs:
+    """Test configs are immutable and the defaults shared."""
+
+    def test_configs_are_frozen(self):
+        """Test assigning to a config field is rejected."""
+        with pytest.raises(ValidationError):
+            RetryConfig().max_attempts = 5
+        with pytest.raises(ValidationError):
+            AuthConfig().refresh_token = "token"
+
+    def test_clients_share_default_retry_config(self):
+        """Test clients without retries reuse one RetryConfig."""
+        assert HttpClient().retry_config is DEFAULT_RETRY_CONFIG
+        assert HttpClient().auth_config is HttpClient().auth_config
+        assert HttpClient(retries=5).retry_config.max_attempts == 5
+
+    def test_default_sequences_shared(self):
+        """Test default retry sequences are immutable and not copied per instance."""
+        assert RetryConfig().retry_statuses is RetryConfig().retry_statuses
+        assert RetryConfig(retry_statuses=[429]).retry_statuses == (429,)
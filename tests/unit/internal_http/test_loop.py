@@ -0,0 +1,34 @@
+"""
+Unit tests for internal_http event loop selection.
+"""
+
+import asyncio
+
+from internal_http import loop
+
+
+class TestInstallUvloop:
+    """Test install_uvloop and its environment switch."""
+
+    def test_without_uvloop_keeps_default_policy(self, monkeypatch):
+        """Without uvloop the default event loop policy is left alone."""
+        monkeypatch.setattr(loop, "uvloop", None)
+        policy = asyncio.get_event_loop_policy()
+
+        assert loop.install_uvloop() is False
+        assert asyncio.get_event_loop_policy() is policy
+
+    def test_env_switch(self, monkeypatch):
+        """uvloop is only installed when the environment variable is 1."""
+        calls = []
+        monkeypatch.setattr(loop, "install_uvloop", lambda: calls.append(1))
+
+        monkeypatch.delenv(loop.USE_UVLOOP_ENV, raising=False)
+        loop._install_uvloop_from_env()
+        monkeypatch.setenv(loop.USE_UVLOOP_ENV, "0")
+        loop._install_uvloop_from_env()
+        assert calls == []
+
+        monkeypatch.setenv(loop.USE_UVLOOP_ENV, "1")
+        loop._install_uvloop_from_env()
+        assert calls == [1]
@@ -224,3 +224,31 @@ class TestDatabaseConfigURL:
     def test_config_use_enum_values(self):
         """Test that Pydantic config uses enum values."""
         assert DatabaseConfig.Config.use_enum_values is True
+
+
+class TestDatabaseConfigURLCache:
+    """Test the cached DatabaseConfig URL."""
+
+    def test_url_cached(self):
+        """Test the URL is computed once and reused."""
+        config = DatabaseConfig(driver="sqlite+aiosqlite", name="mydb.db")
+
+        assert config.url is config.url
+        assert config.__dict__["url"] == "sqlite+aiosqlite:///./mydb.db"
+
+    def test_url_recomputed_after_field_change(self):
+        """Test assigning a field invalidates the cached URL."""
+        config = DatabaseConfig(driver="sqlite+aiosqlite", name="mydb.db")
+        assert config.url == "sqlite+aiosqlite:///./mydb.db"
+
+        config.name = ":memory:"
+        assert config.url == "sqlite+aiosqlite:///:memory:"
+
+    def test_url_recomputed_for_copy(self):
+        """Test model_copy with updates does not reuse the cached URL."""
+        config = DatabaseConfig(driver="sqlite+aiosqlite", name="mydb.db")
+        assert config.url == "sqlite+aiosqlite:///./mydb.db"
+
+        copy = config.model_copy(update={"name": "other.db"})
+        assert copy.url == "sqlite+aiosqlite:///./other.db"
+        assert config.model_dump()["url"] == "sqlite+aiosqlite:///./mydb.db"
@@ -53,7 +53,7 @@ def test_ensure_utc_with_utc_aware_datetime():
     result = model.value
 
     assert result.tzinfo == timezone.utc
-    assert result == utc_dt
+    assert result is utc_dt
 
 
 @pytest.mark.unit
@@ -122,3 +122,29 @@ def test_ensure_utc_multiple_accesses():
     # All should be equal and UTC-aware
     assert value1 == value2 == value3
     assert value1.tzinfo == timezone.utc
+
+
+@pytest.mark.unit
+def test_ensure_utc_class_access_and_doc():
+    """Test the descriptor is returned on class access and keeps the getter doc."""
+
+    class Documented:
+        @ensure_utc
+        def stamp(self) -> datetime:
+            """When it happened."""
+            return datetime(2024, 1, 1)
+
+    assert Documented.stamp.__doc__ == "When it happened."
+
+
+@pytest.mark.unit
+def test_ensure_utc_without_setter_is_read_only():
+    """Test assigning to a getter-only property raises AttributeError."""
+
+    class ReadOnly:
+        @ensure_utc
+        def stamp(self) -> datetime:
+            return datetime(2024, 1, 1)
+
+    with pytest.raises(AttributeError, match="has no setter"):
+        ReadOnly().stamp = datetime(2024, 1, 2)
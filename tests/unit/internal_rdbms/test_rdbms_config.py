@@ -5,7 +5,7 @@ Tests DatabaseConfig URL construction and validation.
 """
 
 import pytest
-from internal_rdbms import DatabaseConfig
+from internal_rdbms import DatabaseConfig, MySQLDatabase, PostgresDatabase
 
 
 class TestDatabaseConfig:
@@ -74,6 +74,8 @@ class TestDatabaseConfig:
         assert config.max_overflow == 10
         assert config.pool_timeout == 30.0
         assert config.pool_recycle == 1800
+        assert config.pool_pre_ping is True
+        assert config.pool_use_lifo is True
 
     def test_custom_pool_settings(self):
         """Test custom pool settings."""
@@ -104,3 +106,32 @@ class TestDatabaseConfig:
         
         assert config_echo.echo is True
         assert config_no_echo.echo is False
+
+
+class TestEnginePoolSettings:
+    """Test pool settings reach the network database engines."""
+
+    @pytest.mark.parametrize(
+        "database_class, driver",
+        [(MySQLDatabase, "mysql+aiomysql"), (PostgresDatabase, "postgresql+asyncpg")],
+    )
+    def test_pre_ping_and_lifo_passed_to_pool(self, database_class, driver):
+        """Test pool_pre_ping and pool_use_lifo configure the engine pool."""
+        db = database_class(DatabaseConfig(driver=driver, pool_pre_ping=False))
+        pool = db._engine.sync_engine.pool
+
+        assert pool._pre_ping is False
+        assert pool._pool.use_lifo is True
+
+    def test_network_databases_share_engine_kwargs(self):
+        """Test MySQL and PostgreSQL build engines from the same defaults."""
+        mysql = MySQLDatabase(DatabaseConfig(driver="mysql+aiomysql", pool_size=7))
+        postgres = PostgresDatabase(DatabaseConfig(driver="postgresql+asyncpg", pool_size=7))
+
+        mysql_kwargs = mysql._engine_kwargs()
+        postgres_kwargs = postgres._engine_kwargs()
+
+        assert mysql_kwargs.keys() == postgres_kwargs.keys()
+        assert mysql_kwargs["pool_size"] == postgres_kwargs["pool_size"] == 7
+        assert mysql_kwargs["connect_args"]["charset"] == "utf8mb4"
+        assert "server_settings" in postgres_kwargs["connect_args"]
@@ -0,0 +1,238 @@
+"""
+Unit tests for the SQLite file-based database.
+
+Tests the connection PRAGMAs applied by SQLiteDatabase.
+"""
+
+import asyncio
+import os
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.exc import OperationalError
+
+from internal_rdbms.database.config import DatabaseConfig
+from internal_rdbms.database.sqlite import SQLiteDatabase
+
+
+async def _pragma(db: SQLiteDatabase, name: str):
+    async with db.session() as session:
+        return (await session.execute(text(f"PRAGMA {name}"))).scalar()
+
+
+class TestSQLiteDatabasePragmas:
+    """Test PRAGMAs applied to new SQLite connections."""
+
+    @pytest.fixture
+    def db(self, tmp_path, monkeypatch):
+        """File-based database in a temporary directory."""
+        monkeypatch.chdir(tmp_path)
+        return SQLiteDatabase(DatabaseConfig(driver="sqlite+aiosqlite", name="test.db"))
+
+    async def test_connection_pragmas(self, db):
+        """Test WAL and the tuning PRAGMAs are set on connect."""
+        assert await _pragma(db, "journal_mode") == "wal"
+        assert await _pragma(db, "synchronous") == 1  # NORMAL
+        assert await _pragma(db, "busy_timeout") == 5000
+        assert await _pragma(db, "cache_size") == -20000
+        assert await _pragma(db, "temp_store") == 2  # MEMORY
+        assert await _pragma(db, "foreign_keys") == 0  # left at SQLite's default
+
+        await db.dispose()
+
+    async def test_memory_database_skips_wal(self):
+        """Test :memory: databases keep their journal mode."""
+        db = SQLiteDatabase(DatabaseConfig(driver="sqlite+aiosqlite", name=":memory:"))
+
+        assert await _pragma(db, "journal_mode") == "memory"
+
+        await db.dispose()
+
+
+    def test_config_not_mutated(self):
+        """Test connect_args defaults do not leak into a shared config."""
+        config = DatabaseConfig(driver="sqlite+aiosqlite", name=":memory:")
+
+        db = SQLiteDatabase(config)
+
+        assert config.connect_args == {}
+        assert db.settings.connect_args == {"check_same_thread": False}
+
+
+class TestSQLiteDatabasePools:
+    """Test the writer and reader pools of SQLiteDatabase."""
+
+    @pytest.fixture
+    def db(self, tmp_path, monkeypatch):
+        """File-based database in a temporary directory."""
+        monkeypatch.chdir(tmp_path)
+        return SQLiteDatabase(DatabaseConfig(driver="sqlite+aiosqlite", name="test.db"))
+
+    def test_single_writer_connection(self, db):
+        """Test readwrite sessions get their own one-connection pool."""
+        assert db._write_engine is not db._engine
+        pool = db._write_engine.sync_engine.pool
+        assert pool.size() == 1
+        assert pool._max_overflow == 0
+
+    def test_default_pool_from_settings(self, db):
+        """Test default sessions use a pool sized from the settings."""
+        pool = db._engine.sync_engine.pool
+        assert pool.size() == db.settings.pool_size
+        assert pool._max_overflow == db.settings.max_overflow
+
+    async def test_concurrent_default_sessions(self, db):
+        """Test default sessions hold connections at the same time."""
+        entered = 0
+        all_entered = asyncio.Event()
+
+        async def worker():
+            nonlocal entered
+            async with db.session() as session:
+                await session.execute(text("SELECT 1"))
+                entered += 1
+                if entered == 4:
+                    all_entered.set()
+                await all_entered.wait()
+
+        await asyncio.wait_for(asyncio.gather(*(worker() for _ in range(4))), timeout=5)
+
+        await db.dispose()
+
+    async def test_nested_default_sessions(self, db):
+        """Test a default session can be opened inside another one."""
+        async with db.session() as outer:
+            await outer.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+            async with db.session() as inner:
+                await inner.execute(text("SELECT 1"))
+
+        await db.dispose()
+
+    def test_statement_cache_size(self, db):
+        """Test both engines keep a larger compiled statement cache."""
+        assert db._engine.sync_engine._compiled_cache.capacity == 1200
+        assert db._read_engine.sync_engine._compiled_cache.capacity == 1200
+        assert db._write_engine.sync_engine._compiled_cache.capacity == 1200
+
+    def test_reader_pool_per_cpu(self, db):
+        """Test read-only sessions get their own pool sized to the CPUs."""
+        assert db._read_engine is not db._engine
+        assert db._read_engine.sync_engine.pool.size() == (os.cpu_count() or 1)
+
+    async def test_readonly_session_reads_written_rows(self, db):
+        """Test readers see committed writes and cannot write."""
+        async with db.session() as session:
+            await session.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+            await session.execute(text("INSERT INTO items (id) VALUES (1), (2)"))
+
+        async with db.session(readonly=True) as session:
+            count = (await session.execute(text("SELECT count(*) FROM items"))).scalar()
+        assert count == 2
+
+        with pytest.raises(OperationalError, match="readonly"):
+            async with db.session(readonly=True) as session:
+                await session.execute(text("INSERT INTO items (id) VALUES (3)"))
+
+        await db.dispose()
+
+    def test_memory_database_reads_through_writer(self):
+        """Test :memory: databases share one engine for reads and writes."""
+        db = SQLiteDatabase(DatabaseConfig(driver="sqlite+aiosqlite", name=":memory:"))
+        assert db._read_engine is db._engine
+        assert db._write_engine is db._engine
+        assert db._read_session_factory is db._session_factory
+        assert db._write_session_factory is db._session_factory
+
+
+class TestSQLiteDatabaseTransactions:
+    """Test transaction modes of SQLiteDatabase sessions."""
+
+    @pytest.fixture
+    def db(self, tmp_path, monkeypatch):
+        """File-based database with a table, recording the BEGIN statements."""
+        monkeypatch.chdir(tmp_path)
+        db = SQLiteDatabase(DatabaseConfig(driver="sqlite+aiosqlite", name="test.db"))
+        db.begins = []
+
+        def _record(conn, cursor, statement, *args):
+            if statement.startswith("BEGIN"):
+                db.begins.append(statement)
+
+        for engine in (db._engine, db._write_engine):
+            event.listen(engine.sync_engine, "before_cursor_execute", _record)
+
+        return db
+
+    async def test_readwrite_session_begins_immediate(self, db):
+        """Test readwrite sessions take the write lock when they begin."""
+        async with db.session(readwrite=True) as session:
+            await session.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+
+        async with db.session() as session:
+            await session.execute(text("SELECT count(*) FROM items"))
+
+        # Default sessions leave BEGIN to the driver
+        assert db.begins == ["BEGIN IMMEDIATE"]
+
+        await db.dispose()
+
+    async def test_concurrent_read_then_write_sessions(self, db):
+        """Test default sessions that read and then write wait for each other."""
+        async with db.session() as session:
+            await session.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+
+        both_read = asyncio.Event()
+        reads = 0
+
+        async def read_then_write(item_id):
+            nonlocal reads
+            async with db.session() as session:
+                await session.execute(text("SELECT count(*) FROM items"))
+                reads += 1
+                if reads == 2:
+                    both_read.set()
+                await both_read.wait()
+                await session.execute(text(f"INSERT INTO items (id) VALUES ({item_id})"))
+
+        await asyncio.wait_for(asyncio.gather(read_then_write(1), read_then_write(2)), timeout=10)
+
+        async with db.session(readonly=True) as session:
+            assert (await session.execute(text("SELECT count(*) FROM items"))).scalar() == 2
+
+        await db.dispose()
+
+    async def test_memory_database_readwrite_session(self):
+        """Test :memory: readwrite sessions write through the one connection."""
+        db = SQLiteDatabase(DatabaseConfig(driver="sqlite+aiosqlite", name=":memory:"))
+
+        async with db.session(readwrite=True) as session:
+            await session.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+            await session.execute(text("INSERT INTO items (id) VALUES (1)"))
+
+        async with db.session() as session:
+            assert (await session.execute(text("SELECT count(*) FROM items"))).scalar() == 1
+
+        await db.dispose()
+
+    async def test_rollback_discards_writes(self, db):
+        """Test SQLAlchemy-managed transactions still roll back."""
+        async with db.session() as session:
+            await session.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+
+        with pytest.raises(RuntimeError):
+            async with db.session(readwrite=True) as session:
+                await session.execute(text("INSERT INTO items (id) VALUES (1)"))
+                raise RuntimeError("boom")
+
+        async with db.session(readonly=True) as session:
+            assert (await session.execute(text("SELECT count(*) FROM items"))).scalar() == 0
+
+        await db.dispose()
+
+    async def test_readonly_and_readwrite_rejected(self, db):
+        """Test a session cannot be both readonly and readwrite."""
+        with pytest.raises(ValueError, match="both readonly and readwrite"):
+            async with db.session(readonly=True, readwrite=True):
+                pass
+
+        await db.dispose()
@@ -4,12 +4,15 @@ Comprehensive tests for SQLite in-memory database to achieve 100% coverage.
 Tests all uncovered lines including initialization and engine creation.
 """
 
-import pytest
-from sqlalchemy.pool import StaticPool
-from sqlalchemy.ext.asyncio import AsyncEngine
+import asyncio
 
+import pytest
 from internal_rdbms.database.config import DatabaseConfig
 from internal_rdbms.database.sqlite_mem import SQLiteMemDatabase
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
 
 
 class TestSQLiteMemDatabase:
@@ -63,6 +66,16 @@ class TestSQLiteMemDatabase:
         assert db.settings.connect_args["timeout"] == 30
         assert db.settings.connect_args["check_same_thread"] is False
 
+    def test_init_leaves_caller_config_unchanged(self):
+        """Test defaults are applied to a copy of the config."""
+        config = DatabaseConfig(driver="sqlite+aiosqlite", name="test.db")
+
+        db = SQLiteMemDatabase(config)
+
+        assert db.settings is not config
+        assert config.name == "test.db"
+        assert config.connect_args == {}
+
     def test_init_does_not_override_check_same_thread(self):
         """Test that explicitly set check_same_thread is not overridden."""
         config = DatabaseConfig(
@@ -89,16 +102,35 @@ class TestSQLiteMemDatabase:
         assert isinstance(db._engine, AsyncEngine)
 
     def test_create_engine_uses_static_pool(self):
-        """Test that _create_engine uses StaticPool."""
+        """Test that _create_engine shares one connection to a shared-cache database."""
+        config = DatabaseConfig(driver="sqlite+aiosqlite", name=":memory:")
+
+        db = SQLiteMemDatabase(config)
+
+        assert db._engine.pool.__class__ == StaticPool
+        assert db._engine.url.query["cache"] == "shared"
+        assert db._engine.sync_engine._compiled_cache.capacity == 1200
+        assert db._write_engine is db._engine
+
+    def test_create_read_engine_uses_queue_pool(self):
+        """Test that read-only sessions pool connections to the same database."""
         config = DatabaseConfig(
             driver="sqlite+aiosqlite",
-            name=":memory:"
+            name=":memory:",
+            pool_size=4,
         )
 
         db = SQLiteMemDatabase(config)
 
-        # Check that StaticPool is used
-        assert db._engine.pool.__class__ == StaticPool
+        assert db._read_engine.pool.__class__ == AsyncAdaptedQueuePool
+        assert db._read_engine.pool.size() == 4
+        assert db._read_engine.url == db._engine.url
+
+    def test_instances_get_separate_databases(self):
+        """Test each instance has its own in-memory database."""
+        config = DatabaseConfig(driver="sqlite+aiosqlite", name=":memory:")
+
+        assert SQLiteMemDatabase(config)._uri != SQLiteMemDatabase(config)._uri
 
     def test_create_engine_respects_echo(self):
         """Test that _create_engine respects echo setting."""
@@ -275,3 +307,126 @@ class TestSQLiteMemDatabase:
             assert len(records) == 0
 
         await db2.dispose()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_readonly_sessions_share_data(self):
+        """Test parallel read-only sessions on separate connections see the same tables."""
+        db = SQLiteMemDatabase(DatabaseConfig(driver="sqlite+aiosqlite", name=":memory:"))
+
+        async with db.session() as session:
+            await session.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+            await session.execute(text("INSERT INTO items (id) VALUES (1), (2)"))
+
+        async def count():
+            async with db.session(readonly=True) as session:
+                await asyncio.sleep(0.01)  # Hold the connection so sessions overlap
+                return (await session.execute(text("SELECT count(*) FROM items"))).scalar()
+
+        assert await asyncio.gather(*(count() for _ in range(4))) == [2, 2, 2, 2]
+        assert db._read_engine.pool.checkedin() > 1
+
+        with pytest.raises(OperationalError, match="readonly"):
+            async with db.session(readonly=True) as session:
+                await session.execute(text("INSERT INTO items (id) VALUES (3)"))
+
+        await db.dispose()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_default_sessions_write(self):
+        """Test concurrent default sessions all write through the shared connection."""
+        db = SQLiteMemDatabase(DatabaseConfig(driver="sqlite+aiosqlite", name=":memory:"))
+
+        async with db.session() as session:
+            await session.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+
+        async def insert(item_id):
+            async with db.session() as session:
+                await session.execute(text("INSERT INTO items (id) VALUES (:id)"), {"id": item_id})
+                await asyncio.sleep(0.01)  # Hold the write so sessions overlap
+
+        await asyncio.gather(*(insert(i) for i in range(4)))
+
+        async with db.session(readonly=True) as session:
+            assert (await session.execute(text("SELECT count(*) FROM items"))).scalar() == 4
+
+        await db.dispose()
+
+    @pytest.mark.asyncio
+    async def test_nested_session_in_pending_write(self):
+        """Test a session nested in a pending write shares its connection."""
+        db = SQLiteMemDatabase(DatabaseConfig(driver="sqlite+aiosqlite", name=":memory:"))
+
+        async with db.session(readwrite=True) as session:
+            await session.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+
+        async with db.session(readwrite=True) as writer:
+            await writer.execute(text("INSERT INTO items (id) VALUES (1)"))
+
+            async with db.session() as reader:
+                assert (await reader.execute(text("SELECT count(*) FROM items"))).scalar() == 1
+
+        await db.dispose()
+
+    @pytest.mark.asyncio
+    async def test_readonly_session_skips_rolled_back_writes(self):
+        """Test read-only sessions never see uncommitted writes."""
+        db = SQLiteMemDatabase(DatabaseConfig(driver="sqlite+aiosqlite", name=":memory:"))
+
+        async with db.session() as session:
+            await session.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+
+        with pytest.raises(RuntimeError):
+            async with db.session() as writer:
+                await writer.execute(text("INSERT INTO items (id) VALUES (1)"))
+
+                with pytest.raises(OperationalError, match="locked"):
+                    async with db.session(readonly=True) as reader:
+                        await reader.execute(text("SELECT count(*) FROM items"))
+
+                raise RuntimeError("boom")
+
+        async with db.session(readonly=True) as session:
+            assert (await session.execute(text("SELECT count(*) FROM items"))).scalar() == 0
+
+        await db.dispose()
+
+    @pytest.mark.asyncio
+    async def test_database_survives_pool_reset(self):
+        """Test the keepalive connection keeps data when the pool is emptied."""
+        db = SQLiteMemDatabase(DatabaseConfig(driver="sqlite+aiosqlite", name=":memory:"))
+
+        async with db.session() as session:
+            await session.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+
+        await db._engine.dispose()
+
+        async with db.session() as session:
+            assert (await session.execute(text("SELECT count(*) FROM items"))).scalar() == 0
+
+        await db.dispose()
+
+    @pytest.mark.asyncio
+    async def test_readwrite_session_commits(self):
+        """Test a readwrite session commits its writes."""
+        db = SQLiteMemDatabase(DatabaseConfig(driver="sqlite+aiosqlite", name=":memory:"))
+
+        async with db.session(readwrite=True) as session:
+            await session.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+            await session.execute(text("INSERT INTO items (id) VALUES (1)"))
+
+        async with db.session() as session:
+            assert (await session.execute(text("SELECT count(*) FROM items"))).scalar() == 1
+
+        await db.dispose()
+
+    @pytest.mark.asyncio
+    async def test_connections_get_sqlite_pragmas(self):
+        """Test in-memory connections are tuned like file-based ones."""
+        db = SQLiteMemDatabase(DatabaseConfig(driver="sqlite+aiosqlite", name=":memory:"))
+
+        async with db.session() as session:
+            assert (await session.execute(text("PRAGMA temp_store"))).scalar() == 2
+            # Tuning must not change behaviour: foreign keys stay unenforced
+            assert (await session.execute(text("PRAGMA foreign_keys"))).scalar() == 0
+
+        await db.dispose()